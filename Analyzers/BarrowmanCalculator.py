@@ -0,0 +1,277 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for calculating the center of pressure and stability using the Barrowman equations"""
+
+__title__ = "FreeCAD Rocket Barrowman Calculator"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import math
+import weakref
+import numpy as np
+
+from Rocket.Constants import FEATURE_NOSE_CONE, FEATURE_TRANSITION, FEATURE_FIN, FEATURE_FINCAN, \
+    FEATURE_POD, FEATURE_PARALLEL_STAGE
+from Rocket.Constants import FIN_TYPE_TRAPEZOID, FIN_TYPE_TRIANGLE, FIN_TYPE_ELLIPSE
+
+from Analyzers.MassCalculator import MassCalculator
+
+SLICES = 50 # Number of integration intervals for curved profiles. Must be even
+
+# The fin normal force is blended between the subsonic and supersonic solutions over the transonic region
+SUBSONIC_LIMIT = 0.9
+SUPERSONIC_LIMIT = 1.5
+
+# The fin center of pressure moves aft from the quarter chord over this Mach range
+CP_SUBSONIC_LIMIT = 0.5
+CP_SUPERSONIC_LIMIT = 2.0
+
+# Loss of effectiveness for fin sets of more than 4 fins due to fin-fin interference
+FIN_INTERFERENCE = {5 : 0.948, 6 : 0.913, 7 : 0.854, 8 : 0.81}
+FIN_INTERFERENCE_MANY = 0.75
+
+def _simpsonWeights(intervals, length):
+    weights = np.ones(intervals + 1)
+    weights[1:-1:2] = 4.0
+    weights[2:-1:2] = 2.0
+    return weights * (length / intervals) / 3.0
+
+def _machArray(mach):
+    return np.atleast_1d(np.asarray(mach, dtype=float))
+
+class BodyAero:
+    """
+        Normal force of an axisymmetric body such as a nose cone or transition. At small angles
+        of attack this is independent of the Mach number.
+    """
+
+    def __init__(self, cnaArea, cp):
+        self.cnaArea = cnaArea # Normal force coefficient slope multiplied by its reference area, mm^2/rad
+        self.cp = cp
+
+    def normalForce(self, mach, referenceArea):
+        """ Return the normal force coefficient slopes and centers of pressure for an array of Mach numbers """
+        return np.full(mach.shape, self.cnaArea / referenceArea), np.full(mach.shape, self.cp)
+
+class FinAero:
+    """
+        Normal force of a fin or fin set, described by its planform. Lengths are relative to the
+        root chord leading edge.
+    """
+
+    def __init__(self, span, area, mac, macLeadingEdge, midChordSweep, bodyRadius, rootLeadingEdge, finCount):
+        self.span = span
+        self.area = area
+        self.mac = mac
+        self.macLeadingEdge = macLeadingEdge
+        self.midChordSweep = midChordSweep
+        self.bodyRadius = bodyRadius
+        self.rootLeadingEdge = rootLeadingEdge
+        self.finCount = finCount
+
+    def _finFactor(self):
+        # Averaged over the roll angle, a set of N fins has N/2 times the normal force of a single fin
+        factor = self.finCount / 2.0
+        if self.finCount > 4:
+            factor *= FIN_INTERFERENCE.get(self.finCount, FIN_INTERFERENCE_MANY)
+        return factor
+
+    def normalForce(self, mach, referenceArea):
+        span2 = self.span * self.span
+        aspectRatio = 2.0 * span2 / self.area
+
+        # Subsonic, Barrowman with the Prandtl-Glauert compressibility correction
+        subsonic = np.minimum(mach, SUBSONIC_LIMIT)
+        beta = np.sqrt(1.0 - subsonic * subsonic)
+        term = beta * span2 / (self.area * math.cos(self.midChordSweep))
+        cnaSubsonic = 2.0 * math.pi * span2 / (1.0 + np.sqrt(1.0 + term * term))
+
+        # Supersonic, linear (Ackeret) theory
+        supersonic = np.maximum(mach, SUPERSONIC_LIMIT)
+        beta = np.sqrt(supersonic * supersonic - 1.0)
+        cnaSupersonic = 4.0 * self.area / beta
+
+        blend = np.clip((mach - SUBSONIC_LIMIT) / (SUPERSONIC_LIMIT - SUBSONIC_LIMIT), 0.0, 1.0)
+        cna = (1.0 - blend) * cnaSubsonic + blend * cnaSupersonic
+
+        # Fin-body interference
+        interference = 1.0 + self.bodyRadius / (self.span + self.bodyRadius)
+        cna = cna * interference * self._finFactor() / referenceArea
+
+        # The center of pressure moves from the quarter chord towards the mid chord of the mean
+        # aerodynamic chord as the speed increases
+        supersonic = np.maximum(mach, CP_SUPERSONIC_LIMIT)
+        product = aspectRatio * np.sqrt(supersonic * supersonic - 1.0)
+        chordFraction = np.clip((product - 0.67) / np.maximum(2.0 * product - 1.0, 1e-6), 0.25, 0.5)
+        blend = np.clip((mach - CP_SUBSONIC_LIMIT) / (CP_SUPERSONIC_LIMIT - CP_SUBSONIC_LIMIT), 0.0, 1.0)
+        chordFraction = (1.0 - blend) * 0.25 + blend * chordFraction
+        cp = self.rootLeadingEdge + self.macLeadingEdge + chordFraction * self.mac
+
+        return cna, cp
+
+class AerodynamicForces:
+    """
+        Normal force coefficient slope (per radian, using the configuration reference area) and
+        center of pressure (mm from the front of the rocket) for each of an array of Mach numbers
+    """
+
+    def __init__(self, mach, cna, cp):
+        self.mach = mach
+        self.cna = cna
+        self.cp = cp
+
+    def getStaticMargin(self, cg, referenceLength):
+        """ Static margin in calibers for a center of gravity cg, mm from the front of the rocket """
+        return (self.cp - cg) / referenceLength
+
+class BarrowmanCalculator:
+    """
+        Calculates the center of pressure and stability of a rocket using the extended Barrowman
+        equations. Results are vectorized over the Mach number, so a single call produces the
+        center of pressure as a function of Mach.
+
+        The normal force of each component is calculated in the coordinates of the component and
+        cached against the component aerodynamic modification ID, so only components that have
+        changed are recalculated. Components in pods and parallel stages contribute once for
+        each instance.
+
+        Body tubes produce no normal force at small angles of attack. Custom and tube fins are
+        not modelled.
+    """
+
+    def __init__(self, massCalculator=None):
+        self._cache = weakref.WeakKeyDictionary()
+        if massCalculator is None:
+            massCalculator = MassCalculator()
+        self._massCalculator = massCalculator
+
+    def clear(self):
+        self._cache.clear()
+
+    def calculate(self, configuration, mach=0.3):
+        """ Return the aerodynamic forces of the active stages for a Mach number or array of Mach numbers """
+        mach = _machArray(mach)
+        referenceArea = configuration.getReferenceArea()
+
+        cna = np.zeros(mach.shape)
+        moment = np.zeros(mach.shape)
+        for component in configuration.getActiveComponents():
+            aero = self.getComponentAero(component)
+            if aero is None:
+                continue
+
+            componentCna, componentCp = aero.normalForce(mach, referenceArea)
+            componentCna = componentCna * self._instanceCount(component)
+            cna += componentCna
+            moment += componentCna * (componentCp + float(component._obj.Placement.Base.x))
+
+        cp = np.divide(moment, cna, out=np.zeros(mach.shape), where=(cna != 0.0))
+        return AerodynamicForces(mach, cna, cp)
+
+    def getStaticMargin(self, configuration, mach=0.3, cg=None):
+        """
+            Return the static margin in calibers for a Mach number or array of Mach numbers. The
+            center of gravity is calculated when not specified.
+        """
+        if cg is None:
+            cg = self._massCalculator.calculate(configuration).cg.x
+        return self.calculate(configuration, mach).getStaticMargin(cg, configuration.getReferenceLength())
+
+    def getComponentAero(self, component):
+        """ Return the normal force model of the component in component coordinates, or None """
+        entry = self._cache.get(component)
+        if entry is not None and entry[0] == component.getComponentAerodynamicModID():
+            return entry[1]
+
+        aero = self._calculateComponent(component)
+
+        # Some handlers update properties as they are created, so get the ID once they're done
+        self._cache[component] = (component.getComponentAerodynamicModID(), aero)
+        return aero
+
+    def _instanceCount(self, component):
+        count = 1
+        parent = component.getParent()
+        while parent is not None:
+            if parent.Type == FEATURE_POD:
+                count *= max(int(parent._obj.PodCount), 1)
+            elif parent.Type == FEATURE_PARALLEL_STAGE:
+                count *= max(int(parent._obj.StageCount), 1)
+            parent = parent.getParent()
+        return count
+
+    def _calculateComponent(self, component):
+        type = component.Type
+        if type in [FEATURE_NOSE_CONE, FEATURE_TRANSITION]:
+            return self._bodyAero(component)
+        if type in [FEATURE_FIN, FEATURE_FINCAN]:
+            return self._finAero(component._obj)
+        return None
+
+    def _bodyAero(self, component):
+        handler = component.getShapeHandler()
+        length = float(component._obj.Length)
+        if handler is None or length <= 0.0:
+            return None
+
+        x = np.linspace(0.0, length, SLICES + 1)
+        area = math.pi * np.array([handler.getRadius(float(value)) for value in x]) ** 2
+        volume = float(np.dot(_simpsonWeights(SLICES, length), area))
+
+        deltaArea = area[-1] - area[0]
+        if math.fabs(deltaArea) < 1e-9:
+            return BodyAero(0.0, length / 2.0)
+        return BodyAero(2.0 * deltaArea, (length * area[-1] - volume) / deltaArea)
+
+    def _finAero(self, obj):
+        if obj.FinType not in [FIN_TYPE_TRAPEZOID, FIN_TYPE_TRIANGLE, FIN_TYPE_ELLIPSE]:
+            return None
+
+        span = float(obj.Height)
+        rootChord = float(obj.RootChord)
+        if span <= 0.0 or rootChord <= 0.0:
+            return None
+
+        h = np.linspace(0.0, span, SLICES + 1)
+        if obj.FinType == FIN_TYPE_ELLIPSE:
+            chord = rootChord * np.sqrt(np.maximum(1.0 - (h / span) ** 2, 0.0))
+            leadingEdge = (rootChord - chord) / 2.0
+        else:
+            tipChord = 0.0 if obj.FinType == FIN_TYPE_TRIANGLE else float(obj.TipChord)
+            chord = rootChord + (tipChord - rootChord) * h / span
+            leadingEdge = float(obj.SweepLength) * h / span
+
+        weights = _simpsonWeights(SLICES, span)
+        area = float(np.dot(weights, chord))
+        if area <= 0.0:
+            return None
+        mac = float(np.dot(weights, chord * chord)) / area
+        macLeadingEdge = float(np.dot(weights, leadingEdge * chord)) / area
+        midChordSweep = math.atan2(leadingEdge[-1] + chord[-1] / 2.0 - rootChord / 2.0, span)
+
+        bodyRadius = float(obj.ParentRadius)
+        rootLeadingEdge = 0.0
+        if obj.Proxy.Type == FEATURE_FINCAN:
+            bodyRadius += float(obj.Thickness)
+            rootLeadingEdge = float(obj.LeadingEdgeOffset)
+
+        finCount = int(obj.FinCount) if obj.FinSet else 1
+        return FinAero(span, area, mac, macLeadingEdge, midChordSweep, bodyRadius, rootLeadingEdge, finCount)
@@ -0,0 +1,779 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for calculating rocket mass, center of gravity, and moments of inertia"""
+
+__title__ = "FreeCAD Rocket Mass Calculator"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+import math
+import weakref
+
+from Rocket.Constants import FEATURE_NOSE_CONE, FEATURE_TRANSITION, FEATURE_BODY_TUBE, FEATURE_INNER_TUBE, \
+    FEATURE_TUBE_COUPLER, FEATURE_ENGINE_BLOCK, FEATURE_LAUNCH_LUG, FEATURE_BULKHEAD, FEATURE_CENTERING_RING, \
+    FEATURE_FIN, FEATURE_POD, FEATURE_PARALLEL_STAGE, FEATURE_RAIL_BUTTON, FEATURE_RAIL_GUIDE
+from Rocket.Constants import STYLE_SOLID, STYLE_SOLID_CORE, STYLE_CAPPED
+from Rocket.Constants import FIN_TYPE_TUBE, FIN_TYPE_SKETCH
+from Rocket.Constants import FIN_CROSS_SAME, FIN_CROSS_SQUARE, FIN_CROSS_ROUND, FIN_CROSS_ELLIPSE, \
+    FIN_CROSS_BICONVEX, FIN_CROSS_AIRFOIL, FIN_CROSS_WEDGE, FIN_CROSS_DIAMOND, FIN_CROSS_TAPER_LE, \
+    FIN_CROSS_TAPER_TE, FIN_CROSS_TAPER_LETE
+from Rocket.Constants import RAIL_BUTTON_AIRFOIL, RAIL_GUIDE_BASE_CONFORMAL, RAIL_GUIDE_BASE_V
+
+from Rocket.ShapeHandlers.RailButtonShapeHandler import RailButtonShapeHandler
+from Rocket.ShapeHandlers.RailGuideShapeHandler import RailGuideShapeHandler
+
+SLICES = 50 # Number of integration intervals for curved profiles. Must be even
+ARC_SEGMENTS = 90 # Number of line segments used for the arcs of airfoil rail buttons
+PROFILE_DEFLECTION = 0.01 # Maximum distance in mm between a curved sketch fin profile and its polygon
+
+# Ratio of the cross section area to the bounding chord * thickness rectangle
+SECTION_FILL = {
+    FIN_CROSS_SQUARE : 1.0,
+    FIN_CROSS_ELLIPSE : math.pi / 4.0,
+    FIN_CROSS_BICONVEX : 2.0 / 3.0,
+    FIN_CROSS_AIRFOIL : 0.685, # NACA 4 digit symmetric section
+    FIN_CROSS_WEDGE : 0.5,
+    FIN_CROSS_DIAMOND : 0.5
+}
+
+class RigidBody:
+    """
+        Mass properties of a body. Mass is in kg, the center of gravity in mm, and the moments
+        of inertia in kg*mm^2 about axes through the center of gravity parallel to the x (roll),
+        y and z axes.
+    """
+
+    def __init__(self, mass=0.0, cg=None, ixx=0.0, iyy=0.0, izz=0.0):
+        self.mass = mass
+        if cg is None:
+            cg = FreeCAD.Vector(0, 0, 0)
+        self.cg = cg
+        self.ixx = ixx
+        self.iyy = iyy
+        self.izz = izz
+
+    def __add__(self, other):
+        mass = self.mass + other.mass
+        if mass == 0.0:
+            return RigidBody()
+
+        cg = FreeCAD.Vector((self.cg.x * self.mass + other.cg.x * other.mass) / mass,
+                            (self.cg.y * self.mass + other.cg.y * other.mass) / mass,
+                            (self.cg.z * self.mass + other.cg.z * other.mass) / mass)
+
+        ixx = 0.0
+        iyy = 0.0
+        izz = 0.0
+        for body in [self, other]:
+            dx = body.cg.x - cg.x
+            dy = body.cg.y - cg.y
+            dz = body.cg.z - cg.z
+            ixx += body.ixx + body.mass * (dy * dy + dz * dz)
+            iyy += body.iyy + body.mass * (dx * dx + dz * dz)
+            izz += body.izz + body.mass * (dx * dx + dy * dy)
+
+        return RigidBody(mass, cg, ixx, iyy, izz)
+
+    def translated(self, offset):
+        return RigidBody(self.mass, self.cg + offset, self.ixx, self.iyy, self.izz)
+
+    def rotatedX(self, angle):
+        """ Rotate the body by angle degrees around the x axis """
+        theta = math.radians(angle)
+        c = math.cos(theta)
+        s = math.sin(theta)
+        cg = FreeCAD.Vector(self.cg.x, self.cg.y * c - self.cg.z * s, self.cg.y * s + self.cg.z * c)
+        iyy = self.iyy * c * c + self.izz * s * s
+        izz = self.iyy * s * s + self.izz * c * c
+        return RigidBody(self.mass, cg, self.ixx, iyy, izz)
+
+    def placed(self, placement):
+        """ Move the body from component coordinates to rocket coordinates """
+        body = self
+        rotation = placement.Rotation
+        if rotation.Angle != 0.0 and math.fabs(rotation.Axis.x) > 0.999:
+            body = body.rotatedX(math.copysign(math.degrees(rotation.Angle), rotation.Axis.x))
+            return body.translated(placement.Base)
+
+        return RigidBody(self.mass, placement.multVec(self.cg), self.ixx, self.iyy, self.izz)
+
+def _simpson(values, h):
+    return h / 3.0 * (values[0] + values[-1] + 4.0 * sum(values[1:-1:2]) + 2.0 * sum(values[2:-1:2]))
+
+def revolvedBody(outer, inner, start, end, density, slices=SLICES):
+    """
+        Mass properties of the solid of revolution about the x axis between the outer and
+        inner radius functions, from start to end
+    """
+    if end <= start or density <= 0.0:
+        return RigidBody()
+
+    h = (end - start) / slices
+    area = []
+    moment = []
+    polar = []
+    transverse = []
+    for i in range(slices + 1):
+        x = start + i * h
+        ro = outer(x)
+        ri = min(max(inner(x), 0.0), ro)
+        a = math.pi * (ro * ro - ri * ri)
+        j = math.pi * (math.pow(ro, 4) - math.pow(ri, 4)) / 2.0
+        area.append(a)
+        moment.append(a * x)
+        polar.append(j)
+        transverse.append(j / 2.0 + a * x * x)
+
+    mass = density * _simpson(area, h)
+    if mass <= 0.0:
+        return RigidBody()
+
+    cgx = density * _simpson(moment, h) / mass
+    ixx = density * _simpson(polar, h)
+    iyy = density * _simpson(transverse, h) - mass * cgx * cgx
+    return RigidBody(mass, FreeCAD.Vector(cgx, 0, 0), ixx, iyy, iyy)
+
+def cylinderBody(outerRadius, innerRadius, start, length, density):
+    # Simpson's rule is exact for the polynomials involved, so a single interval is sufficient
+    return revolvedBody(lambda x: outerRadius, lambda x: innerRadius, start, start + length, density, 2)
+
+def boxBody(origin, xLength, yLength, zLength, density):
+    mass = density * xLength * yLength * zLength
+    cg = FreeCAD.Vector(origin.x + xLength / 2.0, origin.y + yLength / 2.0, origin.z + zLength / 2.0)
+    return RigidBody(mass, cg,
+                     mass * (yLength * yLength + zLength * zLength) / 12.0,
+                     mass * (xLength * xLength + zLength * zLength) / 12.0,
+                     mass * (xLength * xLength + yLength * yLength) / 12.0)
+
+def polygonSection(points):
+    """
+        Area, centroid and second moments of area about the centroid of the closed polygon
+        through the (u, v) points, returned as (area, cu, cv, iuu, ivv)
+    """
+    area = 0.0
+    u = 0.0
+    v = 0.0
+    uu = 0.0
+    vv = 0.0
+    last = points[-1]
+    for point in points:
+        cross = last[0] * point[1] - point[0] * last[1]
+        area += cross
+        u += (last[0] + point[0]) * cross
+        v += (last[1] + point[1]) * cross
+        uu += (last[0] * last[0] + last[0] * point[0] + point[0] * point[0]) * cross
+        vv += (last[1] * last[1] + last[1] * point[1] + point[1] * point[1]) * cross
+        last = point
+
+    if area == 0.0:
+        return 0.0, 0.0, 0.0, 0.0, 0.0
+
+    # The moments divided by the signed area don't depend on the direction of the points
+    cu = u / (3.0 * area)
+    cv = v / (3.0 * area)
+    area = math.fabs(area) / 2.0
+    return area, cu, cv, math.fabs(uu) / 12.0 - area * cu * cu, math.fabs(vv) / 12.0 - area * cv * cv
+
+def prismBody(points, start, height, density):
+    """ The closed polygon through the (x, y) points extruded along the z axis from start """
+    area, cx, cy, ixx, iyy = polygonSection(points)
+    mass = density * area * height
+    return RigidBody(mass, FreeCAD.Vector(cx, cy, start + height / 2.0),
+                     density * iyy * height + mass * height * height / 12.0,
+                     density * ixx * height + mass * height * height / 12.0,
+                     density * (ixx + iyy) * height)
+
+def alongZ(body):
+    """ Turn a body with its axis along the x axis to have its axis along the z axis """
+    return RigidBody(body.mass, FreeCAD.Vector(-body.cg.z, body.cg.y, body.cg.x), body.izz, body.iyy, body.ixx)
+
+class MassCalculator:
+    """
+        Calculates the mass properties of a rocket from the component parameters rather than
+        from the generated solids. Component mass properties are calculated in the coordinates
+        of the component and cached against the component mass modification ID, so only
+        components that have changed are recalculated. Combining the components using their
+        current placements is cheap.
+
+        Fin cans have no analytic model and use the mass properties of their solid instead, so
+        their mass is only current once they have been recomputed. Custom fins are calculated
+        from their profile sketch, and are recalculated when the sketch changes.
+
+        Only the first instance of a pod or parallel stage is in the document. The others are
+        the same contents rotated around the axis of the parent component.
+    """
+
+    def __init__(self):
+        self._cache = weakref.WeakKeyDictionary()
+        self._densities = {}
+
+    def clear(self):
+        self._cache.clear()
+        self._densities.clear()
+
+    def calculate(self, configuration):
+        """ Return the mass properties of all the active stages in the configuration """
+        body = RigidBody()
+        for stage in configuration.getActiveStages():
+            body += self.calculateAssembly(stage)
+        return body
+
+    def calculateAssembly(self, assembly):
+        """ Return the mass properties of the components within the assembly, such as a stage or pod """
+        body = RigidBody()
+        for child in assembly.getChildren():
+            proxy = child.Proxy
+            if proxy.isMassive():
+                body += self.getComponentMass(proxy).placed(child.Placement)
+            body += self._instances(proxy, self.calculateAssembly(proxy))
+        return body
+
+    def _instances(self, component, body):
+        """ Return the mass properties of all the instances of the contents of a pod or parallel stage """
+        if component.Type == FEATURE_POD:
+            count = int(component._obj.PodCount)
+            spacing = float(component._obj.PodSpacing)
+        elif component.Type == FEATURE_PARALLEL_STAGE:
+            count = int(component._obj.StageCount)
+            spacing = float(component._obj.StageSpacing)
+        else:
+            return body
+        if count <= 1 or body.mass == 0.0:
+            return body
+
+        axis = FreeCAD.Vector(0, 0, 0)
+        parent = component.getParent()
+        if parent is not None and hasattr(parent._obj, "Placement"):
+            axis = FreeCAD.Vector(0, parent._obj.Placement.Base.y, parent._obj.Placement.Base.z)
+
+        centered = body.translated(-axis)
+        instances = RigidBody()
+        for i in range(count):
+            instances += centered.rotatedX(i * spacing).translated(axis)
+        return instances
+
+    def getComponentMass(self, component):
+        """ Return the mass properties of the component in component coordinates """
+        obj = component._obj
+        shapeHash = self._shapeHash(obj)
+
+        entry = self._cache.get(component)
+        if entry is not None and entry[0] == component.getComponentMassModID() and entry[1] == shapeHash:
+            return entry[2]
+
+        body = self._calculateComponent(component, self._density(obj))
+
+        # Some handlers update properties as they are created, so get the ID once they're done
+        self._cache[component] = (component.getComponentMassModID(), shapeHash, body)
+        return body
+
+    def _isAnalytic(self, obj):
+        return obj.Proxy.Type in [FEATURE_NOSE_CONE, FEATURE_TRANSITION, FEATURE_BODY_TUBE, FEATURE_INNER_TUBE,
+                                  FEATURE_TUBE_COUPLER, FEATURE_ENGINE_BLOCK, FEATURE_LAUNCH_LUG,
+                                  FEATURE_BULKHEAD, FEATURE_CENTERING_RING, FEATURE_FIN,
+                                  FEATURE_RAIL_BUTTON, FEATURE_RAIL_GUIDE]
+
+    def _shapeHash(self, obj):
+        """ Identifies the shape the mass properties depend on, if any """
+        if obj.Proxy.Type == FEATURE_FIN and obj.FinType == FIN_TYPE_SKETCH:
+            if obj.Profile is None:
+                return None
+            return obj.Profile.Shape.hashCode()
+        if self._isAnalytic(obj):
+            return None
+        return obj.Shape.hashCode()
+
+    def _density(self, obj):
+        """ Material density in kg/mm^3 """
+        material = getattr(obj, "ShapeMaterial", None)
+        if material is None:
+            return 0.0
+
+        if material.UUID not in self._densities:
+            density = 0.0
+            if material.hasPhysicalProperty("Density"):
+                value = material.getPhysicalValue("Density")
+                if value is not None:
+                    density = float(FreeCAD.Units.Quantity(value).getValueAs("kg/mm^3"))
+            self._densities[material.UUID] = density
+
+        return self._densities[material.UUID]
+
+    def _calculateComponent(self, component, density):
+        obj = component._obj
+        type = component.Type
+        if type == FEATURE_NOSE_CONE:
+            return self._noseMass(component, density)
+        if type == FEATURE_TRANSITION:
+            return self._transitionMass(component, density)
+        if type == FEATURE_BODY_TUBE:
+            return self._tubeMass(obj, density, bool(obj.Filled))
+        if type == FEATURE_INNER_TUBE:
+            return self._innerTubeMass(obj, density)
+        if type in [FEATURE_TUBE_COUPLER, FEATURE_ENGINE_BLOCK]:
+            return self._tubeMass(obj, density)
+        if type == FEATURE_LAUNCH_LUG:
+            return self._launchLugMass(obj, density)
+        if type == FEATURE_BULKHEAD:
+            return self._bulkheadMass(obj, density, 0.0)
+        if type == FEATURE_CENTERING_RING:
+            return self._bulkheadMass(obj, density, float(obj.CenterDiameter) / 2.0)
+        if type == FEATURE_FIN:
+            return self._finSetMass(obj, density)
+        if type == FEATURE_RAIL_BUTTON:
+            return self._railButtonMass(obj, density)
+        if type == FEATURE_RAIL_GUIDE:
+            return self._railGuideMass(obj, density)
+
+        # Deliberately left to the solid, as fin cans combine the fins, the can and its shoulders
+        return self._shapeMass(obj, density)
+
+    def _noseMass(self, component, density):
+        handler = component.getShapeHandler()
+        if handler is None:
+            return RigidBody()
+
+        volume, cg, ixx, iyy = handler.getVolumeProperties()
+        return RigidBody(density * volume, FreeCAD.Vector(cg, 0, 0), density * ixx, density * iyy, density * iyy)
+
+    def _transitionMass(self, component, density):
+        obj = component._obj
+        handler = component.getShapeHandler()
+        if handler is None:
+            return RigidBody()
+
+        length = float(obj.Length)
+        style = str(obj.TransitionStyle)
+        thickness = float(obj.Thickness)
+        coreRadius = float(obj.CoreDiameter) / 2.0
+
+        if style == STYLE_SOLID:
+            body = revolvedBody(handler.getRadius, lambda x: 0.0, 0.0, length, density)
+        elif style == STYLE_SOLID_CORE:
+            body = revolvedBody(handler.getRadius, lambda x: coreRadius, 0.0, length, density)
+        else:
+            inner = lambda x: handler.getRadius(x) - thickness
+            body = revolvedBody(handler.getRadius, inner, 0.0, length, density)
+
+        # Shoulders, with caps at the ends for capped transitions
+        shoulders = []
+        if obj.ForeShoulder:
+            shoulderLength = float(obj.ForeShoulderLength)
+            shoulders.append((-shoulderLength, shoulderLength, float(obj.ForeShoulderDiameter) / 2.0,
+                              float(obj.ForeShoulderThickness), -shoulderLength))
+        elif style == STYLE_CAPPED:
+            body += cylinderBody(handler.getRadius(0.0) - thickness, 0.0, 0.0, thickness, density)
+        if obj.AftShoulder:
+            shoulderLength = float(obj.AftShoulderLength)
+            shoulderThickness = float(obj.AftShoulderThickness)
+            shoulders.append((length, shoulderLength, float(obj.AftShoulderDiameter) / 2.0,
+                              shoulderThickness, length + shoulderLength - shoulderThickness))
+        elif style == STYLE_CAPPED:
+            body += cylinderBody(handler.getRadius(length) - thickness, 0.0, length - thickness, thickness, density)
+
+        for start, shoulderLength, shoulderRadius, shoulderThickness, capStart in shoulders:
+            if style == STYLE_SOLID:
+                body += cylinderBody(shoulderRadius, 0.0, start, shoulderLength, density)
+            elif style == STYLE_SOLID_CORE:
+                body += cylinderBody(shoulderRadius, coreRadius, start, shoulderLength, density)
+            else:
+                body += cylinderBody(shoulderRadius, shoulderRadius - shoulderThickness, start, shoulderLength, density)
+                if style == STYLE_CAPPED:
+                    body += cylinderBody(shoulderRadius - shoulderThickness, 0.0, capStart, shoulderThickness, density)
+
+        return body
+
+    def _tubeRadii(self, obj, filled=False):
+        outerDiameter = float(obj.Diameter)
+        if filled:
+            return outerDiameter / 2.0, 0.0
+        return outerDiameter / 2.0, outerDiameter / 2.0 - float(obj.Thickness)
+
+    def _tubeMass(self, obj, density, filled=False):
+        outerRadius, innerRadius = self._tubeRadii(obj, filled)
+        return cylinderBody(outerRadius, innerRadius, 0.0, float(obj.Length), density)
+
+    def _innerTubeMass(self, obj, density):
+        tube = self._tubeMass(obj, density)
+
+        configuration = obj.ClusterConfiguration
+        rotation = float(obj.ClusterRotation)
+        if rotation == 0:
+            points = configuration.getPoints()
+        else:
+            points = configuration.getPointsRotated(rotation)
+
+        scale = float(obj.Diameter) * float(obj.ClusterScale)
+        body = RigidBody()
+        for i in range(configuration.getClusterCount()):
+            body += tube.translated(FreeCAD.Vector(0, points[2 * i] * scale, points[2 * i + 1] * scale))
+        return body
+
+    def _launchLugMass(self, obj, density):
+        # Sweep cuts at the ends of the lug are ignored
+        lug = self._tubeMass(obj, density)
+        spacing = float(obj.Length) + float(obj.InstanceSeparation)
+        body = RigidBody()
+        for i in range(int(obj.InstanceCount)):
+            body += lug.translated(FreeCAD.Vector(i * spacing, 0, 0))
+        return body
+
+    def _bulkheadMass(self, obj, density, centerRadius):
+        radius = float(obj.Diameter) / 2.0
+        thickness = float(obj.Thickness)
+        body = cylinderBody(radius, centerRadius, 0.0, thickness, density)
+
+        if obj.Step:
+            stepThickness = float(obj.StepThickness)
+            start = thickness if obj.StepReverse else -thickness
+            body += cylinderBody(float(obj.StepDiameter) / 2.0, centerRadius, start, stepThickness, density)
+
+        if obj.Holes and int(obj.HoleCount) > 0:
+            # The holes are removed as a ring of material with the same mass distribution
+            holeRadius = float(obj.HoleDiameter) / 2.0
+            holeCenter = float(obj.HoleCenter)
+            mass = density * math.pi * holeRadius * holeRadius * thickness * int(obj.HoleCount)
+            ixx = mass * (holeRadius * holeRadius / 2.0 + holeCenter * holeCenter)
+            iyy = mass * (holeRadius * holeRadius / 4.0 + thickness * thickness / 12.0 + holeCenter * holeCenter / 2.0)
+            body += RigidBody(-mass, FreeCAD.Vector(thickness / 2.0, 0, 0), -ixx, -iyy, -iyy)
+
+        return body
+
+    def _sectionFill(self, obj, crossSection, chord, thickness):
+        if crossSection in SECTION_FILL:
+            return SECTION_FILL[crossSection]
+        if chord <= 0.0 or thickness <= 0.0:
+            return 1.0
+        if crossSection == FIN_CROSS_ROUND:
+            return 1.0 - (1.0 - math.pi / 4.0) * min(thickness / chord, 1.0)
+
+        # Tapered edges, using the taper lengths as a proportion of the root chord
+        rootChord = float(obj.RootChord)
+        if obj.RootPerCent:
+            ratio1 = float(obj.RootLength1) / 100.0
+            ratio2 = float(obj.RootLength2) / 100.0
+        elif rootChord > 0.0:
+            ratio1 = float(obj.RootLength1) / rootChord
+            ratio2 = float(obj.RootLength2) / rootChord
+        else:
+            return 1.0
+        if crossSection in [FIN_CROSS_TAPER_LE, FIN_CROSS_TAPER_TE]:
+            return 1.0 - ratio1 / 2.0
+        if crossSection == FIN_CROSS_TAPER_LETE:
+            return 1.0 - (ratio1 + ratio2) / 2.0
+        return 1.0
+
+    def _finMass(self, obj, density):
+        """ A single fin with its root on the x axis and the span along the z axis """
+        rootChord = float(obj.RootChord)
+        height = float(obj.Height)
+        if height <= 0.0 or rootChord <= 0.0:
+            return RigidBody()
+
+        rootThickness = float(obj.RootThickness)
+        tipThickness = rootThickness if obj.TipSameThickness else float(obj.TipThickness)
+        tipSection = obj.RootCrossSection if obj.TipCrossSection == FIN_CROSS_SAME else obj.TipCrossSection
+
+        if obj.FinType == FIN_TYPE_ELLIPSE:
+            chordAt = lambda h: rootChord * math.sqrt(max(1.0 - (h / height) ** 2, 0.0))
+            leadingEdgeAt = lambda h: (rootChord - chordAt(h)) / 2.0
+        else:
+            tipChord = 0.0 if obj.FinType == FIN_TYPE_TRIANGLE else float(obj.TipChord)
+            sweep = float(obj.SweepLength)
+            chordAt = lambda h: rootChord + (tipChord - rootChord) * h / height
+            leadingEdgeAt = lambda h: sweep * h / height
+
+        # Integrate the chord wise sections along the span
+        h = height / SLICES
+        area = []
+        xMoment = []
+        zMoment = []
+        xSquared = []
+        zSquared = []
+        for i in range(SLICES + 1):
+            z = i * h
+            ratio = z / height
+            chord = chordAt(z)
+            thickness = rootThickness + (tipThickness - rootThickness) * ratio
+            fill = self._sectionFill(obj, obj.RootCrossSection, chord, thickness) * (1.0 - ratio) + \
+                self._sectionFill(obj, tipSection, chord, thickness) * ratio
+            a = fill * chord * thickness
+            x = leadingEdgeAt(z) + chord / 2.0
+            area.append(a)
+            xMoment.append(a * x)
+            zMoment.append(a * z)
+            xSquared.append(a * (x * x + chord * chord / 12.0))
+            zSquared.append(a * z * z)
+
+        mass = density * _simpson(area, h)
+        if mass <= 0.0:
+            return RigidBody()
+
+        cgx = density * _simpson(xMoment, h) / mass
+        cgz = density * _simpson(zMoment, h) / mass
+        ix = density * _simpson(xSquared, h) - mass * cgx * cgx  # Spread along the chord
+        iz = density * _simpson(zSquared, h) - mass * cgz * cgz  # Spread along the span
+        body = RigidBody(mass, FreeCAD.Vector(cgx, 0, cgz), iz, ix + iz, ix)
+
+        if obj.Ttw:
+            body += self._ttwMass(obj, rootChord, density)
+
+        return body
+
+    def _ttwMass(self, obj, rootAft, density):
+        """ The fin tab, positioned from the aft end of the root chord """
+        origin = FreeCAD.Vector(rootAft - float(obj.TtwOffset) - float(obj.TtwLength),
+                                -0.5 * float(obj.TtwThickness), -float(obj.TtwHeight))
+        return boxBody(origin, float(obj.TtwLength), float(obj.TtwThickness), float(obj.TtwHeight), density)
+
+    def _profilePoints(self, wire):
+        """ The (x, z) points of a polygon following the profile wire """
+        points = []
+        for edge in wire.OrderedEdges:
+            edgePoints = edge.discretize(Deflection=PROFILE_DEFLECTION)
+            if edge.Orientation == "Reversed":
+                edgePoints.reverse()
+
+            # Each edge starts where the previous one ends
+            points.extend([(point.x, point.z) for point in edgePoints[:-1]])
+        return points
+
+    def _sketchFinMass(self, obj, density):
+        """
+            A single custom fin with its root on the x axis. The planform is the profile sketch and
+            the root cross section is used throughout the span
+        """
+        profile = obj.Profile
+        if profile is None or profile.Shape.isNull() or len(profile.Shape.Wires) < 1:
+            return RigidBody()
+
+        points = self._profilePoints(profile.Shape.Wires[0])
+        area, cgx, cgz, ix, iz = polygonSection(points)
+        if area <= 0.0:
+            return RigidBody()
+
+        thickness = float(obj.RootThickness)
+        scale = density * thickness * self._sectionFill(obj, obj.RootCrossSection, float(obj.RootChord), thickness)
+        mass = scale * area
+        spread = mass * thickness * thickness / 12.0 # Through the thickness
+        body = RigidBody(mass, FreeCAD.Vector(cgx, 0, cgz), scale * iz + spread, scale * (ix + iz), scale * ix + spread)
+
+        if obj.Ttw:
+            root = [x for x, z in points if math.fabs(z) <= 1e-6]
+            if len(root) > 0:
+                body += self._ttwMass(obj, max(root), density)
+
+        return body
+
+    def _finSetMass(self, obj, density):
+        parentRadius = float(obj.ParentRadius)
+        if obj.FinType == FIN_TYPE_TUBE:
+            outerRadius = float(obj.TubeOuterDiameter) / 2.0
+            fin = cylinderBody(outerRadius, outerRadius - float(obj.TubeThickness), 0.0, float(obj.RootChord), density)
+            fin = fin.translated(FreeCAD.Vector(0, 0, parentRadius + outerRadius))
+        elif obj.FinType == FIN_TYPE_SKETCH:
+            fin = self._sketchFinMass(obj, density).translated(FreeCAD.Vector(0, 0, parentRadius))
+        else:
+            # Fin cant is ignored
+            fin = self._finMass(obj, density).translated(FreeCAD.Vector(0, 0, parentRadius))
+
+        if not obj.FinSet:
+            return fin
+
+        body = RigidBody()
+        for i in range(int(obj.FinCount)):
+            body += fin.rotatedX(i * float(obj.FinSpacing))
+        return body
+
+    def _airfoilMass(self, radius, length, offset, start, height, density):
+        """ A layer of an airfoil rail button, drawn as in RailButtonShapeHandler """
+        if height <= 0.0:
+            return RigidBody()
+
+        tangent = math.atan2(length - radius, radius)
+        sweep = 2.0 * (math.pi - tangent)
+        points = []
+        for i in range(ARC_SEGMENTS + 1):
+            angle = tangent + sweep * i / ARC_SEGMENTS
+            points.append((offset + radius * math.cos(angle), radius * math.sin(angle)))
+        points.append((offset + length - radius, 0.0))
+        return prismBody(points, start, height, density)
+
+    def _railButtonMass(self, obj, density):
+        """ The spool along the z axis less the fastener hole. Fillets are ignored """
+        height = float(obj.Height)
+        baseHeight = float(obj.BaseHeight)
+        flangeStart = height - float(obj.FlangeHeight)
+        outerRadius = float(obj.Diameter) / 2.0
+        innerRadius = float(obj.InnerDiameter) / 2.0
+
+        # The fastener hole is the shank, widened by the countersink at the top
+        hole = lambda z: 0.0
+        steps = [0.0, baseHeight, flangeStart, height]
+        if obj.Fastener:
+            shankRadius = float(obj.ShankDiameter) / 2.0
+            headRadius = float(obj.HeadDiameter) / 2.0
+            countersink = RailButtonShapeHandler(obj).fastenerCountersinkHeight()
+            if countersink > 0.0 and headRadius > shankRadius:
+                apex = height - countersink
+                hole = lambda z: max(shankRadius, headRadius * (z - apex) / countersink)
+                steps.append(apex + countersink * shankRadius / headRadius)
+            else:
+                hole = lambda z: shankRadius
+        steps = sorted(set([z for z in steps if 0.0 <= z <= height]))
+        intervals = list(zip(steps[:-1], steps[1:]))
+
+        if obj.RailButtonType == RAIL_BUTTON_AIRFOIL:
+            length = float(obj.Length)
+            body = self._airfoilMass(outerRadius, length, 0.0, 0.0, baseHeight, density)
+            body += self._airfoilMass(innerRadius, length, innerRadius - outerRadius, baseHeight,
+                                      flangeStart - baseHeight, density)
+            body += self._airfoilMass(outerRadius, length, 0.0, flangeStart, height - flangeStart, density)
+
+            # The hole is assumed to lie within the spool
+            fastener = RigidBody()
+            for start, end in intervals:
+                fastener += revolvedBody(hole, lambda z: 0.0, start, end, density)
+            fastener = alongZ(fastener)
+            return body + RigidBody(-fastener.mass, fastener.cg, -fastener.ixx, -fastener.iyy, -fastener.izz)
+
+        # The spool radius steps between the intervals, so it's taken at the middle of each one
+        body = RigidBody()
+        for start, end in intervals:
+            middle = (start + end) / 2.0
+            radius = innerRadius if baseHeight < middle < flangeStart else outerRadius
+            body += revolvedBody(lambda z: radius, hole, start, end, density)
+        return alongZ(body)
+
+    def _railGuideMass(self, obj, density):
+        """
+            The guide is integrated across its width in columns parallel to the z axis. The
+            sweeps shorten the columns linearly with height, so the integrals along each column
+            are exact.
+        """
+        length = float(obj.Length)
+        height = float(obj.Height)
+        flangeStart = height - float(obj.FlangeHeight)
+        baseHeight = float(obj.BaseHeight)
+        flangeHalf = float(obj.FlangeWidth) / 2.0
+        middleHalf = float(obj.MiddleWidth) / 2.0
+        baseHalf = float(obj.BaseWidth) / 2.0
+
+        # The underside of the base, drawn as in RailGuideShapeHandler
+        offset = 0.0
+        if obj.RailGuideBaseType == RAIL_GUIDE_BASE_CONFORMAL:
+            radius = float(obj.Diameter) / 2.0
+            floor = lambda y: math.sqrt(max(radius * radius - y * y, 0.0)) - radius
+        elif obj.RailGuideBaseType == RAIL_GUIDE_BASE_V:
+            depth = baseHalf / math.fabs(math.tan(math.radians(float(obj.VAngle)) / 2.0))
+            floor = lambda y: -depth * y / baseHalf
+            if obj.Proxy.isRocketAssembly():
+                offset = RailGuideShapeHandler(obj).getZ0()
+        else:
+            floor = lambda y: 0.0
+        zMin = floor(baseHalf)
+
+        foreSlope = math.tan(math.radians(float(obj.ForwardSweepAngle))) if obj.ForwardSweep else 0.0
+        aftSlope = math.tan(math.radians(float(obj.AftSweepAngle))) if obj.AftSweep else 0.0
+        notchHalf = float(obj.NotchWidth) / 2.0 if obj.Notch else 0.0
+        notchStart = height - float(obj.NotchDepth)
+
+        def column(y, bottom, top):
+            """ Integrals of 1, x, z, x^2, y^2 and z^2 over the column at y from bottom to top """
+            values = [0.0] * 6
+            for z, weight in [(bottom, 1.0), ((bottom + top) / 2.0, 4.0), (top, 1.0)]:
+                fore = (z - zMin) * foreSlope
+                aft = max(length - (z - zMin) * aftSlope, fore)
+                chord = (aft - fore) * weight
+                values[0] += chord
+                values[1] += (aft * aft - fore * fore) / 2.0 * weight
+                values[2] += chord * z
+                values[3] += (aft * aft * aft - fore * fore * fore) / 3.0 * weight
+                values[4] += chord * y * y
+                values[5] += chord * z * z
+            return [value * (top - bottom) / 6.0 for value in values]
+
+        def section(y, within):
+            """ Integrals over the cross section at y, where within tests the half widths """
+            spans = []
+            if within(baseHalf):
+                spans.append([floor(y), floor(y) + baseHeight])
+            if within(middleHalf):
+                spans.append([0.0, height])
+            if within(flangeHalf):
+                spans.append([flangeStart, height])
+            spans.sort()
+
+            merged = []
+            for span in spans:
+                if merged and span[0] <= merged[-1][1]:
+                    merged[-1][1] = max(merged[-1][1], span[1])
+                else:
+                    merged.append(span)
+
+            values = [0.0] * 6
+            for bottom, top in merged:
+                values = [a + b for a, b in zip(values, column(y, bottom, top))]
+            if within(notchHalf):
+                values = [a - b for a, b in zip(values, column(y, notchStart, height))]
+            return values
+
+        # The widths change in steps, so each side is integrated between the steps. The guide is
+        # symmetric about the x-z plane
+        steps = sorted(set([0.0, notchHalf, middleHalf, flangeHalf, baseHalf]))
+        totals = [0.0] * 6
+        for start, end in zip(steps[:-1], steps[1:]):
+            middle = (start + end) / 2.0
+            within = lambda half: middle < half
+            h = (end - start) / SLICES
+            samples = [section(start + i * h, within) for i in range(SLICES + 1)]
+            for index in range(6):
+                totals[index] += 2.0 * density * _simpson([sample[index] for sample in samples], h)
+
+        mass, x, z, xx, yy, zz = totals
+        if mass <= 0.0:
+            return RigidBody()
+
+        cgx = x / mass
+        cgz = z / mass
+        return RigidBody(mass, FreeCAD.Vector(cgx, 0, cgz + offset),
+                         yy + zz - mass * cgz * cgz,
+                         xx + zz - mass * (cgx * cgx + cgz * cgz),
+                         xx + yy - mass * cgx * cgx)
+
+    def _shapeMass(self, obj, density):
+        """ Mass properties from the solid, for components without an analytic model """
+        body = RigidBody()
+        shape = obj.Shape
+        if shape.isNull():
+            return body
+
+        # The solid is in rocket coordinates, with its inertia in the rocket axes
+        toLocal = obj.Placement.inverse()
+        rotation = obj.Placement.Rotation.toMatrix()
+        toLocalAxes = rotation.transposed()
+        for solid in shape.Solids:
+            mass = density * solid.Volume
+            inertia = toLocalAxes.multiply(solid.MatrixOfInertia).multiply(rotation)
+            body += RigidBody(mass, toLocal.multVec(solid.CenterOfMass),
+                              density * inertia.A11, density * inertia.A22, density * inertia.A33)
+        return body
@@ -53,6 +53,8 @@ FEATURE_OFFSET = "RocketOffset"
 FEATURE_WIND_TUNNEL = "RocketWindTunnel"
 FEATURE_CFD_ROCKET = "RocketCFDRocket"
 
+FEATURE_FLIGHT_DATA = "RocketFlightData"
+
 # Part styles
 STYLE_SOLID = "solid"
 STYLE_SOLID_CORE = "solid core" # Used by transitions, not nose cones
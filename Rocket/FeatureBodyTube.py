@@ -271,10 +271,13 @@ class FeatureBodyTube(SymmetricComponent, BoxBounded, Coaxial):
     def usesNextCompAutomatic(self):
         return self.isOuterRadiusAutomatic() and (self._refComp == self.getNextSymmetricComponent())
 
+    def createShapeHandler(self, obj):
+        return BodyTubeShapeHandler(obj)
+
     def execute(self, obj):
-        shape = BodyTubeShapeHandler(obj)
+        shape = self.createShapeHandler(obj)
         if shape is not None:
-            shape.draw()
+            self.drawShape(obj, shape)
 
     def getSolidShape(self, obj):
         """ Return a filled version of the shape. Useful for CFD """
@@ -81,7 +81,10 @@ class FeatureBulkhead(RadiusRingComponent):
     def setLength(self, length):
         self._obj.Thickness = length
 
+    def createShapeHandler(self, obj):
+        return BulkheadShapeHandler(obj)
+
     def execute(self, obj):
-        shape = BulkheadShapeHandler(obj)
+        shape = self.createShapeHandler(obj)
         if shape is not None:
-            shape.draw()
+            self.drawShape(obj, shape)
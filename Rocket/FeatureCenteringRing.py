@@ -98,7 +98,10 @@ class FeatureCenteringRing(FeatureBulkhead):
 
         return super().getInnerDiameter()
 
+    def createShapeHandler(self, obj):
+        return CenteringRingShapeHandler(obj)
+
     def execute(self, obj):
-        shape = CenteringRingShapeHandler(obj)
+        shape = self.createShapeHandler(obj)
         if shape is not None:
-            shape.draw()
+            self.drawShape(obj, shape)
@@ -57,10 +57,13 @@ class FeatureEngineBlock(ThicknessRingComponent, AxialPositionable):
 
         self._obj = obj
 
+    def createShapeHandler(self, obj):
+        return BodyTubeShapeHandler(obj)
+
     def execute(self, obj):
-        shape = BodyTubeShapeHandler(obj)
+        shape = self.createShapeHandler(obj)
         if shape is not None:
-            shape.draw()
+            self.drawShape(obj, shape)
 
     def isAfter(self):
         return False
@@ -349,7 +349,8 @@ class FeatureFin(ExternalComponent):
         length = _toFloat(self._obj.Height) / math.tan(theta)
         self._obj.SweepLength = length
 
-    def execute(self, obj):
+    def createShapeHandler(self, obj):
+        shape = None
         if obj.FinType == FIN_TYPE_TRAPEZOID:
             if self.getTipChord() > 0.0:
                 shape = FinTrapezoidShapeHandler(obj)
@@ -363,9 +364,12 @@ class FeatureFin(ExternalComponent):
             shape = FinTubeShapeHandler(obj)
         elif obj.FinType == FIN_TYPE_SKETCH:
             shape = FinSketchShapeHandler(obj)
+        return shape
 
+    def execute(self, obj):
+        shape = self.createShapeHandler(obj)
         if shape is not None:
-            shape.draw()
+            self.drawShape(obj, shape)
 
     def eligibleChild(self, childType):
         return childType in [
@@ -270,7 +270,8 @@ class FeatureFinCan(SymmetricComponent, FeatureFin):
         if self._obj.FinCanStyle == FINCAN_STYLE_BODYTUBE:
             self._obj.Diameter = float(self._obj.Diameter) - (2.0 * float(self._obj.Thickness))
 
-    def execute(self, obj):
+    def createShapeHandler(self, obj):
+        shape = None
         if obj.FinType == FIN_TYPE_TRAPEZOID:
             if self.getTipChord() > 0:
                 shape = FinCanTrapezoidShapeHandler(obj)
@@ -282,9 +283,12 @@ class FeatureFinCan(SymmetricComponent, FeatureFin):
             shape = FinCanEllipseShapeHandler(obj)
         elif obj.FinType == FIN_TYPE_SKETCH:
             shape = FinCanSketchShapeHandler(obj)
+        return shape
 
+    def execute(self, obj):
+        shape = self.createShapeHandler(obj)
         if shape is not None:
-            shape.draw()
+            self.drawShape(obj, shape)
 
     def eligibleChild(self, childType):
         return childType in [
@@ -0,0 +1,121 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Document object holding the results of a simulation"""
+
+__title__ = "FreeCAD Rocket Flight Data Feature"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+import os
+
+from Rocket.Constants import FEATURE_FLIGHT_DATA
+from Rocket.FlightData import FlightData, loadValues
+
+from DraftTools import translate
+
+class FeatureFlightData:
+    """
+        The values are kept as a .npy file included in the document, and memory mapped when
+        used, so many simulations can be compared without reading them all into memory. The
+        names, events and summary are regular properties.
+    """
+
+    def __init__(self, obj):
+        self.Type = FEATURE_FLIGHT_DATA
+        self.version = '3.0'
+
+        self._obj = obj
+        self._flightData = None
+        obj.Proxy=self
+
+        if not hasattr(obj, 'Simulation'):
+            obj.addProperty('App::PropertyString', 'Simulation', 'FlightData', translate('App::Property', 'Name of the simulation')).Simulation = ""
+        if not hasattr(obj, 'Branch'):
+            obj.addProperty('App::PropertyString', 'Branch', 'FlightData', translate('App::Property', 'Simulation branch, such as the sustainer')).Branch = ""
+        if not hasattr(obj, 'Variables'):
+            obj.addProperty('App::PropertyStringList', 'Variables', 'FlightData', translate('App::Property', 'Names of the simulated variables'))
+        if not hasattr(obj, 'EventTimes'):
+            obj.addProperty('App::PropertyFloatList', 'EventTimes', 'FlightData', translate('App::Property', 'Time of each flight event'))
+        if not hasattr(obj, 'EventTypes'):
+            obj.addProperty('App::PropertyStringList', 'EventTypes', 'FlightData', translate('App::Property', 'Type of each flight event'))
+        if not hasattr(obj, 'Summary'):
+            obj.addProperty('App::PropertyMap', 'Summary', 'FlightData', translate('App::Property', 'Summary values calculated by the simulation'))
+        if not hasattr(obj, 'Data'):
+            obj.addProperty('App::PropertyFileIncluded', 'Data', 'FlightData', translate('App::Property', 'Simulated values with a column per variable')).Data = ""
+
+    def __getstate__(self):
+        return self.Type, self.version
+
+    def __setstate__(self, state):
+        if state:
+            self.Type = state[0]
+            self.version = state[1]
+
+    def onDocumentRestored(self, obj):
+        FeatureFlightData(obj)
+        self._obj = obj
+
+    def setFlightData(self, flightData):
+        obj = self._obj
+        obj.Simulation = flightData.getName()
+        obj.Branch = flightData.getBranch()
+        obj.Variables = flightData.getVariables()
+        events = flightData.getEvents()
+        obj.EventTimes = [event[0] for event in events]
+        obj.EventTypes = [event[1] for event in events]
+        obj.Summary = {key : repr(value) for key, value in flightData.getSummary().items()}
+
+        # Files in the transient directory are moved into the document rather than copied
+        path = os.path.join(obj.Document.TransientDir, obj.Name + ".npy")
+        flightData.save(path)
+        obj.Data = path
+        if os.path.exists(path) and not os.path.samefile(path, obj.Data):
+            os.remove(path)
+        self._flightData = None
+
+    def getFlightData(self):
+        """ Return the flight data, with the values memory mapped from the document """
+        obj = self._obj
+        if self._flightData is None or self._flightData[0] != obj.Data:
+            summary = {key : float(value) for key, value in obj.Summary.items()}
+            flightData = FlightData(obj.Simulation, obj.Branch, obj.Variables, loadValues(obj.Data),
+                                    zip(obj.EventTimes, obj.EventTypes), summary)
+            self._flightData = (obj.Data, flightData)
+        return self._flightData[1]
+
+def makeFlightData(flightData, name='FlightData'):
+    '''makeFlightData(flightData, name): stores flight data in the document'''
+    obj = FreeCAD.ActiveDocument.addObject("App::FeaturePython", name)
+    FeatureFlightData(obj)
+    obj.Proxy.setFlightData(flightData)
+    obj.Label = flightData.getName() or name
+    return obj.Proxy
+
+def getFlightData(doc=None):
+    """ Return the flight data of every simulation in the document """
+    if doc is None:
+        doc = FreeCAD.ActiveDocument
+    results = []
+    for obj in doc.Objects:
+        if getattr(getattr(obj, "Proxy", None), "Type", None) == FEATURE_FLIGHT_DATA:
+            results.append(obj.Proxy.getFlightData())
+    return results
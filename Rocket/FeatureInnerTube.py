@@ -75,10 +75,13 @@ class FeatureInnerTube(ThicknessRingComponent, Clusterable, AxialPositionable, B
 
         self._obj = obj
 
+    def createShapeHandler(self, obj):
+        return InnerTubeShapeHandler(obj)
+
     def execute(self, obj):
-        shape = InnerTubeShapeHandler(obj)
+        shape = self.createShapeHandler(obj)
         if shape is not None:
-            shape.draw()
+            self.drawShape(obj, shape)
 
     def getSolidShape(self, obj):
         """ Return a filled version of the shape. Useful for CFD """
@@ -93,10 +93,13 @@ class FeatureLaunchLug(Tube, AnglePositionable, BoxBounded, LineInstanceable):
         self._obj.Placement.Base.y = location[0]._y
         self._obj.Placement.Base.z = location[0]._z
 
+    def createShapeHandler(self, obj):
+        return LaunchLugShapeHandler(obj)
+
     def execute(self, obj):
-        shape = LaunchLugShapeHandler(obj)
+        shape = self.createShapeHandler(obj)
         if shape is not None:
-            shape.draw()
+            self.drawShape(obj, shape)
 
     def eligibleChild(self, childType):
         return False
@@ -158,6 +158,11 @@ class FeatureNoseCone(SymmetricComponent):
 
         return self._shapeHandler.getRadius(x)
 
+    def getShapeHandler(self):
+        # Return a shape handler that reflects the current parameters
+        self._setShapeHandler()
+        return self._shapeHandler
+
     def getForeRadius(self):
         return 0
 
@@ -330,7 +335,11 @@ class FeatureNoseCone(SymmetricComponent):
         return self.isAftRadiusAutomatic()
 
     def setLength(self, length):
+        if self._obj.Length == length:
+            return
+
         self._obj.Length = length
+        self.fireComponentChangeEvent(ComponentChangeEvent.BOTH_CHANGE)
 
     def isFilled(self):
         return False
@@ -369,40 +378,61 @@ class FeatureNoseCone(SymmetricComponent):
                 self.setEdited()
         return self._obj.Diameter / 2.0
 
+    def _fixedCoefficient(self, obj):
+        # Some shapes are special cases of another with a fixed coefficient
+        if obj.NoseType == TYPE_VON_KARMAN:
+            return 0.0
+        if obj.NoseType == TYPE_PARABOLA:
+            return 0.5
+        return None
+
     def _setShapeHandler(self):
         obj = self._obj
-        self._shapeHandler = None
+        coefficient = self._fixedCoefficient(obj)
+        if coefficient is not None:
+            obj.Coefficient = coefficient
+        self._shapeHandler = self.createShapeHandler(obj)
+
+    def createShapeHandler(self, obj):
+        """
+            Return the shape handler for the current parameters without changing the object.
+            Returns None when the coefficient will be set by the next recompute.
+        """
+        coefficient = self._fixedCoefficient(obj)
+        if coefficient is not None and float(obj.Coefficient) != coefficient:
+            return None
+
+        handler = None
         if obj.NoseType == TYPE_CONE:
-            self._shapeHandler = NoseConeShapeHandler(obj)
+            handler = NoseConeShapeHandler(obj)
         elif obj.NoseType == TYPE_BLUNTED_CONE:
-            self._shapeHandler = NoseBluntedConeShapeHandler(obj)
+            handler = NoseBluntedConeShapeHandler(obj)
         elif obj.NoseType == TYPE_SPHERICAL:
-            self._shapeHandler = NoseEllipseShapeHandler(obj)
+            handler = NoseEllipseShapeHandler(obj)
         elif obj.NoseType == TYPE_ELLIPTICAL:
-            self._shapeHandler = NoseEllipseShapeHandler(obj)
+            handler = NoseEllipseShapeHandler(obj)
         elif obj.NoseType == TYPE_OGIVE:
-            self._shapeHandler = NoseOgiveShapeHandler(obj)
+            handler = NoseOgiveShapeHandler(obj)
         elif obj.NoseType == TYPE_BLUNTED_OGIVE:
-            self._shapeHandler = NoseBluntedOgiveShapeHandler(obj)
+            handler = NoseBluntedOgiveShapeHandler(obj)
         elif obj.NoseType == TYPE_SECANT_OGIVE:
-            self._shapeHandler = NoseSecantOgiveShapeHandler(obj)
+            handler = NoseSecantOgiveShapeHandler(obj)
         elif obj.NoseType == TYPE_VON_KARMAN:
-            obj.Coefficient = 0.0
-            self._shapeHandler = NoseHaackShapeHandler(obj)
+            handler = NoseHaackShapeHandler(obj)
         elif obj.NoseType == TYPE_HAACK:
-            self._shapeHandler = NoseHaackShapeHandler(obj)
+            handler = NoseHaackShapeHandler(obj)
         elif obj.NoseType == TYPE_PARABOLIC:
-            self._shapeHandler = NoseParabolicShapeHandler(obj)
+            handler = NoseParabolicShapeHandler(obj)
         elif obj.NoseType == TYPE_PARABOLA:
-            obj.Coefficient = 0.5
-            self._shapeHandler = NosePowerShapeHandler(obj)
+            handler = NosePowerShapeHandler(obj)
         elif obj.NoseType == TYPE_POWER:
-            self._shapeHandler = NosePowerShapeHandler(obj)
+            handler = NosePowerShapeHandler(obj)
+        return handler
 
     def execute(self, obj):
         self._setShapeHandler()
         if self._shapeHandler is not None:
-            self._shapeHandler.draw()
+            self.drawShape(obj, self._shapeHandler)
 
     def getSolidShape(self, obj):
         """ Return a filled version of the shape. Useful for CFD """
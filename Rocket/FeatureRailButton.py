@@ -160,10 +160,13 @@ class FeatureRailButton(ExternalComponent, AnglePositionable, BoxBounded, LineIn
         self._obj.Placement.Base.y = location[0]._y
         self._obj.Placement.Base.z = location[0]._z
 
+    def createShapeHandler(self, obj):
+        return RailButtonShapeHandler(obj)
+
     def execute(self, obj):
-        shape = RailButtonShapeHandler(obj)
+        shape = self.createShapeHandler(obj)
         if shape is not None:
-            shape.draw()
+            self.drawShape(obj, shape)
 
     def getLength(self):
         # Return the length of this component along the central axis
@@ -156,7 +156,7 @@ class FeatureRailGuide(ExternalComponent, AnglePositionable, BoxBounded, LineIns
     def execute(self, obj):
         shape = RailGuideShapeHandler(obj)
         if shape is not None:
-            shape.draw()
+            self.drawShape(obj, shape)
 
     def getLength(self):
         # Return the length of this component along the central axis
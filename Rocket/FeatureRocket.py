@@ -26,6 +26,8 @@ __url__ = "https://www.davesrocketshop.com"
 
 import FreeCAD
 
+from contextlib import contextmanager
+
 from Rocket.interfaces.ComponentChangeListener import ComponentChangeListener
 from Rocket.interfaces.StateChangeListener import StateChangeListener
 
@@ -38,6 +40,7 @@ from Rocket.util.UniqueID import UniqueID
 from Rocket.util import ReferenceType
 
 from Rocket.events.ComponentChangeEvent import ComponentChangeEvent
+from Rocket.ShapeHandlers.ShapeBuilder import recomputeDocument
 
 from Rocket.Constants import FEATURE_ROCKET, FEATURE_STAGE
 
@@ -49,10 +52,10 @@ class FeatureRocket(ComponentAssembly, ComponentChangeListener):
     _listenerList = []
 
     """
-    When freezeList != null, events are not dispatched but stored in the list.
+    When freezeDepth > 0, events are not dispatched but merged into a pending event.
     When the structure is thawed, a single combined event will be fired.
     """
-    _freezeList = None
+    _freezeDepth = 0
 
     _refType = ReferenceType.MAXIMUM
 
@@ -64,6 +67,16 @@ class FeatureRocket(ComponentAssembly, ComponentChangeListener):
 
     _eventsEnabled = False
 
+    """
+    Change events are coalesced while an edit is in progress. The pending event holds
+    the merged event types, and the dirty list holds the root of every subtree that
+    needs to be repositioned once the edit completes.
+    """
+    _editDepth = 0
+    _pendingEvent = None
+    _dirtyList = None
+    _positioning = False
+
     _designer = ""
     _stageMap = {}
 
@@ -85,6 +98,11 @@ class FeatureRocket(ComponentAssembly, ComponentChangeListener):
 
         self._listenerList = []
         self._stageMap = {}
+        self._freezeDepth = 0
+        self._editDepth = 0
+        self._pendingEvent = None
+        self._dirtyList = []
+        self._positioning = False
         self.addComponentChangeListener(self)
         # self._eventsEnabled = True
 
@@ -98,7 +116,7 @@ class FeatureRocket(ComponentAssembly, ComponentChangeListener):
         self.initialize()
         self.setChildParent()
         self.enableEvents(True)
-        FreeCAD.activeDocument().recompute(None,True,True)
+        recomputeDocument(FreeCAD.activeDocument(), force=True)
 
     """
         Enable the monitoring, relay and production of events in this rocket instance.
@@ -107,6 +125,9 @@ class FeatureRocket(ComponentAssembly, ComponentChangeListener):
         self._enableEvents(enable)
         self.updateChildren()
 
+    def isEventsEnabled(self):
+        return self._eventsEnabled
+
     def _enableEvents(self, enable):
         if self._eventsEnabled and enable:
             return
@@ -179,7 +200,7 @@ class FeatureRocket(ComponentAssembly, ComponentChangeListener):
         {@link #getModID()} for details.
     """
     def getTreeModID(self):
-        return self.treeModID
+        return self._treeModID
 
     """
         Return the non-negative functional modificationID of this rocket.
@@ -194,8 +215,8 @@ class FeatureRocket(ComponentAssembly, ComponentChangeListener):
     def getStageList(self):
         return self._stageMap.values()
 
-    def getStage(self, index):
-        return self._stageMap.values()[index]
+    def getStage(self, stageNumber):
+        return self._stageMap.get(stageNumber)
 
     # Get the topmost stage, only taking into account active stages from the flight configuration.
     def getTopmostStage(self, config):
@@ -315,21 +336,203 @@ class FeatureRocket(ComponentAssembly, ComponentChangeListener):
     def fireComponentChangeEvent(self, cce):
         if not self._eventsEnabled:
             return
-        
-        # Check whether frozen
-        if self._freezeList is not None:
-            # log.debug("Rocket is in frozen state, adding event " + cce + " info freeze list");
-            self._freezeList.append(cce)
+
+        if not isinstance(cce, ComponentChangeEvent):
+            cce = ComponentChangeEvent(self, cce)
+
+        self._updateModIDs(cce)
+
+        if self._positioning:
+            # Events generated while repositioning are a consequence of the current
+            # edit. Merge them into the notification, but don't reposition again
+            self._mergePending(cce)
             return
 
-    
-        # Notify all components first
-        self.componentChanged(cce)
-        for item in self.getChildren():
-            item.Proxy.componentChanged(cce)
-        self.updateConfigurations()
+        self._mergePending(cce)
+        self._markDirty(cce)
+
+        # Coalesce events until the outermost edit completes, or the rocket is thawed
+        if self._editDepth > 0:
+            return
 
-        self.notifyAllListeners(cce)
+        self._flushEvents()
+
+    def _updateModIDs(self, cce):
+        self._modID = UniqueID.next()
+        if cce.isMassChange():
+            self._massModID = self._modID
+        if cce.isAerodynamicChange():
+            self._aeroModID = self._modID
+        if cce.isTreeChange():
+            self._treeModID = self._modID
+        if cce.isFunctionalChange():
+            self._functionalModID = self._modID
+
+    def _mergePending(self, cce):
+        if self._pendingEvent is None:
+            self._pendingEvent = ComponentChangeEvent(cce.getSource(), cce.getType())
+        else:
+            self._pendingEvent.merge(cce)
+
+    """
+        Start an edit. Events fired before the matching endEdit() are merged and
+        the rocket is repositioned once when the outermost edit ends.
+    """
+    def beginEdit(self):
+        self._editDepth += 1
+
+    def endEdit(self):
+        if self._editDepth <= 0:
+            raise Exception("Attempting to end an edit that was never started")
+
+        self._editDepth -= 1
+        if self._editDepth == 0:
+            self._flushEvents()
+
+    def isEditing(self):
+        return self._editDepth > 0
+
+    def _markDirty(self, cce):
+        source = cce.getSource()
+        if cce.isTreeChange() or cce.isUndoChange():
+            # Structural changes invalidate the whole rocket
+            self._dirtyList = [self]
+            return
+
+        if not cce.isPositionChange():
+            # Changes such as names, presets and axial methods only affect the component itself
+            if cce.isNonFunctionalChange() and source is not None and source is not self:
+                self._addDirty(source)
+            return
+
+        if source is None or source is self:
+            self._dirtyList = [self]
+            return
+
+        self._addDirty(source)
+
+        # Automatic diameters are taken from the neighbouring symmetric components
+        if hasattr(source, "getPreviousSymmetricComponent"):
+            previous = source.getPreviousSymmetricComponent()
+            if previous is not None:
+                self._addDirty(previous)
+
+        # Components positioned after this one may have moved. Walk up the tree while
+        # the parent length depends on the changed child
+        current = source
+        parent = current.getParent()
+        while parent is not None and parent is not self:
+            self._addFollowingSiblings(parent, current)
+            if not (isinstance(parent, ComponentAssembly) and parent.isAfter()):
+                return
+            current = parent
+            parent = current.getParent()
+
+        if parent is self:
+            self._addFollowingSiblings(self, current)
+
+    def _addFollowingSiblings(self, parent, child):
+        found = False
+        for sibling in parent.getChildren():
+            if not hasattr(sibling, "Proxy"):
+                # Sketches for custom fins won't have a proxy
+                continue
+            if found:
+                self._addDirty(sibling.Proxy)
+            elif sibling.Proxy is child:
+                found = True
+
+    def _isDirty(self, component):
+        # A component is dirty if it, or any of its ancestors, is already marked
+        current = component
+        while current is not None:
+            for dirty in self._dirtyList:
+                if dirty is current:
+                    return True
+            current = current.getParent()
+        return False
+
+    def _addDirty(self, component):
+        if self._isDirty(component):
+            return
+
+        # Remove any descendants, they will be repositioned with this component
+        self._dirtyList = [dirty for dirty in self._dirtyList if not self._isAncestor(component, dirty)]
+        self._dirtyList.append(component)
+
+    def _isAncestor(self, ancestor, component):
+        current = component.getParent()
+        while current is not None:
+            if current is ancestor:
+                return True
+            current = current.getParent()
+        return False
+
+    def _flushEvents(self):
+        self._editDepth += 1
+        try:
+            while self._pendingEvent is not None:
+                event = self._pendingEvent
+                dirty = self._dirtyList
+                self._pendingEvent = None
+                self._dirtyList = []
+
+                self._updatePositions(event, dirty)
+                self.updateConfigurations()
+
+                # Listeners may fire further events, which are handled on the next pass
+                self.notifyAllListeners(event)
+        finally:
+            self._editDepth -= 1
+
+    def _updatePositions(self, event, dirty):
+        """ Make a single positioning pass over the dirty parts of the tree, in tree order """
+        if len(dirty) == 0:
+            return
+
+        self._positioning = True
+        try:
+            if dirty[0] is self:
+                self.updateChildren()
+                return
+
+            # Ancestors of dirty components need their bounds refreshed
+            path = []
+            for component in dirty:
+                parent = component.getParent()
+                while parent is not None and parent is not self:
+                    if not self._contains(path, parent):
+                        path.append(parent)
+                    parent = parent.getParent()
+
+            self._updateSubtree(self, event, dirty, path)
+            self.updateBounds()
+        finally:
+            self._positioning = False
+
+    def _updateSubtree(self, component, event, dirty, path):
+        for child in component.getChildren():
+            if not hasattr(child, "Proxy"):
+                # Sketches for custom fins won't have a proxy
+                continue
+
+            proxy = child.Proxy
+            if self._contains(dirty, proxy):
+                proxy.componentChanged(event)
+            elif self._contains(path, proxy):
+                self._updateSubtree(proxy, event, dirty, path)
+                proxy.updateBounds()
+
+    def _contains(self, haystack, needle):
+        # Identity comparison, proxies don't define equality
+        for item in haystack:
+            if item is needle:
+                return True
+        return False
+
+    def componentChanged(self, event):
+        # The rocket repositions the dirty components itself when the event is fired
+        pass
 
     def update(self):
         self.updateStageNumbers()
@@ -365,23 +568,21 @@ class FeatureRocket(ComponentAssembly, ComponentChangeListener):
 
     """ Freezes the rocket structure from firing any events.  This may be performed to
         combine several actions on the structure into a single large action.
-        <code>thaw()</code> must always be called afterwards.
-        
-        NOTE:  Always use a try/finally to ensure <code>thaw()</code> is called:
+        <code>thaw()</code> must always be called afterwards.  Freezes may be nested,
+        the events are fired when the outermost freeze is thawed.
+
+        NOTE:  Prefer the batch() context manager, or always use a try/finally to
+        ensure <code>thaw()</code> is called:
         <pre>
-            Rocket r = c.getRocket();
-            try {
-                r.freeze();
-                // do stuff
-            } finally {
-                r.thaw();
-            }
+            rocket.freeze()
+            try:
+                # do stuff
+            finally:
+                rocket.thaw()
         </pre>"""
     def freeze(self):
-        if self._freezeList is None:
-            self._freezeList = []
-        else:
-            raise Exception("Attempting to freeze Rocket when it is already frozen, freezeList=" + self._freezeList)
+        self._freezeDepth += 1
+        self.beginEdit()
 
     """ 
         Thaws a frozen rocket structure and fires a combination of the events fired during
@@ -389,20 +590,50 @@ class FeatureRocket(ComponentAssembly, ComponentChangeListener):
         last component to have been an event source.
     """
     def thaw(self):
-        if self._freezeList is None:
+        if self._freezeDepth <= 0:
             raise Exception("Attempting to thaw Rocket when it is not frozen")
-            return
 
-        if len(self._freezeList) == 0:
-            # log.warn("Thawing rocket with no changes made");
-            self._freezeList = None
-            return
+        self._freezeDepth -= 1
+        self.endEdit()
 
-        type = 0
-        c = None
-        for e in self._freezeList:
-            type = type | e.getType()
-            c = e.getSource()
-        self._freezeList = None
-    
-        self.fireComponentChangeEvent(ComponentChangeEvent(c, type))
+    def isFrozen(self):
+        return self._freezeDepth > 0
+
+    """
+        Start a batch edit.  Events are enabled if required, and all change events are
+        deferred until the matching endBatch().  This is primarily for cases where the
+        start and end of the batch are in different methods, such as the importers.
+        Otherwise use the batch() context manager.
+    """
+    def beginBatch(self):
+        self.freeze()
+        self._enableEvents(True)
+
+    """
+        End a batch edit.  When the outermost batch ends a single merged event is fired,
+        the rocket is repositioned once and the document is recomputed once, with the
+        component shapes built in parallel.
+    """
+    def endBatch(self, recompute=True):
+        self.thaw()
+        if recompute and not self.isEditing():
+            recomputeDocument(self._obj.Document)
+
+    """
+        Context manager for bulk operations on the rocket. If the operations raise an
+        exception the events are still fired, but the document isn't recomputed:
+        <pre>
+            with rocket.batch():
+                # do stuff
+        </pre>
+    """
+    @contextmanager
+    def batch(self, recompute=True):
+        self.beginBatch()
+        try:
+            yield self
+        except BaseException:
+            # Don't rebuild the document from a partly applied edit
+            self.endBatch(recompute=False)
+            raise
+        self.endBatch(recompute)
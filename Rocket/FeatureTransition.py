@@ -47,6 +47,7 @@ class FeatureTransition(SymmetricComponent):
     def __init__(self, obj):
         super().__init__(obj)
         self.Type = FEATURE_TRANSITION
+        self._shapeHandler = None
 
         if not hasattr(obj, 'ForeDiameter'):
             obj.addProperty('App::PropertyLength', 'ForeDiameter', 'RocketComponent', translate('App::Property', 'Diameter at the front of the transition')).ForeDiameter = 20.0
@@ -376,28 +377,60 @@ class FeatureTransition(SymmetricComponent):
         Return the radius at point x of the transition.
     """
     def getRadius(self, x):
-        return 0.0
-
-    def execute(self, obj):
-        shape = None
+        if self._shapeHandler is None:
+            self._setShapeHandler()
+
+        return self._shapeHandler.getRadius(x)
+
+    def getShapeHandler(self):
+        # Return a shape handler that reflects the current parameters
+        self._setShapeHandler()
+        return self._shapeHandler
+
+    def _fixedCoefficient(self, obj):
+        # Some shapes are special cases of another with a fixed coefficient
+        if obj.TransitionType == TYPE_VON_KARMAN:
+            return 0.0
+        if obj.TransitionType == TYPE_PARABOLA:
+            return 0.5
+        return None
+
+    def _setShapeHandler(self):
+        obj = self._obj
+        coefficient = self._fixedCoefficient(obj)
+        if coefficient is not None:
+            obj.Coefficient = coefficient
+        self._shapeHandler = self.createShapeHandler(obj)
+
+    def createShapeHandler(self, obj):
+        """
+            Return the shape handler for the current parameters without changing the object.
+            Returns None when the coefficient will be set by the next recompute.
+        """
+        coefficient = self._fixedCoefficient(obj)
+        if coefficient is not None and float(obj.Coefficient) != coefficient:
+            return None
+
+        handler = None
         if obj.TransitionType == TYPE_CONE:
-            shape = TransitionConeShapeHandler(obj)
+            handler = TransitionConeShapeHandler(obj)
         elif obj.TransitionType == TYPE_ELLIPTICAL:
-            shape = TransitionEllipseShapeHandler(obj)
+            handler = TransitionEllipseShapeHandler(obj)
         elif obj.TransitionType == TYPE_OGIVE:
-            shape = TransitionOgiveShapeHandler(obj)
+            handler = TransitionOgiveShapeHandler(obj)
         elif obj.TransitionType == TYPE_VON_KARMAN:
-            obj.Coefficient = 0.0
-            shape = TransitionHaackShapeHandler(obj)
+            handler = TransitionHaackShapeHandler(obj)
         elif obj.TransitionType == TYPE_HAACK:
-            shape = TransitionHaackShapeHandler(obj)
+            handler = TransitionHaackShapeHandler(obj)
         elif obj.TransitionType == TYPE_PARABOLIC:
-            shape = TransitionParabolicShapeHandler(obj)
+            handler = TransitionParabolicShapeHandler(obj)
         elif obj.TransitionType == TYPE_PARABOLA:
-            obj.Coefficient = 0.5
-            shape = TransitionPowerShapeHandler(obj)
+            handler = TransitionPowerShapeHandler(obj)
         elif obj.TransitionType == TYPE_POWER:
-            shape = TransitionPowerShapeHandler(obj)
+            handler = TransitionPowerShapeHandler(obj)
+        return handler
 
-        if shape is not None:
-            shape.draw()
+    def execute(self, obj):
+        self._setShapeHandler()
+        if self._shapeHandler is not None:
+            self.drawShape(obj, self._shapeHandler)
@@ -51,25 +51,37 @@ class FlightConfiguration():
     def __init__(self, rocket, fcid=None):
         if fcid is None:
             fcid = FlightConfigurationId()
-        else:
-            self._fcid = fcid
+        self._fcid = fcid
         self._rocket = rocket
+        self._stages = {} # Stage number to active flag. Stages not listed are active
+
+        self._refLengthModID = -1
+        self._cachedRefLength = 0.0
 
         self._configurationName = self.DEFAULT_CONFIG_NAME
         self._configurationInstanceId = self._configurationInstanceCount
         self._configurationInstanceCount += 1
 
+    def getRocket(self):
+        return self._rocket
+
+    def getFlightConfigurationID(self):
+        return self._fcid
+
     # Check whether the stage specified by the index is active.
     def isStageActive(self, stageNumber):
         if stageNumber < 0:
             return True
 
         stage = self._rocket.getStage(stageNumber)
-        return stage is not None and stage.getChildCount() > 0
+        return stage is not None and stage.getChildCount() > 0 and self._stages.get(stageNumber, True)
+
+    def setStageActive(self, stageNumber, active):
+        self._stages[stageNumber] = active
 
     def getAllComponents(self):
         traversalOrder = []
-        traversalOrder = self.recurseAllComponentsDepthFirst(self.rocket, traversalOrder)
+        traversalOrder = self.recurseAllComponentsDepthFirst(self._rocket, traversalOrder)
         return traversalOrder
 
     def recurseAllComponentsDepthFirst(self, comp, traversalOrder):
@@ -84,21 +96,21 @@ class FlightConfiguration():
     # NOTE: components, NOT instances
     def getCoreComponents(self):
         toProcess = []
-        toProcess.append(self.rocket)
+        toProcess.append(self._rocket)
         
         toReturn = []
         
         while len(toProcess) > 0:
             comp = toProcess.pop(0)
             
-            if comp.type != FEATURE_ROCKET:
+            if comp.Type != FEATURE_ROCKET:
                 toReturn.append(comp)
             
             for child in comp.getChildren():
                 if child.Proxy.Type == FEATURE_STAGE:
                     # recurse through Stage -- these are still centerline.
                     # however -- insist on an exact type match to disallow off-core stages
-                    if self.isStageActive(child.getStageNumber()):
+                    if self.isStageActive(child.Proxy.getStageNumber()):
                         toProcess.append(child.Proxy)
                 elif isinstance(child.Proxy, ComponentAssembly):
                     # i.e. ParallelStage or PodSet
@@ -108,32 +120,44 @@ class FlightConfiguration():
         
         return toReturn
 
+    # Return the components of all active stages, including pods and parallel stages
+    def getActiveComponents(self):
+        components = []
+        for stage in self.getActiveStages():
+            self._addStageComponents(stage, components)
+        return components
+
+    def _addStageComponents(self, comp, components):
+        for child in comp.getChildren():
+            components.append(child.Proxy)
+            self._addStageComponents(child.Proxy, components)
+
     # Return all the stages in this configuration.
     def getAllStages(self):
+        return list(self._rocket.getStageList())
+
+    def getActiveStages(self):
         stages = []
-        for flags in self._stages.values():
-            stages.append(self._rocket.getStage(flags.stageId))
+        for stage in self.getAllStages():
+            if self.isStageActive(stage.getStageNumber()):
+                stages.append(stage)
 
         return stages
 
-    def getActiveStages(self):
-        # For now, all stages are active
-        return self.getAllStages()
-
     def getActiveStageCount(self):
         return len(self.getActiveStages())
 
     def getStageCount(self):
-        return len(self._stages)
+        return self._rocket.getStageCount()
 
     # Return the reference length associated with the current configuration.  The 
     # reference length type is retrieved from the <code>Rocket</code>.
     def getReferenceLength(self):
-        if self._rocket.getModID() != refLengthModID:
-            refLengthModID = self._rocket.getModID()
-            cachedRefLength = self._rocket.getReferenceType().getReferenceLength(self)
+        if self._rocket.getModID() != self._refLengthModID:
+            self._refLengthModID = self._rocket.getModID()
+            self._cachedRefLength = self._rocket.getReferenceType().getReferenceLength(self)
 
-        return cachedRefLength
+        return self._cachedRefLength
 
     def getReferenceArea(self):
         return math.pi * math.pow(self.getReferenceLength() / 2, 2)
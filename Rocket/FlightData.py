@@ -0,0 +1,147 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Columnar storage of simulated flight data"""
+
+__title__ = "FreeCAD Rocket Flight Data"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import numpy as np
+
+# Variable names as used by OpenRocket. Values are in SI units
+TIME = "Time"
+ALTITUDE = "Altitude"
+VERTICAL_VELOCITY = "Vertical velocity"
+TOTAL_VELOCITY = "Total velocity"
+
+# Summary values
+SUMMARY_MAX_ALTITUDE = "maxaltitude"
+SUMMARY_MAX_VELOCITY = "maxvelocity"
+
+class FlightData:
+    """
+        The results of one branch of a simulation, such as the sustainer, as a two dimensional
+        array with a row per time step and a column per variable. The array is kept in column
+        major order, so each variable is contiguous, and may be memory mapped from a file so
+        that only the columns used are read.
+
+        Events are (time, type) tuples, and the summary is a dictionary of values calculated
+        by the simulator, such as the maximum altitude.
+    """
+
+    def __init__(self, name, branch, variables, values, events=None, summary=None):
+        self._name = name
+        self._branch = branch
+        self._variables = list(variables)
+        self._values = values
+        self._events = [] if events is None else list(events)
+        self._summary = {} if summary is None else dict(summary)
+
+        self._columns = {variable : index for index, variable in enumerate(self._variables)}
+
+    def __len__(self):
+        return len(self._values)
+
+    def getName(self):
+        return self._name
+
+    def getBranch(self):
+        return self._branch
+
+    def getVariables(self):
+        return self._variables
+
+    def getValues(self):
+        return self._values
+
+    def getSummary(self):
+        return self._summary
+
+    def hasVariable(self, variable):
+        return variable in self._columns
+
+    def getColumn(self, variable):
+        """ Return the values of a variable, one per time step """
+        if variable not in self._columns:
+            raise KeyError(variable)
+        return self._values[:, self._columns[variable]]
+
+    def getTime(self):
+        return self.getColumn(TIME)
+
+    def getMaximum(self, variable):
+        """ Return the largest value of the variable, ignoring any missing values """
+        column = self.getColumn(variable)
+        if np.isnan(column).all():
+            return None
+        return float(np.nanmax(column))
+
+    def getMaxAltitude(self):
+        if SUMMARY_MAX_ALTITUDE in self._summary:
+            return self._summary[SUMMARY_MAX_ALTITUDE]
+        return self.getMaximum(ALTITUDE)
+
+    def getMaxVelocity(self):
+        if SUMMARY_MAX_VELOCITY in self._summary:
+            return self._summary[SUMMARY_MAX_VELOCITY]
+        return self.getMaximum(TOTAL_VELOCITY)
+
+    def valueAt(self, variable, time):
+        """
+            Return the value of the variable at a time or array of times, interpolated between
+            the time steps. Missing values are skipped.
+        """
+        times = self.getTime()
+        column = self.getColumn(variable)
+        valid = ~(np.isnan(times) | np.isnan(column))
+        if not valid.any():
+            return np.full(np.shape(time), np.nan) if np.ndim(time) > 0 else None
+        values = np.interp(time, times[valid], column[valid])
+        if np.ndim(values) == 0:
+            return float(values)
+        return values
+
+    def getAltitudeAt(self, time):
+        return self.valueAt(ALTITUDE, time)
+
+    def getVelocityAt(self, time):
+        return self.valueAt(TOTAL_VELOCITY, time)
+
+    def getEvents(self, type=None):
+        """ Return the (time, type) of each event, or only those of the given type """
+        if type is None:
+            return list(self._events)
+        return [event for event in self._events if event[1] == type]
+
+    def getEventTime(self, type):
+        """ Return the time of the first event of the given type, or None """
+        for time, eventType in self._events:
+            if eventType == type:
+                return time
+        return None
+
+    def save(self, path):
+        """ Save the values as a .npy file in column major order """
+        np.save(path, np.asfortranarray(self._values))
+
+def loadValues(path, mmap=True):
+    """ Load values saved by FlightData.save(), memory mapped and read only by default """
+    return np.load(path, mmap_mode="r" if mmap else None)
@@ -29,7 +29,7 @@ import Materials
 
 from DraftTools import translate
 
-from Rocket.Parts.PartDatabase import PartDatabase
+from Rocket.Parts.ConnectionManager import getConnectionManager
 from Rocket.Parts.Material import getUuid
 from Rocket.Parts.Exceptions import MaterialNotFoundError
 
@@ -181,8 +181,7 @@ class ComponentElement(Element):
         pass
 
     def onMaterial(self, content):
-        database = PartDatabase(FreeCAD.getUserAppDataDir() + "Mod/Rocket/")
-        connection = database.getConnection()
+        connection = getConnectionManager().getConnection()
         try:
             uuid = getUuid(connection, content, self._materialType)
 
@@ -25,15 +25,18 @@ __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
 
 import FreeCAD
-import Part
-import Sketcher
 
 from Rocket.Importer.OpenRocket.SaxElement import Element
 from Rocket.Importer.OpenRocket.FinsetElement import FinsetElement
 from Rocket.Constants import FIN_TYPE_SKETCH
 
 from Ui.Commands.CmdFin import makeFin
-from Ui.Commands.CmdSketcher import newSketchNoEdit
+from Ui.Commands.CmdSketcher import newSketchNoEdit, newPolygonNoEdit, drawPolygon
+
+def _editableProfiles():
+    # Sketches can be edited after the import, polygons are faster to create
+    param = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Rocket")
+    return param.GetBool("ImportFinSketches", True)
 
 class FreeformFinpoints(Element):
 
@@ -43,7 +46,6 @@ class FreeformFinpoints(Element):
         self._validChildren = {}
         self._knownTags = ["point"]
 
-        self.sketch = parent.sketch
         self.points = []
 
 
@@ -56,31 +58,8 @@ class FreeformFinpoints(Element):
         else:
             super().handleTag(tag, attributes)
 
-    def drawLines(self):
-        # First reverse the X direction of the points
-        newPoints = []
-        for point in self.points:
-            newPoints.append((point[0], point[1]))
-        self.points = newPoints
-
-        last = self.points[-1]
-        for index, point in enumerate(self.points):
-            self.sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(float(last[0]), float(last[1]), 0),
-                                                        FreeCAD.Vector(float(point[0]), float(point[1]), 0)))
-            self.sketch.addConstraint(Sketcher.Constraint("DistanceX", index, 2, point[0]))
-            self.sketch.addConstraint(Sketcher.Constraint("DistanceY", index, 2, point[1]))
-            last = point
-
-        count = len(self.points)
-        for index in range(count):
-            if index == 0:
-                self.sketch.addConstraint(Sketcher.Constraint("Coincident", count-1, 2, index, 1))
-            else:
-                self.sketch.addConstraint(Sketcher.Constraint("Coincident", index-1, 2, index, 1))
-
     def end(self):
-        self.drawLines()
-        FreeCAD.ActiveDocument.recompute([self.sketch]) # Compute the sketch
+        self._parent.onFinPoints(self.points)
         return super().end()
 
 class FreeformFinsetElement(FinsetElement):
@@ -94,17 +73,25 @@ class FreeformFinsetElement(FinsetElement):
                               })
 
     def makeObject(self):
-        self.sketch = newSketchNoEdit()
         self._feature = makeFin()
         self._feature._obj.FinType = FIN_TYPE_SKETCH
-        self._feature._obj.Profile = self.sketch
-        # self._feature._obj.Group = [self.sketch]
 
         if self._parentObj is not None:
             self._parentObj.addChild(self._feature)
-        self.sketch.Visibility = False
 
-    def end(self):
-        self.sketch.Visibility = False
+    def onFinPoints(self, points):
+        # The profile is solved by the recompute at the end of the import
+        if len(points) == 0:
+            # An empty sketch is reported as invalid by the fin shape handler
+            profile = newSketchNoEdit()
+        elif _editableProfiles():
+            profile = drawPolygon(newSketchNoEdit(), points)
+        else:
+            profile = newPolygonNoEdit(points)
+        profile.Visibility = False
+        self._feature._obj.Profile = profile
 
+    def end(self):
+        if self._feature._obj.Profile is None:
+            self.onFinPoints([])
         return super().end()
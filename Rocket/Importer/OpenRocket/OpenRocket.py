@@ -24,13 +24,12 @@ __title__ = "FreeCAD Open Rocket Importer"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
 
-from io import TextIOWrapper
 import re
 import zipfile
+from collections import Counter
 from zipfile import ZipFile
 import gzip
 
-import xml.sax
 import FreeCAD
 
 from DraftTools import translate
@@ -40,8 +39,11 @@ from Rocket.Exceptions import UnsupportedVersion
 from Rocket.Importer.OpenRocket.SaxElement import NullElement
 from Rocket.Importer.OpenRocket.ComponentElement import ComponentElement
 from Rocket.Importer.OpenRocket.SubElement import SubElement
+from Rocket.Importer.OpenRocket.ParseTree import SectionFilter, parseTree
+from Rocket.Importer.OpenRocket.SimulationReader import SimulationReader
+from Rocket.FeatureFlightData import makeFlightData
 
-from Rocket.Utilities import _err
+from Rocket.Utilities import _err, _wrn
 
 from Ui.Commands.CmdRocket import makeRocket
 
@@ -82,6 +84,9 @@ class RocketElement(ComponentElement):
 
         self._feature = makeRocket(makeSustainer=False)
 
+        # Defer all events and recomputes until the rocket is complete
+        self._feature.beginBatch()
+
     def handleEndTag(self, tag, content):
         _tag = tag.lower().strip()
         if _tag == "designer":
@@ -96,45 +101,83 @@ class RocketElement(ComponentElement):
             self._feature.setComment(content)
 
     def end(self):
-        self._feature.enableEvents()
+        self._feature.endBatch()
+        return self._parent
+
+    def abort(self):
+        self._feature.endBatch(recompute=False)
         return self._parent
 
-class OpenRocketImporter(xml.sax.ContentHandler):
+# Sections of the file that are not part of the rocket design
+SKIPPED_SECTIONS = [("openrocket", "datatypes"), ("openrocket", "simulations"), ("openrocket", "photostudio")]
+
+def _importSimulations():
+    param = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Rocket")
+    return param.GetBool("ImportSimulations", True)
+
+class OpenRocketImporter:
+    """
+        Imports in two phases. The file is first parsed into a lightweight tree without
+        touching the document, so a file that fails to parse leaves the document unchanged.
+        The tree is then walked to build the rocket, with all the objects created inside a
+        single batch and one recompute at the end.
+
+        Simulation results are read separately from the tree, and stored as flight data
+        objects in a Simulations group.
+    """
+
     def __init__(self, filename):
         self._filename = filename
         self._current = RootElement(None, "root", None, None, filename, 0)
-        self._content = ''
-
-    # Call when an element starts
-    def startElement(self, tag, attributes):
-        loc = self._locator
-        if loc is not None:
-            line = loc.getLineNumber()
-        if self._current.isChildElement(tag):
-            self._current = self._current.createChild(tag, attributes, self._filename, line)
-            self._content = ''
-        else:
-            self._current.handleTag(tag, attributes)
 
-    # Call when an elements ends
-    def endElement(self, tag):
-        if self._current.isTag(tag):
+    def build(self, root):
+        for node in root.children:
+            self._buildNode(node)
+
+    def _buildNode(self, node):
+        if self._current.isChildElement(node.tag):
+            self._current = self._current.createChild(node.tag, node.attributes, self._filename, node.line)
+            for child in node.children:
+                self._buildNode(child)
             self._current = self._current.end()
         else:
-            self._current.handleEndTag(tag, self._content.strip())
-        self._content = ''
-
-
-    # Call when a character is read
-    def characters(self, content):
-        self._content += content
+            self._current.handleTag(node.tag, node.attributes)
+            for child in node.children:
+                self._buildNode(child)
+            self._current.handleEndTag(node.tag, node.content)
+
+    # Call when the import fails to release any incomplete elements
+    def abort(self):
+        while self._current is not None:
+            self._current = self._current.abort()
+
+    def buildSimulations(self, doc, simulations):
+        if len(simulations) == 0:
+            return
+
+        # Simulations with more than one branch, such as a booster, are labelled by branch
+        branches = Counter([flightData.getName() for flightData in simulations])
+        group = doc.addObject("App::DocumentObjectGroup", "Simulations")
+        for flightData in simulations:
+            feature = makeFlightData(flightData, "FlightData")
+            if branches[flightData.getName()] > 1:
+                feature._obj.Label = "{0} - {1}".format(flightData.getName(), flightData.getBranch())
+            group.addObject(feature._obj)
+
+    def parse(filestream, simulations=None):
+        # The skipped sections, mostly simulation data, are removed before the parser sees them.
+        # The simulation results are passed to the simulation reader when there is one
+        sinks = None
+        if simulations is not None:
+            sinks = {"simulations" : simulations}
+        stream = SectionFilter(filestream, [path[-1] for path in SKIPPED_SECTIONS], sinks)
+        return parseTree(stream, SKIPPED_SECTIONS)
 
     def importFile(doc, filename):
         try:
             with gzip.open(filename) as orc:
                 orc.peek(10)
                 OpenRocketImporter.importRocket(doc, orc, filename)
-                doc.recompute(None,True,True)
                 return
         except gzip.BadGzipFile:
             pass
@@ -158,21 +201,28 @@ class OpenRocketImporter(xml.sax.ContentHandler):
 
     def importRocket(doc, filestream, filename):
         # _msg("Importing %s..." % filename)
-        orc = TextIOWrapper(filestream)
-
-        # create an XMLReader
-        parser = xml.sax.make_parser()
-
-        # turn off namespaces
-        parser.setFeature(xml.sax.handler.feature_namespaces, 0)
+        simulations = SimulationReader() if _importSimulations() else None
+        try:
+            root = OpenRocketImporter.parse(filestream, simulations)
+        except Exception as ex:
+            _err(translate("Rocket", "Unable to complete import"))
+            _err(str(ex))
+            return
 
-        # override the default ContextHandler
-        handler = OpenRocketImporter(filename)
-        parser.setContentHandler(handler)
+        importer = OpenRocketImporter(filename)
         try:
-            parser.parse(orc)
+            importer.build(root)
         except UnsupportedVersion as ex:
+            importer.abort()
             _err(ex._message)
+            return
         except Exception as ex:
+            importer.abort()
             _err(translate("Rocket", "Unable to complete import"))
             _err(str(ex))
+            return
+
+        if simulations is not None:
+            for error in simulations.getErrors():
+                _wrn(translate("Rocket", "Unable to import simulation: {}").format(error))
+            importer.buildSimulations(doc, simulations.getFlightData())
@@ -0,0 +1,187 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Lightweight tree of the elements in an XML file, read before any objects are created"""
+
+__title__ = "FreeCAD XML Parse Tree"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import re
+import xml.sax
+
+from Rocket.Importer.SaxHandler import SaxHandler
+
+CHUNK_SIZE = 1024 * 1024
+
+class ParseNode:
+    """
+        An element of the file with its attributes, the line it started on, its stripped
+        text content and its child elements
+    """
+
+    __slots__ = ("tag", "attributes", "line", "content", "children")
+
+    def __init__(self, tag, attributes, line):
+        self.tag = tag
+        self.attributes = attributes
+        self.line = line
+        self.content = ''
+        self.children = []
+
+class ParseTreeHandler(SaxHandler):
+    """
+        SAX content handler that builds a tree of ParseNodes. The children of the elements at
+        the paths in skip, tuples of tags from the document element down, are not kept.
+    """
+
+    def __init__(self, skip=()):
+        super().__init__()
+        self._root = ParseNode("root", {}, 0)
+        self._stack = [self._root]
+        self._path = ()
+        self._skip = set(skip)
+        self._skipDepth = 0
+
+    def getRoot(self):
+        return self._root
+
+    def startElement(self, tag, attributes):
+        if self._skipDepth > 0:
+            self._skipDepth += 1
+            return
+
+        node = ParseNode(tag, dict(attributes), self.getLine())
+        self._stack[-1].children.append(node)
+        self._stack.append(node)
+        self._path += (tag.lower().strip(),)
+        if self._path in self._skip:
+            self._skipDepth = 1
+            self._collecting = False
+        self.clearContent()
+
+    def endElement(self, tag):
+        if self._skipDepth > 1:
+            self._skipDepth -= 1
+            return
+        self._skipDepth = 0
+        self._collecting = True
+
+        node = self._stack.pop()
+        self._path = self._path[:-1]
+        node.content = self.takeContent()
+
+class SectionFilter:
+    """
+        Wraps a binary stream, removing the contents of the named sections before they reach
+        the parser. Each section is left as an empty element with its original attributes, so
+        the parser sees it without having to handle the thousands of elements that may be in
+        it. This is a byte search rather than a parse, so the tags must only be used for the
+        sections, as is the case for the top level sections of an OpenRocket file.
+
+        The removed contents of a section can be passed on to a sink, any object with a
+        feed(data) method, by giving sinks as a dictionary of tags to sinks.
+    """
+
+    def __init__(self, stream, tags, sinks=None):
+        self._stream = stream
+        self._start = re.compile(b"<(" + b"|".join(re.escape(tag.encode()) for tag in tags) + b")[\\s/>]")
+        self._sinks = {} if sinks is None else {tag.encode() : sink for tag, sink in sinks.items()}
+        self._end = None
+        self._sink = None
+        self._data = b""
+        self._eof = False
+
+    def read(self, size=-1):
+        output = []
+        length = 0
+        while not self._eof and (size < 0 or length < size):
+            chunk = self._stream.read(CHUNK_SIZE)
+            self._eof = len(chunk) == 0
+            self._data += chunk
+            filtered = self._filter()
+            output.append(filtered)
+            length += len(filtered)
+
+        if self._eof:
+            # Whatever is left is passed on, and the parser reports any error
+            output.append(self._data)
+            self._data = b""
+        return b"".join(output)
+
+    def close(self):
+        self._stream.close()
+
+    def _filter(self):
+        """ Return the data that can be passed on, keeping any partial tag for the next read """
+        output = []
+        data = self._data
+        while True:
+            if self._end is not None:
+                position = data.find(self._end)
+                if position < 0:
+                    self._feed(data[:-len(self._end)])
+                    data = data[-len(self._end):]
+                    break
+                self._feed(data[:position])
+                output.append(self._end)
+                data = data[position + len(self._end):]
+                self._end = None
+                self._sink = None
+                continue
+
+            match = self._start.search(data)
+            if match is None:
+                # Keep enough for a start tag split across reads
+                keep = max(len(data) - len(self._start.pattern), 0)
+                output.append(data[:keep])
+                data = data[keep:]
+                break
+
+            close = data.find(b">", match.start())
+            if close < 0:
+                output.append(data[:match.start()])
+                data = data[match.start():]
+                break
+
+            output.append(data[:close + 1])
+            if data[close - 1:close] != b"/":
+                self._end = b"</" + match.group(1) + b">"
+                self._sink = self._sinks.get(match.group(1))
+            data = data[close + 1:]
+
+        self._data = data
+        return b"".join(output)
+
+    def _feed(self, data):
+        if self._sink is not None and len(data) > 0:
+            self._sink.feed(data)
+
+def parseTree(stream, skip=()):
+    """ Parse an XML text stream and return the root of its tree """
+    parser = xml.sax.make_parser()
+
+    # turn off namespaces
+    parser.setFeature(xml.sax.handler.feature_namespaces, 0)
+
+    handler = ParseTreeHandler(skip)
+    parser.setContentHandler(handler)
+    parser.parse(stream)
+    return handler.getRoot()
@@ -30,6 +30,8 @@ from Rocket.Utilities import _msg, _err
 
 class Element:
 
+    ignoreContent = False
+
     def __init__(self, parent, tag, attributes, parentObj, filename, line):
         self._tag = tag
         self._parent = parent
@@ -52,6 +54,10 @@ class Element:
     def end(self):
         return self._parent
 
+    # Called instead of end() when the import fails before the end tag is reached
+    def abort(self):
+        return self._parent
+
     def isChildElement(self, tag):
         return str(tag).lower().strip() in self._validChildren
 
@@ -87,6 +93,8 @@ class Element:
 
 class NullElement(Element):
 
+    ignoreContent = True # The content is never used
+
     def __init__(self, parent, tag, attributes, parentObj, filename, line):
         super().__init__(parent, tag, attributes, parentObj, filename, line)
         
@@ -0,0 +1,132 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Reads the simulation results from an OpenRocket file"""
+
+__title__ = "FreeCAD Open Rocket Simulation Reader"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import re
+import xml.etree.ElementTree as ET
+import numpy as np
+
+from Rocket.FlightData import FlightData
+
+SIMULATION_END = b"</simulation>"
+DATABRANCH_START = b"<databranch"
+DATABRANCH_END = b"</databranch>"
+
+_SIMULATION_START = re.compile(rb"<simulation[\s>]")
+_DATAPOINT = re.compile(rb"<datapoint>([^<]*)</datapoint>\s*")
+
+class SimulationReader:
+    """
+        Sink for the contents of the simulations section of an OpenRocket file, for use with a
+        SectionFilter. A file may hold hundreds of thousands of data points, so they are
+        not parsed as elements. Each simulation is read once it is complete, with the data
+        points of each branch converted to an array in one step, and the remainder of the
+        simulation parsed as XML for the names, events and summary values.
+
+        Simulations that can't be read are skipped and reported by getErrors().
+    """
+
+    def __init__(self):
+        self._data = b""
+        self._searched = 0
+        self._flightData = []
+        self._errors = []
+
+    def getFlightData(self):
+        return self._flightData
+
+    def getErrors(self):
+        return self._errors
+
+    def feed(self, data):
+        self._data += data
+        while True:
+            end = self._data.find(SIMULATION_END, self._searched)
+            if end < 0:
+                self._searched = max(len(self._data) - len(SIMULATION_END), 0)
+                return
+
+            end += len(SIMULATION_END)
+            try:
+                self._readSimulation(self._data[:end])
+            except Exception as ex:
+                # A simulation that can't be read mustn't stop the rocket being imported
+                self._errors.append(str(ex))
+            self._data = self._data[end:]
+            self._searched = 0
+
+    def _readSimulation(self, data):
+        match = _SIMULATION_START.search(data)
+        if match is None:
+            return
+        start = match.start()
+
+        # Separate the data points of each branch from the rest of the simulation
+        outline = []
+        branches = []
+        position = start
+        while True:
+            branchStart = data.find(DATABRANCH_START, position)
+            if branchStart < 0:
+                break
+            branchEnd = data.find(DATABRANCH_END, branchStart)
+            if branchEnd < 0:
+                raise ValueError("Incomplete data branch")
+
+            branch = data[branchStart:branchEnd]
+            branches.append(_DATAPOINT.findall(branch))
+            outline.append(data[position:branchStart])
+            outline.append(_DATAPOINT.sub(b"", branch))
+            position = branchEnd
+        outline.append(data[position:])
+
+        simulation = ET.fromstring(b"".join(outline))
+        name = simulation.findtext("name", "").strip()
+        flightData = simulation.find("flightdata")
+        if flightData is None:
+            # Outdated simulations have no results
+            return
+
+        summary = {}
+        for key, value in flightData.attrib.items():
+            try:
+                summary[key] = float(value)
+            except ValueError:
+                pass
+
+        for element, points in zip(flightData.iter("databranch"), branches):
+            variables = [variable.strip() for variable in element.get("types", "").split(",")]
+            events = [(float(event.get("time")), event.get("type")) for event in element.iter("event")]
+            self._flightData.append(FlightData(name, element.get("name", ""), variables,
+                                               _toArray(points, len(variables)), events, summary))
+
+def _toArray(points, columns):
+    """ Convert the comma separated values of each data point to an array with a row per point """
+    if len(points) == 0:
+        return np.zeros((0, columns))
+    values = np.array(b",".join(points).split(b","), dtype=float)
+    if len(values) != len(points) * columns:
+        raise ValueError("Data points don't match the data types")
+    return values.reshape(len(points), columns)
@@ -36,6 +36,7 @@ import FreeCADGui
 
 from Rocket.Exceptions import UnsupportedVersion
 
+from Rocket.Importer.SaxHandler import ElementHandler
 from Rocket.Importer.OpenRocket.SaxElement import Element, NullElement
 from Rocket.Importer.RASAero.NoseElement import NoseElement
 from Rocket.Importer.RASAero.BodyTubeElement import BodyTubeElement
@@ -96,6 +97,10 @@ class RocketElement(Element):
                 "booster2nozzle", "usebooster1", "usebooster2", "comments"]
 
         self._rocket = makeRocket(makeSustainer=False)
+
+        # Defer all events and recomputes until the rocket is complete
+        self._rocket.beginBatch()
+
         self._feature = makeStage()
         if self._rocket is not None:
             self._rocket.addChild(self._feature)
@@ -114,45 +119,22 @@ class RocketElement(Element):
             self._rocket.setComment(content)
 
     def end(self):
-        self._rocket.enableEvents()
+        self._rocket.endBatch()
         return self._parent
 
-class RASAeroImporter(xml.sax.ContentHandler):
-    def __init__(self, filename):
-        self._filename = filename
-        self._current = RootElement(None, "root", None, None, filename, 0)
-        self._content = ''
-
-    # Call when an element starts
-    def startElement(self, tag, attributes):
-        loc = self._locator
-        if loc is not None:
-            line = loc.getLineNumber()
-        if self._current.isChildElement(tag):
-            self._current = self._current.createChild(tag, attributes, self._filename, line)
-            self._content = ''
-        else:
-            self._current.handleTag(tag, attributes)
-
-    # Call when an elements ends
-    def endElement(self, tag):
-        if self._current.isTag(tag):
-            self._current = self._current.end()
-        else:
-            self._current.handleEndTag(tag, self._content.strip())
-        self._content = ''
-
+    def abort(self):
+        self._rocket.endBatch(recompute=False)
+        return self._parent
 
-    # Call when a character is read
-    def characters(self, content):
-        self._content += content
+class RASAeroImporter(ElementHandler):
+    def __init__(self, filename):
+        super().__init__(RootElement(None, "root", None, None, filename, 0), filename)
 
     def importFile(doc, filename):
         try:
             with gzip.open(filename) as orc:
                 orc.peek(10)
                 OpenRocketImporter.importRocket(doc, orc, filename)
-                doc.recompute(None,True,True)
                 return
         except gzip.BadGzipFile:
             pass
@@ -187,4 +169,8 @@ class RASAeroImporter(xml.sax.ContentHandler):
         # override the default ContextHandler
         handler = RASAeroImporter(filename)
         parser.setContentHandler(handler)
-        parser.parse(orc)
+        try:
+            parser.parse(orc)
+        except Exception:
+            handler.abort()
+            raise
@@ -0,0 +1,96 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Base classes for the SAX content handlers of the importers"""
+
+__title__ = "FreeCAD Rocket SAX Handler"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import xml.sax
+
+class SaxHandler(xml.sax.ContentHandler):
+    """
+        Collects the text of each element as a list of chunks that are joined once when it is
+        used. Adding each chunk to a string copies all of the text so far, which is quadratic
+        for long text such as simulation data. No text is collected while _collecting is
+        False, such as inside sections that are being ignored.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._content = []
+        self._collecting = True
+
+    def characters(self, content):
+        if self._collecting:
+            self._content.append(content)
+
+    def takeContent(self):
+        """ Return the stripped text collected since the last call, and start collecting again """
+        content = ''.join(self._content).strip()
+        self._content = []
+        return content
+
+    def clearContent(self):
+        self._content = []
+
+    def getLine(self):
+        if self._locator is not None:
+            return self._locator.getLineNumber()
+        return 0
+
+class ElementHandler(SaxHandler):
+    """
+        Passes the SAX events to a tree of elements. Tags that are valid children of the
+        current element create a new element, other tags are handled by the current element.
+        Elements with ignoreContent set, such as those for sections that aren't imported,
+        receive no text.
+    """
+
+    def __init__(self, root, filename):
+        super().__init__()
+        self._filename = filename
+        self._current = root
+
+    def _setCurrent(self, element):
+        self._current = element
+        self._collecting = not getattr(element, "ignoreContent", False)
+
+    # Call when an element starts
+    def startElement(self, tag, attributes):
+        if self._current.isChildElement(tag):
+            self._setCurrent(self._current.createChild(tag, attributes, self._filename, self.getLine()))
+            self.clearContent()
+        else:
+            self._current.handleTag(tag, attributes)
+
+    # Call when an elements ends
+    def endElement(self, tag):
+        if self._current.isTag(tag):
+            self._setCurrent(self._current.end())
+            self.clearContent()
+        else:
+            self._current.handleEndTag(tag, self.takeContent())
+
+    # Call when the import fails to release any incomplete elements
+    def abort(self):
+        while self._current is not None:
+            self._current = self._current.abort()
@@ -24,7 +24,8 @@ __title__ = "FreeCAD Open Rocket Part Body Tube"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
 
-from Rocket.Parts.Component import Component
+from Rocket.Parts.Component import Component, addRangeCondition, addManufacturerCondition, queryParts
+from Rocket.Parts.Utilities import _toMetres
 from Rocket.Parts.Exceptions import MultipleEntryError, NotFoundError
 from Rocket.Constants import COMPONENT_TYPE_ANY, COMPONENT_TYPE_BODYTUBE, COMPONENT_TYPE_COUPLER, \
     COMPONENT_TYPE_LAUNCHLUG, COMPONENT_TYPE_ENGINEBLOCK, COMPONENT_TYPE_CENTERINGRING, COMPONENT_TYPE_BULKHEAD
@@ -52,21 +53,17 @@ class BodyTube(Component):
         self.validateNonEmptyString(self._OD[1], "OD Units invalid '%s" % self._OD[1])
         self.validateNonEmptyString(self._length[1], "Length Units invalid '%s" % self._length[1])
 
-    def persist(self, connection):
-        component_id = super().persist(connection)
+    def persist(self, loader):
+        component_id = super().persist(loader)
 
         # May throw a NotFoundError
-        tube_id = getTubeType(connection, self._tubeType)
+        tube_id = loader.getTubeType(self._tubeType)
 
-        cursor = connection.cursor()
-
-        cursor.execute("INSERT INTO body_tube (component_index, tube_type_index, inner_diameter, inner_diameter_units, outer_diameter, outer_diameter_units, length, length_units) VALUES (?,?,?,?,?,?,?,?)",
-                            (component_id, tube_id, self._ID[0], self._ID[1], self._OD[0], self._OD[1], self._length[0], self._length[1]))
-        id = cursor.lastrowid
-
-        connection.commit()
-
-        return id
+        return loader.insert("body_tube", ("component_index", "tube_type_index", "inner_diameter", "inner_diameter_units",
+                                "outer_diameter", "outer_diameter_units", "length", "length_units",
+                                "inner_diameter_m", "outer_diameter_m", "length_m"),
+                            (component_id, tube_id, self._ID[0], self._ID[1], self._OD[0], self._OD[1], self._length[0], self._length[1],
+                            _toMetres(*self._ID), _toMetres(*self._OD), _toMetres(*self._length)))
 
 def getTubeType(connection, tubeType):
     cursor = connection.cursor()
@@ -90,24 +87,43 @@ def getTubeType(connection, tubeType):
 
     return rows[0]['tube_type_index']
 
-def listBodyTubes(connection, tubeType=None):
-    cursor = connection.cursor()
-
+def queryBodyTubes(connection, tubeType=None, conditions=[], parameters={}, orderBy=None):
+    """
+        Return a cursor over the tubes of the given type without fetching the rows. The
+        conditions further restrict the results, and orderBy is an optional ORDER BY clause.
+    """
+    conditions = ["b.component_index = c.component_index", "b.tube_type_index = t.tube_type_index"] + list(conditions)
+    parameters = dict(parameters)
     if tubeType is None or tubeType == COMPONENT_TYPE_ANY:
-        cursor.execute("""SELECT body_tube_index, type, manufacturer, part_number, description, inner_diameter, inner_diameter_units, 
-                            outer_diameter, outer_diameter_units, length, length_units
-                        FROM component c, body_tube b, tube_type t
-                        WHERE b.component_index = c.component_index AND b.tube_type_index = t.tube_type_index
-                            AND NOT t.type = 'Centering Ring' AND NOT t.type = 'Bulkhead'""")
+        conditions.append("NOT t.type = 'Centering Ring' AND NOT t.type = 'Bulkhead'")
     else:
-        cursor.execute("""SELECT body_tube_index, type, manufacturer, part_number, description, inner_diameter, inner_diameter_units, 
+        conditions.append("t.type = :type")
+        parameters["type"] = tubeType
+
+    return queryParts(connection, """SELECT body_tube_index, type, c.component_index, manufacturer, part_number, description, inner_diameter, inner_diameter_units, 
                             outer_diameter, outer_diameter_units, length, length_units
-                        FROM component c, body_tube b, tube_type t 
-                        WHERE b.component_index = c.component_index AND b.tube_type_index = t.tube_type_index AND t.type = :type""", {
-                            "type" : tubeType
-                        })
+                        FROM component c, body_tube b, tube_type t""", conditions, parameters, orderBy)
 
-    rows = cursor.fetchall()
+def listBodyTubes(connection, tubeType=None):
+    rows = queryBodyTubes(connection, tubeType).fetchall()
+    return rows
+
+def findBodyTubes(connection, odRange=None, idRange=None, lengthMin=None, manufacturer=None, tubeType=None):
+    """
+        Return the tubes within the given dimensions, as for listBodyTubes(). Ranges are
+        (minimum, maximum) tuples in metres where either end may be None, for example all the
+        couplers that fit inside a 24.8mm tube:
+
+            findBodyTubes(connection, odRange=(0.0246, 0.0250), tubeType=COMPONENT_TYPE_COUPLER)
+    """
+    conditions = []
+    parameters = {}
+    addRangeCondition(conditions, parameters, "b.outer_diameter_m", odRange)
+    addRangeCondition(conditions, parameters, "b.inner_diameter_m", idRange)
+    addRangeCondition(conditions, parameters, "b.length_m", (lengthMin, None))
+    addManufacturerCondition(conditions, parameters, manufacturer)
+
+    rows = queryBodyTubes(connection, tubeType, conditions, parameters).fetchall()
     return rows
 
 def getBodyTube(connection, index):
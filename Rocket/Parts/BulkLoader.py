@@ -0,0 +1,213 @@
+# ***************************************************************************
+# *   Copyright (c) 2021-2024 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for bulk loading parts into the database"""
+
+__title__ = "FreeCAD Open Rocket Part Bulk Loader"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import time
+
+from Rocket.Parts.BodyTube import getTubeType
+from Rocket.Parts.Exceptions import MaterialNotFoundError
+from Rocket.Parts.Utilities import _msg
+
+# SQLite COLLATE NOCASE only folds the ASCII characters
+_NOCASE = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+def _nocase(value):
+    return str(value).translate(_NOCASE)
+
+class MaterialMap:
+    """
+        In memory copy of the material table. Names are resolved the same way as by
+        getMaterial() and getMaterialAnyType(), without a query for each component.
+    """
+
+    def __init__(self, connection):
+        self._entries = {}
+        self._byManufacturer = {}
+        self._byName = {}
+        self._byNameOnly = {}
+        self._anyType = {}
+
+        cursor = connection.cursor()
+        cursor.execute("SELECT material_index, manufacturer, material_name, type, density, units FROM material ORDER BY material_index")
+        for row in cursor.fetchall():
+            self.add(row[0], row[1], row[2], row[3], row[4], row[5])
+
+    def _first(self, entries, key, order, index):
+        current = entries.get(key)
+        if current is None or order < current[0]:
+            entries[key] = (order, index)
+
+    def add(self, index, manufacturer, name, type, density, units):
+        # The queries return the first match in the order of the idx_material index
+        order = (manufacturer, name, type, index)
+        self._entries.setdefault((manufacturer, name, type), (index, density, units))
+        self._first(self._byManufacturer, (_nocase(manufacturer), _nocase(name), type), order, index)
+        self._first(self._byName, (_nocase(name), type), order, index)
+        self._first(self._byNameOnly, _nocase(name), order, index)
+        self._anyType.setdefault((manufacturer, name), []).append((type, index))
+
+    def entry(self, manufacturer, name, type):
+        """ Return (material_index, density, units) of an exactly matching entry, or None """
+        return self._entries.get((manufacturer, name, type))
+
+    def find(self, manufacturer, name, type):
+        for entry in [self._byManufacturer.get((_nocase(manufacturer), _nocase(name), type)),
+                      self._byName.get((_nocase(name), type)),
+                      self._byNameOnly.get(_nocase(name))]:
+            if entry is not None:
+                return entry[1]
+        raise MaterialNotFoundError()
+
+    def findAnyType(self, manufacturer, name):
+        indexes = self._anyType.get((manufacturer, name))
+        if indexes is None:
+            raise MaterialNotFoundError()
+        if len(indexes) > 1:
+            print("%d rows found!" % len(indexes))
+        return min(indexes)[1]
+
+class BulkLoader:
+    """
+        Writes parts to the database in bulk. Rows are given their primary keys as they are
+        queued, and are written with one executemany() for each table when the source file is
+        complete. Each source file is a single transaction.
+
+        Use as a context manager to tune the database for the build:
+        <pre>
+            with BulkLoader(connection) as loader:
+                loader.beginFile(filename)
+                # persist parts
+                loader.endFile()
+        </pre>
+    """
+
+    def __init__(self, connection):
+        self._connection = connection
+        self.reload()
+
+    def reload(self):
+        """ Reread the database state, such as after rows have been deleted """
+        self._materials = MaterialMap(self._connection)
+        self._nextIndex = {}
+        self._pending = {}
+        self._tubeTypes = {}
+        self._filename = None
+        self._start = 0
+        self._rows = 0
+        self._ranges = {}
+
+    def __enter__(self):
+        # The database is regenerated from the source files, so durability isn't needed
+        self._connection.commit()
+        self._connection.execute("PRAGMA journal_mode=MEMORY")
+        self._connection.execute("PRAGMA synchronous=OFF")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+            self._connection.commit()
+        else:
+            self.rollback()
+        self._connection.execute("PRAGMA synchronous=FULL")
+        self._connection.execute("PRAGMA journal_mode=DELETE")
+        return False
+
+    @property
+    def connection(self):
+        return self._connection
+
+    def beginFile(self, filename):
+        self._filename = filename
+        self._start = time.perf_counter()
+        self._rows = 0
+        self._ranges = {}
+
+    def endFile(self):
+        self.flush()
+        self._connection.commit()
+
+        elapsed = time.perf_counter() - self._start
+        rate = self._rows / elapsed if elapsed > 0 else 0.0
+        _msg("%s: %d rows in %.2fs (%.0f rows/s)" % (self._filename, self._rows, elapsed, rate))
+        self._filename = None
+
+    def rollback(self):
+        """ Discard the queued rows and the current transaction """
+        self._connection.rollback()
+        self.reload()
+
+    def insert(self, table, columns, values):
+        """ Queue a row for the table, returning its primary key """
+        index = self._nextIndex.get(table)
+        if index is None:
+            cursor = self._connection.cursor()
+            cursor.execute("SELECT MAX({0}_index) FROM {0}".format(table))
+            index = (cursor.fetchone()[0] or 0) + 1
+
+        self._nextIndex[table] = index + 1
+        self._pending.setdefault((table, tuple(columns)), []).append((index,) + tuple(values))
+        self._rows += 1
+
+        if table in self._ranges:
+            self._ranges[table][1] = index
+        else:
+            self._ranges[table] = [index, index]
+        return index
+
+    def getRanges(self):
+        """
+            Return a dictionary of the first and last primary keys written to each table since
+            beginFile(). Keys are allocated sequentially so each range is contiguous.
+        """
+        return {table : tuple(range) for table, range in self._ranges.items()}
+
+    def flush(self):
+        cursor = self._connection.cursor()
+        for (table, columns), rows in self._pending.items():
+            cursor.executemany("INSERT INTO {0} ({0}_index, {1}) VALUES ({2})".format(table, ", ".join(columns),
+                                    ", ".join(["?"] * (len(columns) + 1))), rows)
+        self._pending = {}
+
+    def addMaterial(self, manufacturer, name, uuid, type, density, units):
+        index = self.insert("material", ("manufacturer", "material_name", "uuid", "type", "density", "units"),
+                            (manufacturer, name, uuid, type, density, units))
+        self._materials.add(index, manufacturer, name, type, density, units)
+        return index
+
+    def materialEntry(self, manufacturer, name, type):
+        return self._materials.entry(manufacturer, name, type)
+
+    def getMaterial(self, manufacturer, name, type):
+        return self._materials.find(manufacturer, name, type)
+
+    def getMaterialAnyType(self, manufacturer, name):
+        return self._materials.findAnyType(manufacturer, name)
+
+    def getTubeType(self, tubeType):
+        # May throw a NotFoundError
+        if tubeType not in self._tubeTypes:
+            self._tubeTypes[tubeType] = getTubeType(self._connection, tubeType)
+        return self._tubeTypes[tubeType]
@@ -0,0 +1,197 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""In memory snapshot of the parts database for fast repeated searches"""
+
+__title__ = "FreeCAD Rocket Parts Catalogue"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import os
+import sqlite3
+import sys
+import numpy as np
+
+from Rocket.Parts.ConnectionManager import getDatabasePath
+from Rocket.Parts.Utilities import _toMetres
+
+# For each table, the dimensions loaded in metres, and the text columns stored as codes
+CATALOGUE_TABLES = {
+    "body_tube" : (["outer_diameter", "inner_diameter", "length"], ["type"]),
+    "nose" : (["diameter", "length", "shoulder_diameter", "shoulder_length"], ["shape"]),
+    "transition" : (["fore_outside_diameter", "aft_outside_diameter", "fore_shoulder_diameter",
+                     "aft_shoulder_diameter", "length"], ["shape"]),
+    "rail_button" : (["outer_diameter", "inner_diameter", "height"], [])
+}
+
+def _intern(values):
+    """ Return the sorted unique strings and the code of each value within them """
+    unique, codes = np.unique(np.array([str(value) for value in values], dtype=object), return_inverse=True)
+    return [sys.intern(value) for value in unique.tolist()], codes.astype(np.int32)
+
+class PartTable:
+    """
+        The parts of one type as a NumPy structured array with a row per part. Dimensions are
+        in metres, NaN when unknown. Manufacturers and other text columns are stored as codes
+        into sorted lists of strings.
+    """
+
+    def __init__(self, name, data, partNumbers, labels):
+        self.name = name
+        self.data = data
+        self.partNumbers = partNumbers
+        self._labels = labels
+        self._sorted = {}
+
+    def __len__(self):
+        return len(self.data)
+
+    def getLabels(self, column):
+        """ Return the strings for the codes of a text column such as manufacturer """
+        return self._labels[column]
+
+    def _code(self, column, value):
+        labels = self._labels[column]
+        position = np.searchsorted(labels, value)
+        if position < len(labels) and labels[position] == value:
+            return position
+        return -1
+
+    def filter(self, manufacturer=None, **criteria):
+        """
+            Return the positions of the rows meeting all of the criteria. Dimension criteria are
+            inclusive (minimum, maximum) tuples in metres where either end may be None, and text
+            criteria are values such as type="Body Tube".
+
+                table.filter(outer_diameter=(0.0246, 0.0250), type="Tube Coupler")
+        """
+        mask = np.ones(len(self.data), dtype=bool)
+        if manufacturer is not None:
+            criteria["manufacturer"] = manufacturer
+        for column, value in criteria.items():
+            if column in self._labels:
+                mask &= self.data[column] == self._code(column, value)
+                continue
+
+            minimum, maximum = value
+            values = self.data[column]
+            if minimum is not None:
+                mask &= values >= minimum
+            if maximum is not None:
+                mask &= values <= maximum
+        return np.flatnonzero(mask)
+
+    def sort(self, rows, column, descending=False):
+        """ Return the row positions ordered by the column """
+        order = np.argsort(self.data[column][rows], kind="stable")
+        if descending:
+            order = order[::-1]
+        return rows[order]
+
+    def findWithin(self, column, values, tolerance):
+        """
+            For each value, return the positions of the rows with the column within the
+            tolerance of it. This answers many fit checks with one binary search each.
+        """
+        order = self._sorted.get(column)
+        if order is None:
+            order = np.argsort(self.data[column], kind="stable")
+            self._sorted[column] = order
+        sortedValues = self.data[column][order]
+
+        values = np.atleast_1d(np.asarray(values, dtype=float))
+        starts = np.searchsorted(sortedValues, values - tolerance, side="left")
+        ends = np.searchsorted(sortedValues, values + tolerance, side="right")
+        return [order[start:end] for start, end in zip(starts.tolist(), ends.tolist())]
+
+    def getIndexes(self, rows):
+        """ Return the database indexes of the rows, for use with getBodyTube() and the like """
+        return self.data["index"][rows]
+
+class Catalogue:
+    """
+        Loads each part table from the database the first time it is used, and again whenever
+        the database file is modified.
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._tables = {}
+        self._mtime = None
+
+    def _checkModified(self):
+        mtime = os.stat(self._path).st_mtime_ns
+        if mtime != self._mtime:
+            self._tables = {}
+            self._mtime = mtime
+
+    def getTable(self, name):
+        self._checkModified()
+        if name not in self._tables:
+            connection = sqlite3.connect("file:" + self._path + "?mode=ro", uri=True)
+            try:
+                self._tables[name] = self._load(connection, name)
+            finally:
+                connection.close()
+        return self._tables[name]
+
+    def _load(self, connection, name):
+        dimensions, text = CATALOGUE_TABLES[name]
+        joins = "FROM component c, {0} p".format(name)
+        if "type" in text:
+            joins += " JOIN tube_type t ON p.tube_type_index = t.tube_type_index"
+        columns = ["p.{0}_index".format(name), "c.component_index", "c.manufacturer", "c.part_number"] + text
+        for dimension in dimensions:
+            columns += ["p." + dimension, "p." + dimension + "_units"]
+
+        cursor = connection.cursor()
+        cursor.execute("SELECT {0} {1} WHERE p.component_index = c.component_index ORDER BY 1".format(
+                            ", ".join(columns), joins))
+        rows = cursor.fetchall()
+        fields = list(zip(*rows)) if len(rows) > 0 else [()] * len(columns)
+
+        dtype = [("index", np.int64), ("component", np.int64), ("manufacturer", np.int32)]
+        dtype += [(column, np.int32) for column in text]
+        dtype += [(dimension, np.float64) for dimension in dimensions]
+        data = np.zeros(len(rows), dtype=dtype)
+        data["index"] = fields[0]
+        data["component"] = fields[1]
+
+        labels = {}
+        for position, column in enumerate(["manufacturer"] + text):
+            labels[column], data[column] = _intern(fields[2 if position == 0 else 3 + position])
+
+        first = 4 + len(text)
+        for position, dimension in enumerate(dimensions):
+            values = fields[first + 2 * position]
+            units = fields[first + 2 * position + 1]
+            metres = [_toMetres(value, unit) for value, unit in zip(values, units)]
+            data[dimension] = [np.nan if value is None else value for value in metres]
+
+        return PartTable(name, data, np.array(fields[3], dtype=object), labels)
+
+_catalogues = {}
+
+def getCatalogue(rootFolder=None):
+    """ Return the catalogue for the database in the workbench folder """
+    path = getDatabasePath(rootFolder)
+    if path not in _catalogues:
+        _catalogues[path] = Catalogue(path)
+    return _catalogues[path]
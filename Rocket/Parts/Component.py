@@ -26,7 +26,6 @@ __url__ = "https://www.davesrocketshop.com"
 
 from Rocket.Constants import MATERIAL_TYPE_BULK, MATERIAL_TYPE_SURFACE, MATERIAL_TYPE_LINE
 from Rocket.Parts.Exceptions import InvalidError, MaterialNotFoundError, NotFoundError
-from Rocket.Parts.Material import getMaterial, getMaterialAnyType
 
 class Component:
 
@@ -71,41 +70,120 @@ class Component:
         if self._mass[0] > 0.0: # No units required for 0 mass
             self.validateNonEmptyString(self._mass[1], "_mass units invalid")
 
-    def persist(self, connection):
+    def persist(self, loader):
         material_index = -1
         try:
-            # material_index = Materials.getMaterial(connection, self._manufacturer, self._material[0], self._material[1])
-            material_index = getMaterial(connection, self._manufacturer, self._material[0], self._material[1])
+            material_index = loader.getMaterial(self._manufacturer, self._material[0], self._material[1])
         except MaterialNotFoundError:
             pass
         if material_index < 0:
             try:
                 print("Unable to find material for '%s':'%s' - setting to any type" % (self._manufacturer, self._partNumber))
-                material_index = getMaterialAnyType(connection, self._manufacturer, self._material[0])
+                material_index = loader.getMaterialAnyType(self._manufacturer, self._material[0])
             except MaterialNotFoundError:
                 pass
         if material_index < 0:
             try:
                 print("Unable to find material for '%s':'%s' - setting to Generic" % (self._manufacturer, self._partNumber))
-                material_index = getMaterial(connection, 'Generic', self._material[0], self._material[1])
+                material_index = loader.getMaterial('Generic', self._material[0], self._material[1])
             except MaterialNotFoundError:
                 pass
         if material_index < 0:
             try:
                 print("Unable to find material for '%s':'%s' - setting to Generic any type" % (self._manufacturer, self._partNumber))
-                material_index = getMaterialAnyType(connection, 'Generic', self._material[1])
+                material_index = loader.getMaterialAnyType('Generic', self._material[1])
             except MaterialNotFoundError:
                 pass
 
-        cursor = connection.cursor()
-
-        cursor.execute("INSERT INTO component (manufacturer, part_number, description, material_index, mass, mass_units) VALUES (?,?,?,?,?,?)",
+        return loader.insert("component", ("manufacturer", "part_number", "description", "material_index", "mass", "mass_units"),
                             (self._manufacturer, self._partNumber, self._description, material_index, self._mass[0], self._mass[1]))
-        id = cursor.lastrowid
 
-        connection.commit()
+def addRangeCondition(conditions, parameters, column, valueRange):
+    """
+        Add an inclusive range test on the column to the list of query conditions. valueRange
+        is a (minimum, maximum) tuple where either end may be None, or None for no test.
+    """
+    if valueRange is None:
+        return
+    minimum, maximum = valueRange
+    name = column.replace(".", "_")
+    if minimum is not None:
+        conditions.append("%s >= :%s_min" % (column, name))
+        parameters[name + "_min"] = minimum
+    if maximum is not None:
+        conditions.append("%s <= :%s_max" % (column, name))
+        parameters[name + "_max"] = maximum
+
+def addManufacturerCondition(conditions, parameters, manufacturer):
+    if manufacturer is not None:
+        conditions.append("c.manufacturer = :manufacturer")
+        parameters["manufacturer"] = manufacturer
+
+def addSearchCondition(conditions, parameters, text, indexed=True):
+    """
+        Add a test that the component matches the search text. Without the search index, the
+        manufacturer, part number or description must contain the text.
+    """
+    text = str(text).strip()
+    if len(text) < 1:
+        return
+    if indexed:
+        query = _searchQuery(text)
+        if len(query) < 1:
+            conditions.append("0") # Nothing to search for
+            return
+        conditions.append("c.component_index IN (SELECT rowid FROM component_search WHERE component_search MATCH :search)")
+        parameters["search"] = query
+    else:
+        conditions.append("""(c.manufacturer LIKE :search ESCAPE '\\' OR c.part_number LIKE :search ESCAPE '\\'
+                          OR c.description LIKE :search ESCAPE '\\')""")
+        parameters["search"] = "%" + text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+def queryParts(connection, select, conditions, parameters, orderBy=None):
+    """ Execute the select with the conditions, returning the cursor without fetching any rows """
+    sql = select + " WHERE " + " AND ".join(conditions)
+    if orderBy is not None:
+        sql += " ORDER BY " + orderBy
+
+    cursor = connection.cursor()
+    cursor.execute(sql, parameters)
+    return cursor
+
+def hasColumn(connection, table, column):
+    cursor = connection.cursor()
+    cursor.execute("PRAGMA table_info({0})".format(table))
+    return column in [row[1] for row in cursor.fetchall()]
+
+def hasSearchIndex(connection):
+    """ True if the database has the full text search index, which older databases don't """
+    cursor = connection.cursor()
+    cursor.execute("SELECT EXISTS (SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'component_search')")
+    return bool(cursor.fetchone()[0])
+
+def _searchQuery(text):
+    # Each word is matched as a prefix. Words are quoted so punctuation in part numbers, such
+    # as BT-20, is treated as a phrase instead of query syntax
+    terms = []
+    for word in str(text).split():
+        word = word.replace('"', '')
+        if len(word) > 0:
+            terms.append('"%s"*' % word)
+    return " ".join(terms)
+
+def searchComponents(connection, text):
+    """
+        Return the set of component indexes whose manufacturer, part number, description or
+        material contain words starting with each of the words in the text
+    """
+    query = _searchQuery(text)
+    if len(query) < 1:
+        return set()
 
-        return id
+    cursor = connection.cursor()
+    cursor.execute("SELECT rowid FROM component_search WHERE component_search MATCH :query", {
+                        "query" : query
+                    })
+    return set([row[0] for row in cursor.fetchall()])
 
 def getManufacturers(connection):
     cursor = connection.cursor()
@@ -0,0 +1,163 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Shared connections to the parts database"""
+
+__title__ = "FreeCAD Rocket Parts Database Connections"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+import sqlite3
+import time
+
+from contextlib import contextmanager
+
+DATABASE_PATH = "Resources/parts/Parts.db"
+
+CACHED_STATEMENTS = 256
+MMAP_SIZE = 64 * 1024 * 1024
+CACHE_SIZE = -16 * 1024 # In KiB
+
+def getDatabasePath(rootFolder=None):
+    """ Return the path of the parts database in the workbench folder """
+    if rootFolder is None:
+        rootFolder = FreeCAD.getUserAppDataDir() + "Mod/Rocket/"
+    return rootFolder.rstrip("/") + "/" + DATABASE_PATH
+
+class _TimedCursor(sqlite3.Cursor):
+
+    def execute(self, sql, parameters=()):
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self.connection.record(sql, time.perf_counter() - start)
+
+class _TimedConnection(sqlite3.Connection):
+    """ A connection that records the time taken to execute each query """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._statistics = {}
+
+    def cursor(self, factory=_TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def record(self, sql, elapsed):
+        key = " ".join(sql.split())
+        entry = self._statistics.get(key)
+        if entry is None:
+            self._statistics[key] = [1, elapsed, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+            entry[2] = max(entry[2], elapsed)
+
+    def getStatistics(self):
+        return self._statistics
+
+class ConnectionManager:
+    """
+        Holds a read only connection to the parts database that is shared by the lookups, so
+        they reuse the prepared statements and the page cache. The database is opened as
+        immutable, so the reader is closed while the database is being written.
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._reader = None
+        self._statistics = {}
+
+    def getPath(self):
+        return self._path
+
+    def getConnection(self):
+        """ Return the shared read only connection. It must not be closed by the caller """
+        if self._reader is None:
+            self._reader = sqlite3.connect("file:" + self._path + "?mode=ro&immutable=1", uri=True,
+                                           factory=_TimedConnection, cached_statements=CACHED_STATEMENTS)
+            self._reader.row_factory = sqlite3.Row
+            self._reader.execute("PRAGMA mmap_size=%d" % MMAP_SIZE)
+            self._reader.execute("PRAGMA cache_size=%d" % CACHE_SIZE)
+        return self._reader
+
+    def close(self):
+        if self._reader is not None:
+            self._merge(self._reader.getStatistics())
+            self._reader.close()
+            self._reader = None
+
+    @contextmanager
+    def writer(self):
+        """
+            Context manager giving a connection for updating the database. Changes are committed
+            when the context exits normally.
+        """
+        self.close()
+        connection = sqlite3.connect(self._path)
+        connection.row_factory = sqlite3.Row
+        try:
+            yield connection
+            connection.commit()
+        finally:
+            connection.close()
+
+    def _merge(self, statistics):
+        for sql, (count, total, maximum) in statistics.items():
+            entry = self._statistics.setdefault(sql, [0, 0.0, 0.0])
+            entry[0] += count
+            entry[1] += total
+            entry[2] = max(entry[2], maximum)
+
+    def getStatistics(self):
+        """
+            Return a dictionary of the number of times each query was executed and the total
+            and maximum execution times in seconds. Times exclude fetching the rows after the
+            first.
+        """
+        statistics = {}
+        sources = [self._statistics]
+        if self._reader is not None:
+            sources.append(self._reader.getStatistics())
+        for source in sources:
+            for sql, (count, total, maximum) in source.items():
+                entry = statistics.setdefault(sql, {"count" : 0, "total" : 0.0, "max" : 0.0})
+                entry["count"] += count
+                entry["total"] += total
+                entry["max"] = max(entry["max"], maximum)
+        return statistics
+
+    def resetStatistics(self):
+        self._statistics = {}
+        if self._reader is not None:
+            self._reader.getStatistics().clear()
+
+_managers = {}
+
+def getConnectionManager(rootFolder=None):
+    """ Return the connection manager for the database in the workbench folder """
+    path = getDatabasePath(rootFolder)
+    if path not in _managers:
+        _managers[path] = ConnectionManager(path)
+    return _managers[path]
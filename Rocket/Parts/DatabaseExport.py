@@ -0,0 +1,174 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Export of the parts database as SQL dumps and snapshots"""
+
+__title__ = "FreeCAD Rocket Parts Database Export"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import gzip
+import sqlite3
+
+from Rocket.Parts.Exceptions import ExportError
+from Rocket.Parts.Utilities import _msg
+
+COMPRESSION_NONE = "none"
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_ZSTD = "zstd"
+
+BUFFER_SIZE = 1024 * 1024
+SNAPSHOT_PAGES = 1024 # Pages copied per step of the backup
+
+def compressionFromPath(path):
+    """ Return the compression implied by the file extension """
+    if path.endswith(".gz"):
+        return COMPRESSION_GZIP
+    if path.endswith(".zst"):
+        return COMPRESSION_ZSTD
+    return COMPRESSION_NONE
+
+def _openZstd(path):
+    try:
+        # Part of the standard library from Python 3.14
+        from compression import zstd
+        return zstd.open(path, "wt", encoding="utf-8")
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        raise ExportError("zstd compression requires Python 3.14 or the zstandard package")
+    return zstandard.open(path, "wt", encoding="utf-8")
+
+def openDump(path, compression=None):
+    """ Open a text stream for writing a dump, compressed as specified or by the file extension """
+    if compression is None:
+        compression = compressionFromPath(path)
+
+    if compression == COMPRESSION_GZIP:
+        return gzip.open(path, "wt", encoding="utf-8")
+    if compression == COMPRESSION_ZSTD:
+        return _openZstd(path)
+    if compression == COMPRESSION_NONE:
+        return open(path, "w", encoding="utf-8", buffering=BUFFER_SIZE)
+    raise ExportError("Unknown compression '%s'" % compression)
+
+def _quoteName(name):
+    return '"%s"' % name.replace('"', '""')
+
+def iterDump(connection, tables=None):
+    """
+        Generate the SQL statements that recreate the database, in the same form as
+        Connection.iterdump(). When a list of tables is given, only those tables and their
+        indexes are dumped, and each table is dropped first so the dump can be applied to an
+        existing database.
+    """
+    cursor = connection.cursor()
+    cursor.execute("""SELECT name, sql FROM sqlite_master
+                    WHERE sql NOT NULL AND type == 'table' AND name NOT LIKE 'sqlite_%'
+                    ORDER BY name""")
+    schema = [(row[0], row[1]) for row in cursor.fetchall()]
+
+    # Virtual tables such as the search index are recreated from their rows, and create their
+    # own shadow tables
+    virtual = [name for name, sql in schema if sql.upper().startswith("CREATE VIRTUAL TABLE")]
+    schema = [(name, sql) for name, sql in schema
+                if not any(name.startswith(table + "_") for table in virtual)]
+    if tables is not None:
+        schema = [(name, sql) for name, sql in schema if name in tables]
+
+    yield "BEGIN TRANSACTION;"
+    for name, sql in schema:
+        if tables is not None:
+            yield "DROP TABLE IF EXISTS %s;" % _quoteName(name)
+        yield "%s;" % sql
+
+        # Let SQLite format the values, as iterdump() does
+        cursor.execute("PRAGMA table_info(%s)" % _quoteName(name))
+        columns = [_quoteName(row[1]) for row in cursor.fetchall()]
+        target = _quoteName(name)
+        if name in virtual:
+            columns = ["rowid"] + columns
+            target = "%s(%s)" % (target, ",".join(columns))
+        values = "||','||".join(["quote(%s)" % column for column in columns])
+        rows = connection.cursor()
+        rows.execute("SELECT 'INSERT INTO ' || {0} || ' VALUES(' || {1} || ')' FROM {2}".format(
+                        "'%s'" % target.replace("'", "''"), values, _quoteName(name)))
+        for row in rows:
+            yield "%s;" % row[0]
+
+    names = [name for name, sql in schema]
+    cursor.execute("""SELECT tbl_name, sql FROM sqlite_master
+                    WHERE sql NOT NULL AND type IN ('index', 'trigger', 'view')""")
+    for table, sql in cursor.fetchall():
+        if table in names:
+            yield "%s;" % sql
+    yield "COMMIT;"
+
+def dumpDatabase(connection, path, compression=None, tables=None):
+    """ Stream an SQL dump of the database, or of the listed tables, to a file """
+    with openDump(path, compression) as f:
+        f.writelines(line + "\n" for line in iterDump(connection, tables))
+
+def snapshotDatabase(connection, path):
+    """ Copy the database to a new database file using the SQLite online backup API """
+    target = sqlite3.connect(path)
+    try:
+        connection.backup(target, pages=SNAPSHOT_PAGES)
+    finally:
+        target.close()
+
+class DatabaseExport:
+    """
+        Export options for a database update.
+
+        dump - path of an SQL dump to write, compressed according to the extension (.gz or
+            .zst) unless a compression is given
+        tables - list of the tables to dump, or None for the whole database
+        changedOnly - only dump the tables changed by the update. Nothing is written when
+            nothing changed
+        snapshot - path of a binary copy of the database to write
+    """
+
+    def __init__(self, dump=None, compression=None, tables=None, changedOnly=False, snapshot=None):
+        self.dump = dump
+        self.compression = compression
+        self.tables = tables
+        self.changedOnly = changedOnly
+        self.snapshot = snapshot
+
+    def export(self, connection, changed=None):
+        """ Write the export files. changed is the set of tables modified by the update """
+        if self.dump is not None:
+            tables = self.tables
+            if self.changedOnly and changed is not None:
+                if tables is None:
+                    tables = sorted(changed)
+                else:
+                    tables = [table for table in tables if table in changed]
+
+            if tables is not None and len(tables) < 1:
+                _msg("No tables changed, skipping %s" % self.dump)
+            else:
+                dumpDatabase(connection, self.dump, self.compression, tables)
+
+        if self.snapshot is not None:
+            snapshotDatabase(connection, self.snapshot)
@@ -50,3 +50,8 @@ class NotFoundError(Exception):
 
     def __init__(self, message="Unknown material"):
         self._message = message
+
+class ExportError(Exception):
+
+    def __init__(self, message="Unable to export the database"):
+        self._message = message
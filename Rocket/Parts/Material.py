@@ -73,35 +73,18 @@ class Material:
             self.raiseInvalid("Invalid material type '%s'" % self._type)
         self.validateNonNegative(self._density, "Material type invalid")
 
-    def persist(self, connection):
-        cursor = connection.cursor()
-
+    def persist(self, loader):
         # Check to see if an entry exists
-        cursor.execute("SELECT * FROM material WHERE manufacturer=:manufacturer AND material_name=:name AND  type=:type",
-                            {
-                                "manufacturer" : self._manufacturer,
-                                "name" : self._name,
-                                "type" :self._type
-                            })
-        row = cursor.fetchone()
-        if row is not None:
+        entry = loader.materialEntry(self._manufacturer, self._name, self._type)
+        if entry is not None:
             # See if this is a complete duplicate
-            if row['density'] == self._density and row['units'] == self._units:
-                return row['material_index']
+            index, density, units = entry
+            if density == self._density and units == self._units:
+                return index
 
             raise MultipleEntryError("Material database contains multiple entries for manufacturer:'%s' material_name:'%s', type:'%s'" % (self._manufacturer, self._name, self._type))
 
-        cursor.execute("INSERT INTO material(manufacturer, material_name, uuid, type, density, units) VALUES (:manufacturer,:name,:uuid,:type,:density,:units)",
-                            {"manufacturer" : self._manufacturer,
-                             "name" : self._name,
-                             "uuid" : self._uuid,
-                             "type" : self._type,
-                             "density" : self._density,
-                             "units" : self._units})
-        id = cursor.lastrowid
-
-        connection.commit()
-        return id
+        return loader.addMaterial(self._manufacturer, self._name, self._uuid, self._type, self._density, self._units)
 
 def getMaterial(connection, manufacturer, name, type):
     cursor = connection.cursor()
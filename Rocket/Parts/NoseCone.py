@@ -24,10 +24,10 @@ __title__ = "FreeCAD Open Rocket Part Body Tube"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
 
-from Rocket.Parts.Component import Component
+from Rocket.Parts.Component import Component, addRangeCondition, addManufacturerCondition, queryParts
 from Rocket.Constants import TYPE_CONE, TYPE_ELLIPTICAL, TYPE_HAACK, TYPE_OGIVE, TYPE_VON_KARMAN, TYPE_PARABOLA, TYPE_PARABOLIC, TYPE_POWER
 from Rocket.Constants import STYLE_SOLID, STYLE_CAPPED
-from Rocket.Parts.Utilities import _err
+from Rocket.Parts.Utilities import _err, _toMetres
 from Rocket.Parts.Exceptions import MultipleEntryError, NotFoundError
 
 class NoseCone(Component):
@@ -71,34 +71,44 @@ class NoseCone(Component):
             return STYLE_SOLID
         return STYLE_CAPPED
 
-    def persist(self, connection):
+    def persist(self, loader):
         style = self._noseStyle()
 
-        component_id = super().persist(connection)
+        component_id = super().persist(loader)
 
-        cursor = connection.cursor()
-
-        cursor.execute("""INSERT INTO nose (component_index, shape, style, diameter, diameter_units,
-                length, length_units, thickness, thickness_units, shoulder_diameter, shoulder_diameter_units, shoulder_length, shoulder_length_units)
-            VALUES
-                (?,?,?,?,?,?,?,?,?,?,?,?,?)""",
+        return loader.insert("nose", ("component_index", "shape", "style", "diameter", "diameter_units",
+                                "length", "length_units", "thickness", "thickness_units", "shoulder_diameter", "shoulder_diameter_units",
+                                "shoulder_length", "shoulder_length_units",
+                                "diameter_m", "length_m", "shoulder_diameter_m", "shoulder_length_m"),
                             (component_id, self._noseType, style, self._outsideDiameter[0], self._outsideDiameter[1], 
                             self._length[0], self._length[1], self._thickness[0], self._thickness[1],
-                            self._shoulderDiameter[0], self._shoulderDiameter[1], self._shoulderLength[0], self._shoulderLength[1]))
-        id = cursor.lastrowid
-
-        connection.commit()
+                            self._shoulderDiameter[0], self._shoulderDiameter[1], self._shoulderLength[0], self._shoulderLength[1],
+                            _toMetres(*self._outsideDiameter), _toMetres(*self._length),
+                            _toMetres(*self._shoulderDiameter), _toMetres(*self._shoulderLength)))
 
-        return id
+def queryNoseCones(connection, conditions=[], parameters={}, orderBy=None):
+    """ Return a cursor over the nose cones meeting the conditions without fetching the rows """
+    return queryParts(connection, """SELECT nose_index, c.component_index, manufacturer, part_number, description, shape, diameter, diameter_units, length, length_units, 
+                        shoulder_diameter, shoulder_diameter_units, shoulder_length, shoulder_length_units
+                    FROM component c, nose n""", ["n.component_index = c.component_index"] + list(conditions), parameters, orderBy)
 
 def listNoseCones(connection):
-    cursor = connection.cursor()
-
-    cursor.execute("""SELECT nose_index, manufacturer, part_number, description, shape, diameter, diameter_units, length, length_units, 
-                        shoulder_diameter, shoulder_diameter_units, shoulder_length, shoulder_length_units
-                    FROM component c, nose n WHERE n.component_index = c.component_index""")
+    rows = queryNoseCones(connection).fetchall()
+    return rows
 
-    rows = cursor.fetchall()
+def findNoseCones(connection, diameterRange=None, lengthRange=None, shoulderDiameterRange=None, manufacturer=None, shape=None):
+    """ Return the nose cones within the given (minimum, maximum) ranges in metres, as for listNoseCones() """
+    conditions = []
+    parameters = {}
+    addRangeCondition(conditions, parameters, "n.diameter_m", diameterRange)
+    addRangeCondition(conditions, parameters, "n.length_m", lengthRange)
+    addRangeCondition(conditions, parameters, "n.shoulder_diameter_m", shoulderDiameterRange)
+    addManufacturerCondition(conditions, parameters, manufacturer)
+    if shape is not None:
+        conditions.append("n.shape = :shape")
+        parameters["shape"] = shape.lower()
+
+    rows = queryNoseCones(connection, conditions, parameters).fetchall()
     return rows
 
 def getNoseCone(connection, index):
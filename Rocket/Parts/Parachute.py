@@ -25,7 +25,6 @@ __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
 
 from Rocket.Parts.Component import Component
-from Rocket.Parts.Material import getMaterial, getMaterialAnyType
 from Rocket.Parts.Exceptions import MaterialNotFoundError
 
 from Rocket.Constants import MATERIAL_TYPE_LINE
@@ -55,29 +54,22 @@ class Parachute(Component):
         if self._lineMaterial[1].lower() != MATERIAL_TYPE_LINE.lower():
             self.raiseInvalid("Line Material Units invalid '%s" % self._lineMaterial[1])
 
-    def _getLineMaterial(self, connection):
+    def _getLineMaterial(self, loader):
         try:
-            material_index = getMaterial(connection, self._manufacturer, self._lineMaterial[0], self._lineMaterial[1])
+            material_index = loader.getMaterial(self._manufacturer, self._lineMaterial[0], self._lineMaterial[1])
         except MaterialNotFoundError:
             try:
                 print("Unable to find material for '%s':'%s' - setting to any type" % (self._manufacturer, self._lineMaterial[0]))
-                material_index = getMaterialAnyType(connection, self._manufacturer, self._lineMaterial[0])
+                material_index = loader.getMaterialAnyType(self._manufacturer, self._lineMaterial[0])
             except MaterialNotFoundError:
                 print("Unable to find material for '%s':'%s' - setting to unspecified" % (self._manufacturer, self._lineMaterial[0]))
-                material_index = getMaterial(connection, 'unspecified', 'unspecified', self._lineMaterial[1])
+                material_index = loader.getMaterial('unspecified', 'unspecified', self._lineMaterial[1])
 
         return material_index
 
-    def persist(self, connection):
-        component_id = super().persist(connection)
-        material_id = self._getLineMaterial(connection)
+    def persist(self, loader):
+        component_id = super().persist(loader)
+        material_id = self._getLineMaterial(loader)
 
-        cursor = connection.cursor()
-
-        cursor.execute("INSERT INTO parachute (component_index, line_material_index, sides, lines, diameter, diameter_units, line_length, line_length_units) VALUES (?,?,?,?,?,?,?,?)",
+        return loader.insert("parachute", ("component_index", "line_material_index", "sides", "lines", "diameter", "diameter_units", "line_length", "line_length_units"),
                             (component_id, material_id, self._sides, self._lineCount, self._diameter[0], self._diameter[1], self._lineLength[0], self._lineLength[1]))
-        id = cursor.lastrowid
-
-        connection.commit()
-
-        return id
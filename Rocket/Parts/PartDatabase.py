@@ -27,18 +27,33 @@ __url__ = "https://www.davesrocketshop.com"
 import sqlite3
 from os import walk
 import os
-
-import xml.sax
+import hashlib
+from concurrent.futures.process import BrokenProcessPool
 
 import FreeCAD
 import Materials
 
-from Rocket.Parts.PartDatabaseOrcImporter import PartDatabaseOrcImporter
+from Rocket.Parts.PartDatabaseOrcImporter import parseOrcFile
+from Rocket.Parts.BulkLoader import BulkLoader
+from Rocket.Parts.ConnectionManager import getConnectionManager
 from Rocket.Parts.Component import Component
-from Rocket.Parts.Exceptions import NotFoundError
+from Rocket.Parts.Exceptions import NotFoundError, MultipleEntryError
 from Rocket.Parts.Material import listBulkMaterials, updateUuid
-from Rocket.Parts.Utilities import _msg
-
+from Rocket.Parts.Utilities import _msg, _toMetres
+from Rocket.util.ProcessPool import makeProcessPool
+
+# Tables populated from the source files, whose rows are tracked in source_range
+PART_TABLES = ["material", "component", "body_tube", "nose", "transition", "rail_button", "parachute", "streamer"]
+
+# Dimensions stored in metres alongside the original value and units, for range queries.
+# Each entry is (table, column) where the source is column and column_units
+SI_COLUMNS = [
+    ("body_tube", "inner_diameter"), ("body_tube", "outer_diameter"), ("body_tube", "length"),
+    ("nose", "diameter"), ("nose", "length"), ("nose", "shoulder_diameter"), ("nose", "shoulder_length"),
+    ("transition", "fore_outside_diameter"), ("transition", "fore_shoulder_diameter"), ("transition", "aft_outside_diameter"),
+    ("transition", "aft_shoulder_diameter"), ("transition", "length"),
+    ("rail_button", "outer_diameter"), ("rail_button", "inner_diameter"), ("rail_button", "height")
+]
 
 class PartDatabase:
 
@@ -47,13 +62,9 @@ class PartDatabase:
         self._manager = Materials.MaterialManager()
         # self._library = self._manager.createLibrary(self._rootFolder + "/Resources/Material/", "Rocket")
 
-    def getConnection(self, ro=True):
-        # By default get a read only connection
-        if ro:
-            connection = sqlite3.connect("file:" + self._rootFolder + "/Resources/parts/Parts.db?mode=ro", uri=True)
-        else:
-            connection = sqlite3.connect(self._rootFolder + "/Resources/parts/Parts.db")
-        return connection
+    def getConnection(self):
+        # The shared read only connection. Updates go through the connection manager writer
+        return getConnectionManager(self._rootFolder).getConnection()
 
     def getManufacturers(self):
         connection = self.getConnection()
@@ -63,22 +74,27 @@ class PartDatabase:
         except NotFoundError:
             manufacturers = []
 
-        connection.close()
         return manufacturers
 
-    def updateDatabase(self):
-        connection = sqlite3.connect(self._rootFolder + "/Resources/parts/Parts.db")
-        connection.row_factory = sqlite3.Row
-
-        self._createTables(connection)
-        self._importFiles(connection)
-        self._updateMaterials(connection)
-
-        with open('dump.sql', 'w') as f:
-            for line in connection.iterdump():
-                f.write("%s\n" % line)
-
-        connection.close()
+    def updateDatabase(self, workers=None, full=False, export=None):
+        """
+            Update the database from the part files. Only the files that have changed since the
+            last update are imported, unless a full rebuild is requested or required.
+
+            export is an optional DatabaseExport describing the dumps to write once updated.
+        """
+        with getConnectionManager(self._rootFolder).writer() as connection:
+            self._createTables(connection)
+            with BulkLoader(connection) as loader:
+                changed = self._importFiles(loader, workers, full)
+            if "material" in changed:
+                self._updateMaterials(connection)
+            if "component" in changed or "material" in changed:
+                self._updateSearchIndex(connection)
+                changed.add("component_search")
+
+            if export is not None:
+                export.export(connection, changed)
 
     def _createTables(self, connection):
         cursor = connection.cursor()
@@ -102,62 +118,227 @@ class PartDatabase:
                        ON CONFLICT(type) DO NOTHING""")
 
         # cursor.execute("DROP TABLE IF EXISTS body_tube")
-        cursor.execute("CREATE TABLE IF NOT EXISTS body_tube (body_tube_index INTEGER PRIMARY KEY ASC, component_index, tube_type_index, inner_diameter, inner_diameter_units, outer_diameter, outer_diameter_units, length, length_units)")
+        cursor.execute("""CREATE TABLE IF NOT EXISTS body_tube (body_tube_index INTEGER PRIMARY KEY ASC, component_index INTEGER, tube_type_index, inner_diameter, inner_diameter_units, outer_diameter, outer_diameter_units, length, length_units,
+            inner_diameter_m REAL, outer_diameter_m REAL, length_m REAL)""")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_body_tube ON body_tube(component_index, tube_type_index)")
  
         # cursor.execute("DROP TABLE IF EXISTS nose")
-        cursor.execute("""CREATE TABLE IF NOT EXISTS nose (nose_index INTEGER PRIMARY KEY ASC, component_index, shape, style, diameter, diameter_units,
-            length, length_units, thickness, thickness_units, shoulder_diameter, shoulder_diameter_units, shoulder_length, shoulder_length_units)""")
+        cursor.execute("""CREATE TABLE IF NOT EXISTS nose (nose_index INTEGER PRIMARY KEY ASC, component_index INTEGER, shape, style, diameter, diameter_units,
+            length, length_units, thickness, thickness_units, shoulder_diameter, shoulder_diameter_units, shoulder_length, shoulder_length_units,
+            diameter_m REAL, length_m REAL, shoulder_diameter_m REAL, shoulder_length_m REAL)""")
 
         # cursor.execute("DROP TABLE IF EXISTS transition")
-        cursor.execute("""CREATE TABLE IF NOT EXISTS transition (transition_index INTEGER PRIMARY KEY ASC, component_index, shape, style, 
+        cursor.execute("""CREATE TABLE IF NOT EXISTS transition (transition_index INTEGER PRIMARY KEY ASC, component_index INTEGER, shape, style, 
             fore_outside_diameter, fore_outside_diameter_units, fore_shoulder_diameter, fore_shoulder_diameter_units, fore_shoulder_length, fore_shoulder_length_units,
             aft_outside_diameter, aft_outside_diameter_units, aft_shoulder_diameter, aft_shoulder_diameter_units, aft_shoulder_length, aft_shoulder_length_units,
-            length, length_units, thickness, thickness_units)""")
+            length, length_units, thickness, thickness_units,
+            fore_outside_diameter_m REAL, fore_shoulder_diameter_m REAL, aft_outside_diameter_m REAL, aft_shoulder_diameter_m REAL, length_m REAL)""")
  
         # cursor.execute("DROP TABLE IF EXISTS rail_button")
-        cursor.execute("""CREATE TABLE IF NOT EXISTS rail_button (rail_button_index INTEGER PRIMARY KEY ASC, component_index, finish, outer_diameter, outer_diameter_units,
+        cursor.execute("""CREATE TABLE IF NOT EXISTS rail_button (rail_button_index INTEGER PRIMARY KEY ASC, component_index INTEGER, finish, outer_diameter, outer_diameter_units,
                 inner_diameter, inner_diameter_units, height, height_units, base_height, base_height_units, flange_height, flange_height_units, screw_height, screw_height_units,
-                drag_coefficient, screw_mass, screw_mass_units, nut_mass, nut_mass_units, screw_diameter, screw_diameter_units, countersink_diameter, countersink_diameter_units, countersink_angle)""")
+                drag_coefficient, screw_mass, screw_mass_units, nut_mass, nut_mass_units, screw_diameter, screw_diameter_units, countersink_diameter, countersink_diameter_units, countersink_angle,
+                outer_diameter_m REAL, inner_diameter_m REAL, height_m REAL)""")
 
         # cursor.execute("DROP TABLE IF EXISTS parachute")
-        cursor.execute("CREATE TABLE IF NOT EXISTS parachute (parachute_index INTEGER PRIMARY KEY ASC, component_index, line_material_index, sides, lines, diameter, diameter_units, line_length, line_length_units)")
+        cursor.execute("CREATE TABLE IF NOT EXISTS parachute (parachute_index INTEGER PRIMARY KEY ASC, component_index INTEGER, line_material_index, sides, lines, diameter, diameter_units, line_length, line_length_units)")
             
         # cursor.execute("DROP TABLE IF EXISTS streamer")
-        cursor.execute("CREATE TABLE IF NOT EXISTS streamer (streamer_index INTEGER PRIMARY KEY ASC, component_index, length, length_units, width, width_units, thickness, thickness_units)")
+        cursor.execute("CREATE TABLE IF NOT EXISTS streamer (streamer_index INTEGER PRIMARY KEY ASC, component_index INTEGER, length, length_units, width, width_units, thickness, thickness_units)")
+
+        # Source files with the ranges of rows they created, for incremental updates
+        cursor.execute("CREATE TABLE IF NOT EXISTS source_file (source_file_index INTEGER PRIMARY KEY ASC, path UNIQUE, hash)")
+        cursor.execute("CREATE TABLE IF NOT EXISTS source_range (source_range_index INTEGER PRIMARY KEY ASC, source_file_index, table_name, first_index, last_index)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_source_range ON source_range(source_file_index)")
+
+        self._addSIColumns(connection)
+
+        # Joins from the component table, and covering indexes for the dimensional searches. The
+        # join indexes are only used when component_index has integer affinity, which requires
+        # the database to be created from scratch
+        for table in ["nose", "transition", "rail_button", "parachute", "streamer"]:
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_{0}_component ON {0}(component_index)".format(table))
+        cursor.execute("""CREATE INDEX IF NOT EXISTS idx_body_tube_dimensions
+                       ON body_tube(outer_diameter_m, inner_diameter_m, length_m, tube_type_index, component_index)""")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_nose_dimensions ON nose(diameter_m, length_m, shoulder_diameter_m, component_index)")
+        cursor.execute("""CREATE INDEX IF NOT EXISTS idx_transition_dimensions
+                       ON transition(fore_outside_diameter_m, aft_outside_diameter_m, length_m, component_index)""")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_rail_button_dimensions ON rail_button(outer_diameter_m, inner_diameter_m, height_m, component_index)")
+
+        connection.commit()
 
+    def _updateSearchIndex(self, connection):
+        """ Rebuild the full text search index used by the component lookup """
+        cursor = connection.cursor()
+        try:
+            cursor.execute("""CREATE VIRTUAL TABLE IF NOT EXISTS component_search
+                           USING fts5(manufacturer, part_number, description, material_name, prefix='1 2 3')""")
+        except sqlite3.OperationalError:
+            _msg("Full text search is not available, skipping the search index")
+            return
+
+        cursor.execute("DELETE FROM component_search")
+        cursor.execute("""INSERT INTO component_search(rowid, manufacturer, part_number, description, material_name)
+                       SELECT c.component_index, c.manufacturer, c.part_number, c.description, m.material_name
+                       FROM component c LEFT JOIN material m ON c.material_index = m.material_index""")
         connection.commit()
 
-    def _importFiles(self, connection):
-        # Import files with initial definitions, or corrections to incomplete definitions
+    def _addSIColumns(self, connection):
+        """ Add the SI columns to databases created without them, converting the existing rows """
+        cursor = connection.cursor()
+        for table, column in SI_COLUMNS:
+            cursor.execute("PRAGMA table_info({0})".format(table))
+            if (column + "_m") in [row[1] for row in cursor.fetchall()]:
+                continue
+
+            cursor.execute("ALTER TABLE {0} ADD COLUMN {1}_m REAL".format(table, column))
+            cursor.execute("SELECT {0}_index, {1}, {1}_units FROM {0}".format(table, column))
+            values = [(_toMetres(row[1], row[2]), row[0]) for row in cursor.fetchall()]
+            cursor.executemany("UPDATE {0} SET {1}_m = ? WHERE {0}_index = ?".format(table, column), values)
+
+    def _sourceFiles(self):
+        # Files with initial definitions, or corrections to incomplete definitions, come first
+        files = []
         for (dirpath, dirnames, filenames) in walk(self._rootFolder + "/Resources/parts/workbench/"):
             for file in filenames:
-                self._importOrcPartFile(connection, dirpath + file)
+                files.append(dirpath + file)
 
         for (dirpath, dirnames, filenames) in walk(self._rootFolder + "/Resources/parts/openrocket-dbcook/orc/"):
-            self._importOrcPartFile(connection, dirpath + 'generic_materials.orc')
+            files.append(dirpath + 'generic_materials.orc')
             for file in filenames:
-                self._importOrcPartFile(connection, dirpath + file)
+                files.append(dirpath + file)
 
         for (dirpath, dirnames, filenames) in walk(self._rootFolder + "/Resources/parts/openrocket-openrocket/"):
             for file in filenames:
-                self._importOrcPartFile(connection, dirpath + file)
+                files.append(dirpath + file)
 
-    def _importOrcPartFile(self, connection, filename):
-        _msg("Importing %s..." % filename)
+        # Files listed more than once are only imported the first time
+        return list(dict.fromkeys(files))
 
-        # create an XMLReader
-        parser = xml.sax.make_parser()
+    def _sourcePath(self, filename):
+        return os.path.relpath(filename, self._rootFolder).replace(os.sep, "/")
 
-        # turn off namespaces
-        parser.setFeature(xml.sax.handler.feature_namespaces, 0)
+    def _hash(self, filename):
+        with open(filename, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
 
-        # override the default ContextHandler
-        handler = PartDatabaseOrcImporter(connection, filename)
-        parser.setContentHandler(handler)
-        parser.parse(filename)
+    def _getSources(self, connection):
+        """ Return a dictionary of path : (source_file_index, hash) """
+        cursor = connection.cursor()
+        cursor.execute("SELECT source_file_index, path, hash FROM source_file")
+        return {row[1] : (row[0], row[2]) for row in cursor.fetchall()}
 
-    def _importRktPartFile(self, connection, filename):
+    def _sharesMaterials(self, connection, index):
+        """ True if parts imported from other files use the materials imported from this one """
+        cursor = connection.cursor()
+        cursor.execute("""SELECT EXISTS (SELECT 1 FROM source_range m, component c
+                            WHERE m.source_file_index = :index AND m.table_name = 'material'
+                                AND c.material_index BETWEEN m.first_index AND m.last_index
+                                AND NOT EXISTS (SELECT 1 FROM source_range r WHERE r.source_file_index = :index
+                                    AND r.table_name = 'component' AND c.component_index BETWEEN r.first_index AND r.last_index))
+                        OR EXISTS (SELECT 1 FROM source_range m, parachute p
+                            WHERE m.source_file_index = :index AND m.table_name = 'material'
+                                AND p.line_material_index BETWEEN m.first_index AND m.last_index
+                                AND NOT EXISTS (SELECT 1 FROM source_range r WHERE r.source_file_index = :index
+                                    AND r.table_name = 'parachute' AND p.parachute_index BETWEEN r.first_index AND r.last_index))""",
+                       {"index" : index})
+        return bool(cursor.fetchone()[0])
+
+    def _removeSource(self, connection, index):
+        """ Delete the rows imported from a source file, returning the tables changed """
+        tables = set(["source_file", "source_range"])
+        cursor = connection.cursor()
+        cursor.execute("SELECT table_name, first_index, last_index FROM source_range WHERE source_file_index = :index",
+                       {"index" : index})
+        for table, first, last in cursor.fetchall():
+            if table in PART_TABLES:
+                cursor.execute("DELETE FROM {0} WHERE {0}_index BETWEEN :first AND :last".format(table),
+                               {"first" : first, "last" : last})
+                tables.add(table)
+        cursor.execute("DELETE FROM source_range WHERE source_file_index = :index", {"index" : index})
+        cursor.execute("DELETE FROM source_file WHERE source_file_index = :index", {"index" : index})
+        return tables
+
+    def _clearParts(self, connection):
+        """ Delete all the imported rows, returning the tables changed """
+        tables = PART_TABLES + ["source_range", "source_file"]
+        cursor = connection.cursor()
+        for table in tables:
+            cursor.execute("DELETE FROM {0}".format(table))
+        return set(tables)
+
+    def _recordSource(self, loader, filename, hash, ranges):
+        index = loader.insert("source_file", ("path", "hash"), (self._sourcePath(filename), hash))
+        for table, (first, last) in ranges.items():
+            loader.insert("source_range", ("source_file_index", "table_name", "first_index", "last_index"),
+                          (index, table, first, last))
+
+    def _importFiles(self, loader, workers=None, full=False):
+        """ Import the new and changed files, returning the set of tables changed """
+        connection = loader.connection
+        files = self._sourceFiles()
+        hashes = {filename : self._hash(filename) for filename in files}
+        sources = self._getSources(connection)
+        paths = {self._sourcePath(filename) : filename for filename in files}
+
+        changed = [filename for filename in files if sources.get(self._sourcePath(filename), (None, None))[1] != hashes[filename]]
+        removed = [path for path in sources if path not in paths or paths[path] in changed]
+        if not full:
+            if len(sources) == 0 and connection.execute("SELECT EXISTS (SELECT 1 FROM component)").fetchone()[0]:
+                # Created before files were tracked
+                full = True
+            elif any(self._sharesMaterials(connection, sources[path][0]) for path in removed):
+                # Removing the materials would leave other files' parts referring to them
+                full = True
+
+        if full:
+            tables = self._clearParts(connection)
+        else:
+            tables = set()
+            for filename in files:
+                if filename not in changed:
+                    _msg("Skipping %s, unchanged" % filename)
+            for path in removed:
+                tables.update(self._removeSource(connection, sources[path][0]))
+            files = changed
+        loader.reload()
+
+        if workers is None:
+            workers = min(os.cpu_count() or 1, len(files))
+
+        # Files are parsed in parallel, but persisted in order by this process so that the
+        # database is the same as a serial build
+        done = 0
+        pool = makeProcessPool(workers) if workers > 1 else None
+        if pool is not None:
+            try:
+                with pool:
+                    for filename, parts in zip(files, pool.map(parseOrcFile, files)):
+                        tables.update(self._persistParts(loader, filename, hashes[filename], parts))
+                        done += 1
+            except BrokenProcessPool:
+                _msg("Unable to start the worker processes, importing the remaining files serially")
+
+        for filename in files[done:]:
+            tables.update(self._persistParts(loader, filename, hashes[filename], parseOrcFile(filename)))
+        return tables
+
+    def _persistParts(self, loader, filename, hash, parts):
+        _msg("Importing %s..." % filename)
+        loader.beginFile(filename)
+        for part in parts:
+            try:
+                part.persist(loader)
+            except MultipleEntryError:
+                pass
+        ranges = loader.getRanges()
+        self._recordSource(loader, filename, hash, ranges)
+
+        # Each file is written as a single transaction
+        loader.endFile()
+        return set(ranges.keys()) | set(["source_file", "source_range"])
+
+    def _importRktPartFile(self, loader, filename):
         pass
 
     def _updateMaterials(self, connection):
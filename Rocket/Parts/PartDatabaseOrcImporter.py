@@ -28,6 +28,7 @@ from pathlib import PurePath
 
 import xml.sax
 
+from Rocket.Importer.SaxHandler import ElementHandler
 from Rocket.Parts.Utilities import _msg, _err, _toFloat, _toBoolean, _toInt
 from Rocket.Parts.BodyTube import BodyTube
 from Rocket.Parts.Bulkhead import Bulkhead
@@ -42,17 +43,17 @@ from Rocket.Parts.Streamer import Streamer
 from Rocket.Parts.Transition import Transition
 from Rocket.Parts.RailButton import RailButton
 
-from Rocket.Parts.Exceptions import InvalidError, MultipleEntryError, UnknownManufacturerError
+from Rocket.Parts.Exceptions import InvalidError, UnknownManufacturerError
 
 from Rocket.Constants import TYPE_CONE, TYPE_ELLIPTICAL, TYPE_HAACK, TYPE_OGIVE, TYPE_PARABOLA, TYPE_POWER
 from Rocket.Constants import MATERIAL_TYPE_BULK, MATERIAL_TYPE_LINE, MATERIAL_TYPE_SURFACE
 
 class Element:
 
-    def __init__(self, parent, tag, attributes, connection, filename, line):
+    def __init__(self, parent, tag, attributes, records, filename, line):
         self._tag = tag
         self._parent = parent
-        self._connection = connection
+        self._records = records
         self._filename = filename
         self._line = line
         
@@ -88,19 +89,19 @@ class Element:
         if not _tag in self._validChildren:
             print("Invalid element %s" % tag)
             return None
-        return self._validChildren[_tag](self, tag, attributes, self._connection, filename, line)
+        return self._validChildren[_tag](self, tag, attributes, self._records, filename, line)
 
 class RootElement(Element):
 
-    def __init__(self, parent, tag, attributes, connection, filename, line):
-        super().__init__(parent, tag, attributes, connection, filename, line)
+    def __init__(self, parent, tag, attributes, records, filename, line):
+        super().__init__(parent, tag, attributes, records, filename, line)
 
         self._validChildren = {'openrocketcomponent' : OpenRocketComponentElement}
 
 class OpenRocketComponentElement(Element):
 
-    def __init__(self, parent, tag, attributes, connection, filename, line):
-        super().__init__(parent, tag, attributes, connection, filename, line)
+    def __init__(self, parent, tag, attributes, records, filename, line):
+        super().__init__(parent, tag, attributes, records, filename, line)
 
         self._validChildren = { 'materials' : MaterialsElement,
                                 'components' : ComponentsElement
@@ -120,8 +121,8 @@ class OpenRocketComponentElement(Element):
 
 class MaterialsElement(Element):
 
-    def __init__(self, parent, tag, attributes, connection, filename, line):
-        super().__init__(parent, tag, attributes, connection, filename, line)
+    def __init__(self, parent, tag, attributes, records, filename, line):
+        super().__init__(parent, tag, attributes, records, filename, line)
 
         self._validChildren = { 'material' : MaterialElement,
                                 'components' : ComponentsElement
@@ -132,8 +133,8 @@ class MaterialsElement(Element):
 
 class MaterialElement(Element):
 
-    def __init__(self, parent, tag, attributes, connection, filename, line):
-        super().__init__(parent, tag, attributes, connection, filename, line)
+    def __init__(self, parent, tag, attributes, records, filename, line):
+        super().__init__(parent, tag, attributes, records, filename, line)
 
         self._validChildren = {}
         self._knownTags = ["name", "type", "density", "thickness"] # TODO: Support thickness
@@ -222,28 +223,26 @@ class MaterialElement(Element):
         obj._density = self._density
         obj._units = self._units
 
-    def persist(self, obj):
+    def record(self, obj):
         try:
             obj.validate()
-            obj.persist(self._connection)
+            self._records.append(obj)
         except InvalidError as e:
             print("Error in %s at line %s" % (self._filename, str(self._line)))
             # print ("Invalid %s: name %s %s" % (self.__class__.__name__, e._name, e._message))
-        except MultipleEntryError:
-            pass
 
     def end(self):
         obj = Material()
 
         self.setValues(obj)
-        self.persist(obj)
+        self.record(obj)
 
         return super().end()
 
 class ComponentsElement(Element):
 
-    def __init__(self, parent, tag, attributes, connection, filename, line):
-        super().__init__(parent, tag, attributes, connection, filename, line)
+    def __init__(self, parent, tag, attributes, records, filename, line):
+        super().__init__(parent, tag, attributes, records, filename, line)
 
         self._validChildren = { 'bodytube' : BodyTubeElement,
                                 'tubecoupler' : BodyTubeElement,
@@ -260,8 +259,8 @@ class ComponentsElement(Element):
 
 class ComponentElement(Element):
 
-    def __init__(self, parent, tag, attributes, connection, filename, line):
-        super().__init__(parent, tag, attributes, connection, filename, line)
+    def __init__(self, parent, tag, attributes, records, filename, line):
+        super().__init__(parent, tag, attributes, records, filename, line)
 
         self._validChildren = {}
         self._knownTags = ["manufacturer", "partnumber", "description", "material", "mass"]
@@ -373,13 +372,13 @@ class ComponentElement(Element):
     def end(self):
         return super().end()
 
-    def persist(self, obj, connection):
-        obj.persist(connection)
+    def record(self, obj):
+        self._records.append(obj)
 
 class BodyTubeElement(ComponentElement):
 
-    def __init__(self, parent, tag, attributes, connection, filename, line):
-        super().__init__(parent, tag, attributes, connection, filename, line)
+    def __init__(self, parent, tag, attributes, records, filename, line):
+        super().__init__(parent, tag, attributes, records, filename, line)
 
         self._knownTags = self._knownTags + ["insidediameter", "outsidediameter", "length"]
 
@@ -433,14 +432,14 @@ class BodyTubeElement(ComponentElement):
 
         self.setValues(obj)
         self.validate(obj)
-        self.persist(obj, self._connection)
+        self.record(obj)
 
         return super().end()
 
 class BulkheadElement(ComponentElement):
 
-    def __init__(self, parent, tag, attributes, connection, filename, line):
-        super().__init__(parent, tag, attributes, connection, filename, line)
+    def __init__(self, parent, tag, attributes, records, filename, line):
+        super().__init__(parent, tag, attributes, records, filename, line)
 
         # The 'filled' tag is recognized but not used
         self._knownTags = self._knownTags + ["filled", "outsidediameter", "length"]
@@ -477,14 +476,14 @@ class BulkheadElement(ComponentElement):
 
         self.setValues(obj)
         self.validate(obj)
-        self.persist(obj, self._connection)
+        self.record(obj)
 
         return super().end()
 
 class TransitionElement(ComponentElement):
 
-    def __init__(self, parent, tag, attributes, connection, filename, line):
-        super().__init__(parent, tag, attributes, connection, filename, line)
+    def __init__(self, parent, tag, attributes, records, filename, line):
+        super().__init__(parent, tag, attributes, records, filename, line)
 
         self._knownTags = self._knownTags + ["filled", "shape", "foreoutsidediameter", "foreshoulderdiameter", "foreshoulderlength", 
             "aftoutsidediameter", "aftshoulderdiameter", "aftshoulderlength", "length", "thickness"]
@@ -575,14 +574,14 @@ class TransitionElement(ComponentElement):
 
         self.setValues(obj)
         self.validate(obj)
-        self.persist(obj, self._connection)
+        self.record(obj)
 
         return super().end()
 
 class ParachuteElement(ComponentElement):
 
-    def __init__(self, parent, tag, attributes, connection, filename, line):
-        super().__init__(parent, tag, attributes, connection, filename, line)
+    def __init__(self, parent, tag, attributes, records, filename, line):
+        super().__init__(parent, tag, attributes, records, filename, line)
 
         self._knownTags = self._knownTags + ["diameter", "sides", "linecount", "linelength", "linematerial",
                                              "finish", "cg", "dragcoefficient", "packeddiameter", "packedlength", "thickness"]
@@ -633,14 +632,14 @@ class ParachuteElement(ComponentElement):
 
         self.setValues(obj)
         self.validate(obj)
-        self.persist(obj, self._connection)
+        self.record(obj)
 
         return super().end()
 
 class StreamerElement(ComponentElement):
 
-    def __init__(self, parent, tag, attributes, connection, filename, line):
-        super().__init__(parent, tag, attributes, connection, filename, line)
+    def __init__(self, parent, tag, attributes, records, filename, line):
+        super().__init__(parent, tag, attributes, records, filename, line)
 
         self._knownTags = self._knownTags + ["length", "width", "thickness"]
 
@@ -682,14 +681,14 @@ class StreamerElement(ComponentElement):
 
         self.setValues(obj)
         self.validate(obj)
-        self.persist(obj, self._connection)
+        self.record(obj)
 
         return super().end()
 
 class NoseConeElement(ComponentElement):
 
-    def __init__(self, parent, tag, attributes, connection, filename, line):
-        super().__init__(parent, tag, attributes, connection, filename, line)
+    def __init__(self, parent, tag, attributes, records, filename, line):
+        super().__init__(parent, tag, attributes, records, filename, line)
 
         self._knownTags = self._knownTags + ["filled", "shape", "foreoutsidediameter", "foreshoulderdiameter", "foreshoulderlength", 
             "aftoutsidediameter", "aftshoulderdiameter", "aftshoulderlength", "length", "thickness"]
@@ -772,14 +771,14 @@ class NoseConeElement(ComponentElement):
 
         self.setValues(obj)
         self.validate(obj)
-        self.persist(obj, self._connection)
+        self.record(obj)
 
         return super().end()
 
 class RailButtonElement(ComponentElement):
 
-    def __init__(self, parent, tag, attributes, connection, filename, line):
-        super().__init__(parent, tag, attributes, connection, filename, line)
+    def __init__(self, parent, tag, attributes, records, filename, line):
+        super().__init__(parent, tag, attributes, records, filename, line)
 
         self._knownTags = self._knownTags + ["finish", "outerdiameter", "innerdiameter", "height", "baseheight", 
             "flangeheight", "screwheight", "dragcoefficient", "screwmass", "nutmass", "screwdiameter", "countersinkdiameter",
@@ -879,39 +878,33 @@ class RailButtonElement(ComponentElement):
 
         self.setValues(obj)
         self.validate(obj)
-        self.persist(obj, self._connection)
+        self.record(obj)
 
         return super().end()
 
-class PartDatabaseOrcImporter(xml.sax.ContentHandler):
-    def __init__(self, connection, filename):
-        super().__init__()
+class PartDatabaseOrcImporter(ElementHandler):
+    """
+        Parses an .orc file into a list of validated parts, in the order they appear in
+        the file. The parts are persisted separately so that files can be parsed in parallel.
+    """
+    def __init__(self, records, filename):
+        super().__init__(RootElement(None, "root", None, records, filename, 0), filename)
         
-        self._connection = connection
-        self._filename = filename
-        self._current = RootElement(None, "root", None, self._connection, filename, 0)
-        self._content = ''
-
-    # Call when an element starts
-    def startElement(self, tag, attributes):
-        loc = self._locator
-        if loc is not None:
-            line = loc.getLineNumber()
-        if self._current.isChildElement(tag):
-            self._current = self._current.createChild(tag, attributes, self._filename, line)
-            self._content = ''
-        else:
-            self._current.handleTag(tag, attributes)
+        self._records = records
 
-    # Call when an elements ends
-    def endElement(self, tag):
-        if self._current.isTag(tag):
-            self._current = self._current.end()
-        else:
-            self._current.handleEndTag(tag, self._content.strip())
-        self._content = ''
+def parseOrcFile(filename):
+    """ Return the parts defined in the file. This runs in the worker processes of a database build """
+    records = []
+
+    # create an XMLReader
+    parser = xml.sax.make_parser()
+
+    # turn off namespaces
+    parser.setFeature(xml.sax.handler.feature_namespaces, 0)
 
+    # override the default ContextHandler
+    handler = PartDatabaseOrcImporter(records, filename)
+    parser.setContentHandler(handler)
+    parser.parse(filename)
 
-    # Call when a character is read
-    def characters(self, content):
-        self._content += content
+    return records
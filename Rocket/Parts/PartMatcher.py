@@ -0,0 +1,199 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Find catalogue parts that mate with the components of a design"""
+
+__title__ = "FreeCAD Rocket Part Matcher"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import numpy as np
+
+from Rocket.Constants import FEATURE_BODY_TUBE, FEATURE_INNER_TUBE, FEATURE_NOSE_CONE, FEATURE_TRANSITION, \
+    FEATURE_RAIL_BUTTON, FEATURE_LAUNCH_LUG
+from Rocket.Parts.Catalogue import getCatalogue
+
+DEFAULT_TOLERANCE = 0.0005 # In metres
+
+MATCH_BODY_TUBE = "Body Tube"
+MATCH_FORE_BODY_TUBE = "Fore Body Tube"
+MATCH_AFT_BODY_TUBE = "Aft Body Tube"
+MATCH_COUPLER = "Tube Coupler"
+MATCH_CENTERING_RING = "Centering Ring"
+MATCH_ENGINE_BLOCK = "Engine Block"
+MATCH_LAUNCH_LUG = "Launch Lug"
+MATCH_NOSE_CONE = "Nose Cone"
+MATCH_RAIL_BUTTON = "Rail Button"
+
+# The catalogue table and tube type searched for each kind of match
+MATCH_TABLES = {
+    MATCH_BODY_TUBE : ("body_tube", "Body Tube"),
+    MATCH_FORE_BODY_TUBE : ("body_tube", "Body Tube"),
+    MATCH_AFT_BODY_TUBE : ("body_tube", "Body Tube"),
+    MATCH_COUPLER : ("body_tube", "Tube Coupler"),
+    MATCH_CENTERING_RING : ("body_tube", "Centering Ring"),
+    MATCH_ENGINE_BLOCK : ("body_tube", "Engine Block"),
+    MATCH_LAUNCH_LUG : ("body_tube", "Launch Lug"),
+    MATCH_NOSE_CONE : ("nose", None),
+    MATCH_RAIL_BUTTON : ("rail_button", None)
+}
+
+def _metres(value):
+    """ Convert a FreeCAD length in mm to metres, or None when it isn't set """
+    value = float(value) / 1000.0
+    if value <= 0.0:
+        return None
+    return value
+
+class PartMatch:
+    """
+        A catalogue part that mates with a design component. The error is the largest
+        difference in metres between the part and the dimensions it has to fit.
+    """
+
+    def __init__(self, component, kind, table, index, manufacturer, partNumber, error):
+        self.component = component
+        self.kind = kind
+        self.table = table
+        self.index = index
+        self.manufacturer = manufacturer
+        self.partNumber = partNumber
+        self.error = error
+
+class PartMatcher:
+    """
+        Finds catalogue parts that fit the components of a design, such as couplers for a body
+        tube, centering rings between a motor mount and its body tube, or a nose cone with a
+        shoulder that fits the tube.
+
+        Components are matched in batches. The fits for every component are collected first,
+        then each catalogue table is searched once for all of them, so matching a whole rocket
+        costs one vectorized search per kind of part rather than one query per component.
+    """
+
+    def __init__(self, catalogue=None, tolerance=DEFAULT_TOLERANCE):
+        if catalogue is None:
+            catalogue = getCatalogue()
+        self._catalogue = catalogue
+        self._tolerance = tolerance
+
+    def matchComponent(self, component, limit=None):
+        return self.matchComponents([component], limit).get(component, [])
+
+    def matchConfiguration(self, configuration, limit=None):
+        return self.matchComponents(configuration.getAllComponents(), limit)
+
+    def matchComponents(self, components, limit=None):
+        """
+            Return a dictionary mapping each component to its matches, best fit first. When
+            specified, limit is the most matches returned of each kind for each component.
+        """
+        batches = {}
+        matches = {}
+        for component in components:
+            if component in matches:
+                continue
+            matches[component] = []
+            for kind, dimensions in self._fits(component):
+                if len(dimensions) > 0:
+                    key = MATCH_TABLES[kind] + (next(iter(dimensions)),)
+                    batches.setdefault(key, []).append((component, kind, dimensions))
+
+        for (table, tubeType, column), requests in batches.items():
+            self._search(self._catalogue.getTable(table), tubeType, column, requests, limit, matches)
+
+        for found in matches.values():
+            found.sort(key=lambda match: (match.kind, match.error))
+        return matches
+
+    def _fits(self, component):
+        """
+            Return the kinds of part that mate with the component, each with a dictionary of
+            the dimensions in metres that the part has to match. The first dimension is the
+            one searched, and is always present.
+        """
+        type = component.Type
+        fits = []
+        if type == FEATURE_BODY_TUBE:
+            outer = _metres(component.getOuterDiameter())
+            inner = _metres(component.getInnerDiameter())
+            fits.append((MATCH_BODY_TUBE, self._dimensions(outer_diameter=outer, inner_diameter=inner)))
+            fits.append((MATCH_COUPLER, self._dimensions(outer_diameter=inner)))
+            fits.append((MATCH_NOSE_CONE, self._dimensions(shoulder_diameter=inner, diameter=outer)))
+            if component.isMotorMount():
+                fits.append((MATCH_ENGINE_BLOCK, self._dimensions(outer_diameter=inner)))
+        elif type == FEATURE_INNER_TUBE:
+            outer = _metres(component.getOuterDiameter())
+            inner = _metres(component.getInnerDiameter())
+            fits.append((MATCH_BODY_TUBE, self._dimensions(outer_diameter=outer, inner_diameter=inner)))
+            parent = component.getParent()
+            if parent is not None and parent.Type == FEATURE_BODY_TUBE:
+                fits.append((MATCH_CENTERING_RING, self._dimensions(outer_diameter=_metres(parent.getInnerDiameter()),
+                                                                    inner_diameter=outer)))
+            if component.isMotorMount():
+                fits.append((MATCH_ENGINE_BLOCK, self._dimensions(outer_diameter=inner)))
+        elif type == FEATURE_NOSE_CONE:
+            fits.append((MATCH_AFT_BODY_TUBE, self._dimensions(outer_diameter=_metres(component.getAftDiameter()),
+                                                               inner_diameter=_metres(component.getAftShoulderDiameter()))))
+        elif type == FEATURE_TRANSITION:
+            fits.append((MATCH_FORE_BODY_TUBE, self._dimensions(outer_diameter=_metres(component.getForeDiameter()),
+                                                                inner_diameter=_metres(component.getForeShoulderDiameter()))))
+            fits.append((MATCH_AFT_BODY_TUBE, self._dimensions(outer_diameter=_metres(component.getAftDiameter()),
+                                                               inner_diameter=_metres(component.getAftShoulderDiameter()))))
+        elif type == FEATURE_RAIL_BUTTON:
+            fits.append((MATCH_RAIL_BUTTON, self._dimensions(outer_diameter=_metres(component._obj.Diameter),
+                                                             inner_diameter=_metres(component._obj.InnerDiameter))))
+        elif type == FEATURE_LAUNCH_LUG:
+            fits.append((MATCH_LAUNCH_LUG, self._dimensions(inner_diameter=_metres(component.getInnerDiameter()),
+                                                            outer_diameter=_metres(component.getOuterDiameter()))))
+        return fits
+
+    def _dimensions(self, **dimensions):
+        """ Drop the dimensions that aren't set, keeping the order they were given in """
+        return {column : value for column, value in dimensions.items() if value is not None}
+
+    def _search(self, table, tubeType, column, requests, limit, matches):
+        """ Find the parts for a batch of requests that all search the same table column """
+        candidates = table.findWithin(column, [dimensions[column] for _, _, dimensions in requests], self._tolerance)
+        if tubeType is not None:
+            typeRows = table.filter(type=tubeType)
+
+        manufacturers = table.getLabels("manufacturer")
+        for (component, kind, dimensions), rows in zip(requests, candidates):
+            if tubeType is not None:
+                rows = rows[np.isin(rows, typeRows, assume_unique=True)]
+
+            # Vectorized check of the remaining dimensions of all the candidates at once
+            error = np.zeros(len(rows))
+            for name, value in dimensions.items():
+                error = np.maximum(error, np.abs(table.data[name][rows] - value))
+            fits = error <= self._tolerance # False where the catalogue dimension is unknown
+            rows = rows[fits]
+            error = error[fits]
+
+            order = np.argsort(error, kind="stable")
+            if limit is not None:
+                order = order[:limit]
+
+            found = matches[component]
+            for row, rowError in zip(rows[order].tolist(), error[order].tolist()):
+                found.append(PartMatch(component, kind, table.name, int(table.data["index"][row]),
+                                       manufacturers[table.data["manufacturer"][row]],
+                                       table.partNumbers[row], rowError))
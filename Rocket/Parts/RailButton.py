@@ -24,9 +24,10 @@ __title__ = "FreeCAD Open Rocket Part Body Tube"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
 
-from Rocket.Parts.Component import Component
+from Rocket.Parts.Component import Component, addRangeCondition, addManufacturerCondition, queryParts
 from Rocket.Constants import STYLE_SOLID, STYLE_CAPPED
 from Rocket.Parts.Exceptions import MultipleEntryError, NotFoundError
+from Rocket.Parts.Utilities import _toMetres
 
 class RailButton(Component):
 
@@ -83,16 +84,13 @@ class RailButton(Component):
             return STYLE_SOLID
         return STYLE_CAPPED
 
-    def persist(self, connection):
-        component_id = super().persist(connection)
+    def persist(self, loader):
+        component_id = super().persist(loader)
 
-        cursor = connection.cursor()
-
-        cursor.execute("""INSERT INTO rail_button (component_index, finish, outer_diameter, outer_diameter_units, inner_diameter, inner_diameter_units, height, height_units,
-                base_height, base_height_units, flange_height, flange_height_units, screw_height, screw_height_units, drag_coefficient, screw_mass, screw_mass_units,
-                nut_mass, nut_mass_units, screw_diameter, screw_diameter_units, countersink_diameter, countersink_diameter_units, countersink_angle)
-            VALUES
-                (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
+        return loader.insert("rail_button", ("component_index", "finish", "outer_diameter", "outer_diameter_units", "inner_diameter", "inner_diameter_units", "height", "height_units",
+                "base_height", "base_height_units", "flange_height", "flange_height_units", "screw_height", "screw_height_units", "drag_coefficient", "screw_mass", "screw_mass_units",
+                "nut_mass", "nut_mass_units", "screw_diameter", "screw_diameter_units", "countersink_diameter", "countersink_diameter_units", "countersink_angle",
+                "outer_diameter_m", "inner_diameter_m", "height_m"),
                             (component_id, self._finish,
                             self._outerDiameter[0], self._outerDiameter[1],
                             self._innerDiameter[0], self._innerDiameter[1],
@@ -105,23 +103,31 @@ class RailButton(Component):
                             self._nutMass[0], self._nutMass[1],
                             self._screwDiameter[0], self._screwDiameter[1],
                             self._countersinkDiameter[0], self._countersinkDiameter[1],
-                            self._countersinkAngle[0]))
-        id = cursor.lastrowid
-
-        connection.commit()
-
-        return id
-
-def listRailButton(connection):
-    cursor = connection.cursor()
+                            self._countersinkAngle[0],
+                            _toMetres(*self._outerDiameter), _toMetres(*self._innerDiameter), _toMetres(*self._height)))
 
-    cursor.execute("""SELECT rail_button_index, manufacturer, part_number, description,
+def queryRailButtons(connection, conditions=[], parameters={}, orderBy=None):
+    """ Return a cursor over the rail buttons meeting the conditions without fetching the rows """
+    return queryParts(connection, """SELECT rail_button_index, c.component_index, manufacturer, part_number, description,
                         finish, outer_diameter, outer_diameter_units, inner_diameter, inner_diameter_units, height, height_units,
                         base_height, base_height_units, flange_height, flange_height_units, screw_height, screw_height_units, drag_coefficient, screw_mass, screw_mass_units,
                         nut_mass, nut_mass_units, screw_diameter, screw_diameter_units, countersink_diameter, countersink_diameter_units, countersink_angle
-                    FROM component c, rail_button b WHERE b.component_index = c.component_index""")
+                    FROM component c, rail_button b""", ["b.component_index = c.component_index"] + list(conditions), parameters, orderBy)
 
-    rows = cursor.fetchall()
+def listRailButton(connection):
+    rows = queryRailButtons(connection).fetchall()
+    return rows
+
+def findRailButtons(connection, odRange=None, idRange=None, heightRange=None, manufacturer=None):
+    """ Return the rail buttons within the given (minimum, maximum) ranges in metres, as for listRailButton() """
+    conditions = []
+    parameters = {}
+    addRangeCondition(conditions, parameters, "b.outer_diameter_m", odRange)
+    addRangeCondition(conditions, parameters, "b.inner_diameter_m", idRange)
+    addRangeCondition(conditions, parameters, "b.height_m", heightRange)
+    addManufacturerCondition(conditions, parameters, manufacturer)
+
+    rows = queryRailButtons(connection, conditions, parameters).fetchall()
     return rows
 
 def getRailButton(connection, index):
@@ -46,15 +46,8 @@ class Streamer(Component):
         self.validateNonEmptyString(self._width[1], "Width Units invalid '%s'" % self._width[1])
         self.validateNonEmptyString(self._thickness[1], "Thickness Units invalid '%s'" % self._thickness[1])
 
-    def persist(self, connection):
-        component_id = super().persist(connection)
+    def persist(self, loader):
+        component_id = super().persist(loader)
 
-        cursor = connection.cursor()
-
-        cursor.execute("INSERT INTO streamer (component_index, length, length_units, width, width_units, thickness, thickness_units) VALUES (?,?,?,?,?,?,?)",
+        return loader.insert("streamer", ("component_index", "length", "length_units", "width", "width_units", "thickness", "thickness_units"),
                             (component_id, self._length[0], self._length[1], self._width[0], self._width[1], self._thickness[0], self._thickness[1]))
-        id = cursor.lastrowid
-
-        connection.commit()
-
-        return id
@@ -24,10 +24,11 @@ __title__ = "FreeCAD Open Rocket Part Transition"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
 
-from Rocket.Parts.Component import Component
+from Rocket.Parts.Component import Component, addRangeCondition, addManufacturerCondition, queryParts
 from Rocket.Constants import TYPE_CONE, TYPE_ELLIPTICAL, TYPE_HAACK, TYPE_OGIVE, TYPE_VON_KARMAN, TYPE_PARABOLA, TYPE_PARABOLIC, TYPE_POWER
 from Rocket.Constants import STYLE_SOLID, STYLE_CAPPED
 from Rocket.Parts.Exceptions import MultipleEntryError, NotFoundError
+from Rocket.Parts.Utilities import _toMetres
 
 class Transition(Component):
 
@@ -81,39 +82,48 @@ class Transition(Component):
             return STYLE_SOLID
         return STYLE_CAPPED
 
-    def persist(self, connection):
+    def persist(self, loader):
         style = self._tranStyle()
 
-        component_id = super().persist(connection)
+        component_id = super().persist(loader)
 
-        cursor = connection.cursor()
-
-        cursor.execute("""INSERT INTO transition (component_index, shape, style, 
-                fore_outside_diameter, fore_outside_diameter_units, fore_shoulder_diameter, fore_shoulder_diameter_units, fore_shoulder_length, fore_shoulder_length_units,
-                aft_outside_diameter, aft_outside_diameter_units, aft_shoulder_diameter, aft_shoulder_diameter_units, aft_shoulder_length, aft_shoulder_length_units,
-                length, length_units, thickness, thickness_units)
-            VALUES
-                (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
+        return loader.insert("transition", ("component_index", "shape", "style",
+                "fore_outside_diameter", "fore_outside_diameter_units", "fore_shoulder_diameter", "fore_shoulder_diameter_units", "fore_shoulder_length", "fore_shoulder_length_units",
+                "aft_outside_diameter", "aft_outside_diameter_units", "aft_shoulder_diameter", "aft_shoulder_diameter_units", "aft_shoulder_length", "aft_shoulder_length_units",
+                "length", "length_units", "thickness", "thickness_units",
+                "fore_outside_diameter_m", "fore_shoulder_diameter_m", "aft_outside_diameter_m", "aft_shoulder_diameter_m", "length_m"),
                     (component_id, self._noseType, style,
                     self._foreOutsideDiameter[0], self._foreOutsideDiameter[1], self._foreShoulderDiameter[0], self._foreShoulderDiameter[1], self._foreShoulderLength[0], self._foreShoulderLength[1],
                     self._aftOutsideDiameter[0], self._aftOutsideDiameter[1], self._aftShoulderDiameter[0], self._aftShoulderDiameter[1], self._aftShoulderLength[0], self._aftShoulderLength[1],
-                    self._length[0], self._length[1], self._thickness[0], self._thickness[1]))
-        id = cursor.lastrowid
-
-        connection.commit()
-
-        return id
-
-def listTransitions(connection):
-    cursor = connection.cursor()
+                    self._length[0], self._length[1], self._thickness[0], self._thickness[1],
+                    _toMetres(*self._foreOutsideDiameter), _toMetres(*self._foreShoulderDiameter),
+                    _toMetres(*self._aftOutsideDiameter), _toMetres(*self._aftShoulderDiameter), _toMetres(*self._length)))
 
-    cursor.execute("""SELECT transition_index, manufacturer, part_number, description,
+def queryTransitions(connection, conditions=[], parameters={}, orderBy=None):
+    """ Return a cursor over the transitions meeting the conditions without fetching the rows """
+    return queryParts(connection, """SELECT transition_index, c.component_index, manufacturer, part_number, description,
                         shape, length, length_units, 
                         fore_outside_diameter, fore_outside_diameter_units, fore_shoulder_diameter, fore_shoulder_diameter_units, fore_shoulder_length, fore_shoulder_length_units,
                         aft_outside_diameter, aft_outside_diameter_units, aft_shoulder_diameter, aft_shoulder_diameter_units, aft_shoulder_length, aft_shoulder_length_units
-                    FROM component c, transition t WHERE t.component_index = c.component_index""")
+                    FROM component c, transition t""", ["t.component_index = c.component_index"] + list(conditions), parameters, orderBy)
 
-    rows = cursor.fetchall()
+def listTransitions(connection):
+    rows = queryTransitions(connection).fetchall()
+    return rows
+
+def findTransitions(connection, foreDiameterRange=None, aftDiameterRange=None, foreShoulderDiameterRange=None,
+                    aftShoulderDiameterRange=None, lengthRange=None, manufacturer=None):
+    """ Return the transitions within the given (minimum, maximum) ranges in metres, as for listTransitions() """
+    conditions = []
+    parameters = {}
+    addRangeCondition(conditions, parameters, "t.fore_outside_diameter_m", foreDiameterRange)
+    addRangeCondition(conditions, parameters, "t.aft_outside_diameter_m", aftDiameterRange)
+    addRangeCondition(conditions, parameters, "t.fore_shoulder_diameter_m", foreShoulderDiameterRange)
+    addRangeCondition(conditions, parameters, "t.aft_shoulder_diameter_m", aftShoulderDiameterRange)
+    addRangeCondition(conditions, parameters, "t.length_m", lengthRange)
+    addManufacturerCondition(conditions, parameters, manufacturer)
+
+    rows = queryTransitions(connection, conditions, parameters).fetchall()
     return rows
 
 def getTransition(connection, index):
@@ -45,6 +45,22 @@ def _trace(className, functionName, message = None):
         else:
             print("%s:%s(%s)\n" % (className, functionName, message))
 
+# Length units used in the part files, in metres
+LENGTH_UNITS = {
+    "m" : 1.0,
+    "cm" : 0.01,
+    "mm" : 0.001,
+    "in" : 0.0254,
+    "ft" : 0.3048
+}
+
+def _toMetres(value, units):
+    """Convert a length to metres, or None when the units are unknown."""
+    scale = LENGTH_UNITS.get(str(units).strip().lower())
+    if scale is None or value is None:
+        return None
+    return float(value) * scale
+
 def _toFloat(input, defaultValue = 0.0):
     if input == '':
         return defaultValue
@@ -27,7 +27,7 @@ __url__ = "https://www.davesrocketshop.com"
 import FreeCAD
 import Materials
 
-from Rocket.Parts.PartDatabase import PartDatabase
+from Rocket.Parts.ConnectionManager import getConnectionManager
 from Rocket.Parts.Material import getUuid
 from Rocket.Parts.Exceptions import MaterialNotFoundError
 
@@ -42,6 +42,7 @@ from Rocket.interfaces.ChangeSource import ChangeSource
 from Rocket.util.Coordinate import Coordinate, ZERO
 from Rocket.events.ComponentChangeEvent import ComponentChangeEvent
 
+from Rocket.ShapeHandlers.ShapeCache import getShapeCache
 from Rocket.Utilities import _err
 
 from DraftTools import translate
@@ -106,8 +107,7 @@ class RocketComponent(RocketComponentShapeless, ChangeSource):
             obj.ViewObject.LineColor = mat.DiffuseColor
 
     def convertMaterial(self, obj, old):
-        database = PartDatabase(FreeCAD.getUserAppDataDir() + "Mod/Rocket/")
-        connection = database.getConnection()
+        connection = getConnectionManager().getConnection()
         try:
             uuid = getUuid(connection, old, MATERIAL_TYPE_BULK)
 
@@ -116,6 +116,15 @@ class RocketComponent(RocketComponentShapeless, ChangeSource):
         except MaterialNotFoundError:
             _err(translate("Rocket", "Material '{}' not found - using default material").format(old))
 
+    def createShapeHandler(self, obj):
+        """ Return the shape handler for the current parameters without changing the object """
+        return None
+
+    def drawShape(self, obj, handler):
+        # Reuse the shape of any component with identical parameters, such as when only the
+        # placement has changed or when the document is reloaded
+        getShapeCache().draw(obj, handler)
+
     """
         Get the characteristic length of the component, for example the length of a body tube
         of the length of the root chord of a fin.  This is used in positioning the component
@@ -27,11 +27,14 @@ __url__ = "https://www.davesrocketshop.com"
 import FreeCAD
 import math
 
+from contextlib import contextmanager
+
 import Ui
 
 from PySide.QtCore import QObject, Signal
 from Rocket.Utilities import _err
 from Rocket.events.ComponentChangeEvent import ComponentChangeEvent
+from Rocket.util.UniqueID import UniqueID
 from Rocket.position import AxialMethod
 
 import Ui.Commands as Commands
@@ -64,6 +67,16 @@ class RocketComponentShapeless():
 
     edited = EditedShape()
 
+    # Properties that don't affect the mass of the component relative to its own origin
+    _NON_MASS_PROPERTIES = ['Placement', 'Shape', 'Label', 'Label2', 'Comment', 'Group', 'Visibility',
+                            'Position', 'AxialMethod', 'AxialOffset', 'AngleOffset', 'RadialReference',
+                            'RadialOffset', 'LocationReference', 'Manufacturer', 'PartNumber',
+                            'Description', 'Texture', 'ExpressionEngine', 'Proxy']
+    # Properties that don't affect the aerodynamics of the component relative to its own origin
+    _NON_AERO_PROPERTIES = _NON_MASS_PROPERTIES + ['ShapeMaterial']
+    _componentMassModID = -1
+    _componentAeroModID = -1
+
     def __init__(self, obj):
         super().__init__()
         self.Type = "RocketComponent"
@@ -315,10 +328,15 @@ class RocketComponentShapeless():
     def moveUp(self):
         # Move the part up in the tree
         if self.getParent() is not None:
-            self.getParent()._moveChildUp(self._obj)
-
-            self.fireComponentChangeEvent(ComponentChangeEvent.TREE_CHANGE)
-            Ui.Commands.CmdRocket.updateRocket()
+            rocket = self._beginRocketEdit()
+            try:
+                self.getParent()._moveChildUp(self._obj)
+
+                self.fireComponentChangeEvent(ComponentChangeEvent.TREE_CHANGE)
+            finally:
+                self._endRocketEdit(rocket)
+            if rocket is None or not rocket.isEventsEnabled():
+                Ui.Commands.CmdRocket.updateRocket()
         # else:
         #     Commands.CmdStage.addToStage(self)
 
@@ -404,10 +422,15 @@ class RocketComponentShapeless():
     def moveDown(self):
         # Move the part up in the tree
         if self.getParent() is not None:
-            self.getParent()._moveChildDown(self._obj)
+            rocket = self._beginRocketEdit()
+            try:
+                self.getParent()._moveChildDown(self._obj)
 
-            self.fireComponentChangeEvent(ComponentChangeEvent.TREE_CHANGE)
-            Ui.Commands.CmdRocket.updateRocket()
+                self.fireComponentChangeEvent(ComponentChangeEvent.TREE_CHANGE)
+            finally:
+                self._endRocketEdit(rocket)
+            if rocket is None or not rocket.isEventsEnabled():
+                Ui.Commands.CmdRocket.updateRocket()
 
     def _moveChildDown(self, obj):
         if hasattr(self._obj, "Group"):
@@ -671,16 +694,20 @@ class RocketComponentShapeless():
             raise Exception(translate("Rocket", "Component: {}  not currently compatible with component: {}")
                             .format(component.Proxy.getName(), self.getName()))
 
-        self._setChild(index, component)
-        component.Proxy.setParent(self)
+        rocket = self._beginRocketEdit()
+        try:
+            self._setChild(index, component)
+            component.Proxy.setParent(self)
 
-        if component.Proxy.getType() == FEATURE_STAGE:
-            self.getRocket().trackStage(component.Proxy)
+            if component.Proxy.getType() == FEATURE_STAGE:
+                self.getRocket().trackStage(component.Proxy)
 
-        self.checkComponentStructure()
-        component.Proxy.checkComponentStructure()
+            self.checkComponentStructure()
+            component.Proxy.checkComponentStructure()
 
-        self.fireAddRemoveEvent(component)
+            self.fireAddRemoveEvent(component)
+        finally:
+            self._endRocketEdit(rocket)
 
     # Removes a child from the rocket component tree.
     # (redirect to the removed-by-component
@@ -696,6 +723,7 @@ class RocketComponentShapeless():
         component.checkComponentStructure()
 
 
+        rocket = self._beginRocketEdit()
         try:
             self._removeChild(component._obj)
             component.setParent(None)
@@ -716,6 +744,8 @@ class RocketComponentShapeless():
             return True
         except ValueError:
             pass
+        finally:
+            self._endRocketEdit(rocket)
         return False
 
     # Returns the position of the child in this components child list, or -1 if the
@@ -826,12 +856,88 @@ class RocketComponentShapeless():
 
         self.fireComponentChangeEvent(type);
 
+    def onChanged(self, obj, prop):
+        # Any change to a property that can affect the mass or aerodynamics of the component
+        # itself invalidates the cached values. Positioning changes are handled by the calculators
+        if prop not in self._NON_MASS_PROPERTIES:
+            self._componentMassModID = UniqueID.next()
+        if prop not in self._NON_AERO_PROPERTIES:
+            self._componentAeroModID = UniqueID.next()
+
+    """
+        Return the mass modification ID of this component. Unlike the rocket level modification
+        IDs, this only changes when the component itself changes in a way that may affect its
+        mass, center of gravity or inertia relative to its own origin.
+    """
+    def getComponentMassModID(self):
+        return self._componentMassModID
+
+    """
+        Return the aerodynamic modification ID of this component. As with the mass ID, this
+        only changes when the component itself changes in a way that may affect its normal
+        force or center of pressure relative to its own origin.
+    """
+    def getComponentAerodynamicModID(self):
+        return self._componentAeroModID
+
     def fireComponentChangeEvent(self, event):
         if self.getParent() is None: # or self._bypassComponentChangeEvent:
             return
 
+        if not isinstance(event, ComponentChangeEvent):
+            event = ComponentChangeEvent(self, event)
         self.getRoot().fireComponentChangeEvent(event)
 
+    # Return the rocket at the root of this component tree, or None if the tree is
+    # not part of a rocket.
+    def _getRootRocket(self):
+        root = self.getRoot()
+        if root.getType() == FEATURE_ROCKET:
+            return root
+        return None
+
+    # Start a rocket edit, so that the events fired while restructuring the tree are
+    # coalesced into a single positioning pass. Must be paired with _endRocketEdit()
+    def _beginRocketEdit(self):
+        rocket = self._getRootRocket()
+        if rocket is not None:
+            rocket.beginEdit()
+        return rocket
+
+    def _endRocketEdit(self, rocket):
+        if rocket is not None:
+            rocket.endEdit()
+
+    """
+        Context manager for editing this component.  Rocket events are deferred until
+        the end of the batch, when the edit is treated as a single change to this
+        component.  This allows properties to be set directly within the batch.  The
+        document is recomputed once on completion, but not if the batch raises an exception.
+        <pre>
+            with component.batch():
+                # do stuff
+        </pre>
+    """
+    @contextmanager
+    def batch(self, recompute=True):
+        rocket = self._getRootRocket()
+        if rocket is not None:
+            rocket.beginBatch()
+        try:
+            yield self
+
+            self.fireComponentChangeEvent(ComponentChangeEvent.BOTH_CHANGE)
+        except BaseException:
+            # Don't rebuild the document from a partly applied edit
+            if rocket is not None:
+                rocket.endBatch(recompute=False)
+            raise
+        if rocket is not None:
+            rocket.endBatch(recompute=False)
+
+        if recompute and (rocket is None or not rocket.isEditing()):
+            self._obj.Document.recompute()
+
     def setAfter(self):
         if self.getParent() is None:
             # Probably initialization order issue.  Ignore for now.
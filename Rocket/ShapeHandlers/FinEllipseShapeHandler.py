@@ -129,6 +129,14 @@ class FinEllipseShapeHandler(FinShapeHandler):
         
         return None
 
+    def _isExtrudable(self):
+        return self._obj.RootCrossSection == FIN_CROSS_SQUARE
+
+    def _makePlanformEdges(self):
+        midChord = float(self._obj.RootChord) / 2.0
+        arc = self._halfEllipseCurve(float(self._obj.Height), midChord, 0.0, midChord)
+        return [arc.toShape()]
+
     def _makeProfiles(self):
         if self._obj.RootCrossSection == FIN_CROSS_TAPER_LETE:
             return self._taperedEllipse()
@@ -482,11 +482,53 @@ class FinShapeHandler:
         fin = self._finOnlyShape(FIN_DEBUG_FULL)
         return Part.makeCompound([fin])
 
-    def _finOnlyShape(self, debug):
-        #
-        # Return the shape of a single fin with no additions, such as fin tabs, fin cans, etc
-        #
-        # This can be used to determine characteristics such as mass, cg, and volume
+    def _isExtrudable(self):
+        # Override this if the fin has a constant thickness and square edges, so it can be drawn
+        # by extruding the planform
+        return False
+
+    def _makePlanformEdges(self):
+        # Override this to return the planform edges above the root, from the root trailing
+        # edge to the root leading edge
+        return []
+
+    def _makePolyline(self, points):
+        edges = []
+        for i in range(len(points) - 1):
+            # Skip zero length segments, such as a zero length tip chord
+            if not points[i].isEqual(points[i + 1], 1e-7):
+                edges.append(Part.LineSegment(points[i], points[i + 1]).toShape())
+        return edges
+
+    def _ttwInPlanform(self):
+        # A tab of the same thickness inside the root chord is extruded with the fin
+        if not self._obj.Ttw:
+            return False
+        fore = float(self._obj.RootChord) - float(self._obj.TtwOffset) - float(self._obj.TtwLength)
+        return fore >= 0.0 and float(self._obj.TtwThickness) == float(self._obj.RootThickness)
+
+    def _makeRootEdges(self, ttw):
+        rootChord = float(self._obj.RootChord)
+        points = [FreeCAD.Vector(0, 0, 0)]
+        if ttw:
+            aft = rootChord - float(self._obj.TtwOffset)
+            fore = aft - float(self._obj.TtwLength)
+            height = -float(self._obj.TtwHeight)
+            points.append(FreeCAD.Vector(fore, 0, 0))
+            points.append(FreeCAD.Vector(fore, 0, height))
+            points.append(FreeCAD.Vector(aft, 0, height))
+            points.append(FreeCAD.Vector(aft, 0, 0))
+        points.append(FreeCAD.Vector(rootChord, 0, 0))
+        return self._makePolyline(points)
+
+    def _makeExtrudedFin(self, ttw=False):
+        thickness = float(self._obj.RootThickness)
+        wire = Part.Wire(self._makeRootEdges(ttw) + self._makePlanformEdges())
+        face = Part.Face(wire)
+        face.translate(FreeCAD.Vector(0, -thickness / 2.0, 0))
+        return face.extrude(FreeCAD.Vector(0, thickness, 0))
+
+    def _makeLoftedFin(self):
         loft = None
         profiles = self._makeProfiles()
         if profiles is not None and len(profiles) > 0:
@@ -507,17 +549,29 @@ class FinShapeHandler:
                 if tip is not None:
                     loft = loft.fuse(tip)
 
-            if loft is not None:
-                mask = self._makeCommon()
-                if debug == FIN_DEBUG_MASK_ONLY:
-                    loft = mask
-                elif mask is not None and (debug != FIN_DEBUG_PROFILE_ONLY):
-                    loft = loft.common(mask)
+        return loft
+
+    def _finOnlyShape(self, debug):
+        #
+        # Return the shape of a single fin with no additions, such as fin tabs, fin cans, etc
+        #
+        # This can be used to determine characteristics such as mass, cg, and volume
+        if self._isExtrudable():
+            loft = self._makeExtrudedFin()
+        else:
+            loft = self._makeLoftedFin()
+
+        if loft is not None:
+            mask = self._makeCommon()
+            if debug == FIN_DEBUG_MASK_ONLY:
+                loft = mask
+            elif mask is not None and (debug != FIN_DEBUG_PROFILE_ONLY):
+                loft = loft.common(mask)
 
-                cut = self._makeCut()
-                if cut is not None:
-                    print("cut")
-                    Part.show(cut)
+            cut = self._makeCut()
+            if cut is not None:
+                print("cut")
+                Part.show(cut)
 
         return loft
 
@@ -542,6 +596,10 @@ class FinShapeHandler:
         return loft
 
     def _drawFinDebug(self, debug):
+        if debug == FIN_DEBUG_FULL and self._isExtrudable() and self._ttwInPlanform() and not self._extendRoot():
+            # Extruding the tab as part of the planform saves a fuse
+            return self._makeExtrudedFin(ttw=True)
+
         fin = self._finOnlyShape(debug)
         if fin is not None:
             if self._extendRoot():
@@ -573,13 +631,16 @@ class FinShapeHandler:
         baseX = 0
         if hasattr(self._obj, "LeadingEdgeOffset"):
             baseX = self._obj.LeadingEdgeOffset
+
+        # Each fin is the same solid at a different location, rather than a transformed copy
+        root = FreeCAD.Placement(FreeCAD.Vector(float(baseX), 0, float(self._obj.ParentRadius) + offset), FreeCAD.Rotation())
+        if self._obj.Cant != 0:
+            cant = FreeCAD.Placement(FreeCAD.Vector(0, 0, 0), FreeCAD.Rotation(FreeCAD.Vector(0,0,1), float(self._obj.Cant)),
+                                     FreeCAD.Vector(float(self._obj.RootChord) / 2, 0, 0))
+            root = root.multiply(cant)
         for i in range(self._obj.FinCount):
-            fin = Part.Shape(base) # Create a copy
-            if self._obj.Cant != 0:
-                fin.rotate(FreeCAD.Vector(self._obj.RootChord / 2, 0, 0), FreeCAD.Vector(0,0,1), self._obj.Cant)
-            fin.translate(FreeCAD.Vector(baseX,0,float(self._obj.ParentRadius) + offset))
-            fin.rotate(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(1,0,0), i * float(self._obj.FinSpacing))
-            fins.append(fin)
+            roll = FreeCAD.Placement(FreeCAD.Vector(0, 0, 0), FreeCAD.Rotation(FreeCAD.Vector(1,0,0), i * float(self._obj.FinSpacing)))
+            fins.append(base.moved(roll.multiply(root)))
 
         return Part.makeCompound(fins)
 
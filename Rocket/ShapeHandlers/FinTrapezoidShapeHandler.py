@@ -24,9 +24,11 @@ __title__ = "FreeCAD Fins"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
 
+import FreeCAD
+
 from DraftTools import translate
     
-from Rocket.Constants import FIN_CROSS_SAME
+from Rocket.Constants import FIN_CROSS_SAME, FIN_CROSS_SQUARE
 
 from Rocket.Utilities import validationError
 
@@ -76,6 +78,26 @@ class FinTrapezoidShapeHandler(FinShapeHandler):
                 return False
         return super().isValidShape()
 
+    def _isExtrudable(self):
+        tipCrossSection = self._obj.TipCrossSection
+        if tipCrossSection == FIN_CROSS_SAME:
+            tipCrossSection = self._obj.RootCrossSection
+
+        tipThickness = float(self._obj.TipThickness)
+        if self._obj.TipSameThickness:
+            tipThickness = float(self._obj.RootThickness)
+
+        return self._obj.RootCrossSection == FIN_CROSS_SQUARE and tipCrossSection == FIN_CROSS_SQUARE \
+            and tipThickness == float(self._obj.RootThickness)
+
+    def _makePlanformEdges(self):
+        sweep = float(self._obj.SweepLength)
+        height = float(self._obj.Height)
+        return self._makePolyline([FreeCAD.Vector(float(self._obj.RootChord), 0, 0),
+                                   FreeCAD.Vector(sweep + float(self._obj.TipChord), 0, height),
+                                   FreeCAD.Vector(sweep, 0, height),
+                                   FreeCAD.Vector(0, 0, 0)])
+
     def _makeProfiles(self):
         profiles = []
         profiles.append(self._makeRootProfile())
@@ -140,6 +140,15 @@ class FinTriangleShapeHandler(FinShapeHandler):
                 return False
         return super().isValidShape()
 
+    def _isExtrudable(self):
+        return self._obj.RootCrossSection == FIN_CROSS_SQUARE
+
+    def _makePlanformEdges(self):
+        height = float(self._obj.Height)
+        return self._makePolyline([FreeCAD.Vector(float(self._obj.RootChord), 0, 0),
+                                   FreeCAD.Vector(self._sweepAtHeight(height), 0, height),
+                                   FreeCAD.Vector(0, 0, 0)])
+
     def _makeProfiles(self):
         profiles = []
         profiles.append(self._makeRootProfile())
@@ -58,10 +58,10 @@ class FinTubeShapeHandler(FinShapeHandler):
     def _drawFinSet(self):
         fins = []
         base = self._drawSingleFin()
+        root = FreeCAD.Placement(FreeCAD.Vector(0,0,float(self._obj.ParentRadius) + float(self._obj.TubeOuterDiameter / 2.0)),
+                                 FreeCAD.Rotation())
         for i in range(self._obj.FinCount):
-            fin = Part.Shape(base) # Create a copy
-            fin.translate(FreeCAD.Vector(0,0,float(self._obj.ParentRadius) + float(self._obj.TubeOuterDiameter / 2.0)))
-            fin.rotate(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(1,0,0), i * float(self._obj.FinSpacing))
-            fins.append(fin)
+            roll = FreeCAD.Placement(FreeCAD.Vector(0, 0, 0), FreeCAD.Rotation(FreeCAD.Vector(1,0,0), i * float(self._obj.FinSpacing)))
+            fins.append(base.moved(roll.multiply(root))) # Shares the geometry of the base fin
 
         return Part.makeCompound(fins)
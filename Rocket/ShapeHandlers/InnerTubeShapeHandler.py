@@ -67,14 +67,12 @@ class InnerTubeShapeHandler(BodyTubeShapeHandler):
             points = self._configuration.getPointsRotated(self._rotation)
 
         for i in range(self._configuration.getClusterCount()):
-            tube = Part.Shape(base) # Create a copy
-
             y = points[2 * i]
             z = points[2 * i + 1]
             y1, z1 = self._translateCenter(y, z)
 
-            tube.translate(FreeCAD.Vector(0,y1,z1))
-            tubes.append(tube)
+            # Locate the base tube rather than copying it, so the cluster shares one solid
+            tubes.append(base.moved(FreeCAD.Placement(FreeCAD.Vector(0,y1,z1), FreeCAD.Rotation())))
 
         return Part.makeCompound(tubes)
 
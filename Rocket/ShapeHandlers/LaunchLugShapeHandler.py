@@ -152,9 +152,8 @@ class LaunchLugShapeHandler(BodyTubeShapeHandler):
         lugs = []
         base = self.drawSingle()
         for i in range(self._instanceCount):
-            lug = Part.Shape(base) # Create a copy
-            lug.translate(FreeCAD.Vector(i * (self._length + self._separation),0,0))
-            lugs.append(lug)
+            # Locate the base lug rather than copying it, so the instances share one solid
+            lugs.append(base.moved(FreeCAD.Placement(FreeCAD.Vector(i * (self._length + self._separation),0,0), FreeCAD.Rotation())))
 
         return Part.makeCompound(lugs)
 
@@ -27,8 +27,11 @@ __url__ = "https://www.davesrocketshop.com"
 import FreeCAD
 import Part
 import math
+import numpy as np
 
+from Rocket.Constants import STYLE_HOLLOW
 from Rocket.ShapeHandlers.NoseShapeHandler import NoseShapeHandler
+from Rocket.ShapeHandlers import ProfileGenerator
     
     
 class NoseBluntedConeShapeHandler(NoseShapeHandler):
@@ -37,6 +40,7 @@ class NoseBluntedConeShapeHandler(NoseShapeHandler):
         super().__init__(obj)
 
         self._offsetRadius = self._radius   # Scratch value, only valid immediately after a call to getCurve()
+        self._blunted = None                # Cached blunted cone dimensions used by getRadius()
 
     def getXt(self, length, radius, noseRadius):
         return math.pow(length, 2) / radius * math.sqrt(math.pow(noseRadius, 2) / (math.pow(radius, 2) + math.pow(length, 2)))
@@ -77,30 +81,56 @@ class NoseBluntedConeShapeHandler(NoseShapeHandler):
         y = math.sqrt(radius * radius - x * x)
         return (x + Xo, y)
 
+    def _radii(self, x):
+        if self._blunted is None:
+            self._blunted = self.getBluntedLength(self._length, self._radius, self._noseRadius)
+        (vLength, Xt, Yt, Xo, Xa) = self._blunted
+
+        # The blunted tip is a spherical cap tangent to the cone
+        shift = self._length - vLength
+        cap = ProfileGenerator.sphere(x, Xo + shift, self._noseRadius)
+        cone = Yt + (self._radius - Yt) * (x - Xt - shift) / (vLength - Xt)
+        return np.where(x < (Xt + shift), cap, cone)
+
     def innerMinor(self, length, radius, offset):
         intercept = radius
         slope = intercept * -1 / (length)
         inner_minor = offset * slope + intercept
         return inner_minor
 
-    def getCurve(self, length, radius, noseRadius, offset=0.0):
+    def _curvePoints(self, length, radius, noseRadius, offset=0.0):
+        """ Return the tangent, middle and tip points of the blunt arc, and the base of the cone """
         (vLength, Xt, Yt, Xo, Xa) = self.getBluntedLength(length, radius, noseRadius)
 
         midX, midY = self.getMidArc(vLength - Xo, vLength - Xt, noseRadius)
-        blunt = Part.Arc(
-            FreeCAD.Vector(length - vLength + Xt + offset, Yt),
-            FreeCAD.Vector(length - midX + offset, midY),
-            FreeCAD.Vector(offset, 0.0)
-        )
+        tangent = FreeCAD.Vector(length - vLength + Xt + offset, Yt)
         self._offsetRadius = radius
         # if offset > 0:
         #     self._offsetRadius = self.innerMinor(vLength, radius, offset)
-        line = Part.LineSegment(FreeCAD.Vector(length, self._offsetRadius), FreeCAD.Vector(length - vLength + Xt + offset, Yt))
+        return (tangent, FreeCAD.Vector(length - midX + offset, midY), FreeCAD.Vector(offset, 0.0),
+                FreeCAD.Vector(length, self._offsetRadius))
+
+    def getCurve(self, length, radius, noseRadius, offset=0.0):
+        tangent, middle, tip, base = self._curvePoints(length, radius, noseRadius, offset)
+
+        blunt = Part.Arc(tangent, middle, tip)
+        line = Part.LineSegment(base, tangent)
         curve = Part.Wire([blunt.toShape(), line.toShape()])
         # curve = Part.Wire([blunt.toShape()])
 
         return curve
 
+    def _inner(self):
+        length = self._length
+        if self._style != STYLE_HOLLOW or self._shoulder:
+            length -= self._thickness
+        tangent, middle, tip, base = self._curvePoints(length, self._radius - self._thickness,
+                                                       self._noseRadius - self._thickness, self._thickness)
+
+        blunt = ProfileGenerator.arc(tangent, middle, tip)
+        line = ProfileGenerator.polyline([tangent.x, base.x], [tangent.y, base.y])
+        return tip.x, lambda x: np.where(x < tangent.x, blunt(x), line(x))
+
     def getOuterCurve(self):
         return self.getCurve(self._length, self._radius, self._noseRadius)
 
@@ -27,11 +27,19 @@ __url__ = "https://www.davesrocketshop.com"
 import FreeCAD
 import Part
 import math
+import numpy as np
 
+from Rocket.Constants import STYLE_HOLLOW
 from Rocket.ShapeHandlers.NoseShapeHandler import NoseShapeHandler
+from Rocket.ShapeHandlers import ProfileGenerator
 
 class NoseBluntedOgiveShapeHandler(NoseShapeHandler):
 
+    def __init__(self, obj):
+        super().__init__(obj)
+
+        self._blunted = None # Cached blunted ogive dimensions used by getRadius()
+
     def getRho(self, radius, length):
         rho = (radius * radius + length * length) / (2.0 * radius)
         return rho
@@ -59,15 +67,8 @@ class NoseBluntedOgiveShapeHandler(NoseShapeHandler):
         return Xo - noseRadius
 
     def getOgiveCurve(self, rho, length, vLength, radius, resolution, min = 0):
-        points = []
-        for i in range(0, resolution):
-            
-            x = float(i) * ((length - min) / float(resolution))
-            y = self.ogive_y(x + (vLength - length), vLength, radius, rho)
-            points.append(FreeCAD.Vector(min + x, y))
-
-        points.append(FreeCAD.Vector(min + length, radius))
-        return points
+        profile = lambda x: np.sqrt(np.maximum(rho * rho - (length - x) ** 2, 0.0)) + radius - rho
+        return ProfileGenerator.curve(profile, length, radius, resolution, min)
             
     def getBluntedLength(self, length, radius, noseRadius):
 
@@ -96,7 +97,18 @@ class NoseBluntedOgiveShapeHandler(NoseShapeHandler):
         x = radius - math.sqrt(radius * radius - y * y)
         return (x, y)
 
-    def getCurve(self, length, radius, noseRadius, offset=0.0):
+    def _radii(self, x):
+        if self._blunted is None:
+            self._blunted = self.getBluntedLength(self._length, self._radius, self._noseRadius)
+        (rho, vLength, Xt, Yt, Xo, Xa) = self._blunted
+
+        # The blunted tip is a spherical cap tangent to the ogive
+        cap = ProfileGenerator.sphere(x, Xo - Xa, self._noseRadius)
+        ogive = np.sqrt(np.maximum(rho * rho - (self._length - x) ** 2, 0.0)) + self._radius - rho
+        return np.where(x < (Xt - Xa), cap, ogive)
+
+    def _curvePoints(self, length, radius, noseRadius, offset=0.0):
+        """ Return the spline poles of the ogive, and the middle and tip points of the blunt arc """
         (rho, vLength, Xt, Yt, Xo, Xa) = self.getBluntedLength(length, radius, noseRadius)
 
         midX, midY = self.getMidArc(Yt, noseRadius)
@@ -106,18 +118,41 @@ class NoseBluntedOgiveShapeHandler(NoseShapeHandler):
             self._offsetRadius = self.innerMinor(vLength, radius, offset)
 
         points = self.getOgiveCurve(rho, length - Xt + Xa, vLength, radius, self._resolution, Xt - Xa + offset)
+        return points, FreeCAD.Vector(midX + offset, midY), FreeCAD.Vector(offset, 0.0)
+
+    def getCurve(self, length, radius, noseRadius, offset=0.0):
+        points, middle, tip = self._curvePoints(length, radius, noseRadius, offset)
+
         ogive = self.makeSpline(points)
         blunt = Part.Arc(
             # FreeCAD.Vector(Xt - Xa + offset, Yt),
             points[0], # Make sure we line up exactly
-            FreeCAD.Vector(midX + offset, midY),
-            FreeCAD.Vector(offset, 0.0)
+            middle,
+            tip
         )
 
         curve = Part.Wire([blunt.toShape(), ogive.toShape()])
 
         return curve
 
+    def _drawnRadius(self, length, radius, noseRadius, offset=0.0):
+        """ Vectorized radius of the curve drawn by getCurve() """
+        points, middle, tip = self._curvePoints(length, radius, noseRadius, offset)
+
+        blunt = ProfileGenerator.arc(points[0], middle, tip)
+        ogive = ProfileGenerator.spline(points)
+        return lambda x: np.where(x < points[0].x, blunt(x), ogive(x))
+
+    def _outer(self):
+        return self._drawnRadius(self._length, self._radius, self._noseRadius)
+
+    def _inner(self):
+        length = self._length - self._thickness
+        if self._style != STYLE_HOLLOW or self._shoulder:
+            length -= self._thickness
+        return self._thickness, self._drawnRadius(length, self._radius - self._thickness,
+                                                  self._noseRadius - self._thickness, self._thickness)
+
     def drawSolid(self):
         outer_curve = self.getCurve(self._length, self._radius, self._noseRadius)
 
@@ -27,11 +27,16 @@ __url__ = "https://www.davesrocketshop.com"
 import FreeCAD
 import Part
 
+from Rocket.Constants import STYLE_HOLLOW
 from Rocket.ShapeHandlers.NoseShapeHandler import NoseShapeHandler
+from Rocket.ShapeHandlers import ProfileGenerator
     
     
 class NoseConeShapeHandler(NoseShapeHandler):
 
+    def _radii(self, x):
+        return ProfileGenerator.cone(x, self._length, self._radius)
+
     def innerMinor(self, x):
         intercept = self._radius - self._thickness
         # slope = intercept * -1 / (offset - self._thickness)
@@ -39,6 +44,14 @@ class NoseConeShapeHandler(NoseShapeHandler):
         inner_minor = x * slope + intercept
         return inner_minor
 
+    def _inner(self):
+        offset = self._length * self._thickness / self._radius
+        if self._style == STYLE_HOLLOW and not self._shoulder:
+            end = (self._length, self._radius - self._thickness)
+        else:
+            end = (self._length - self._thickness, self.innerMinor(self._thickness))
+        return offset, ProfileGenerator.polyline([offset, end[0]], [0.0, end[1]])
+
     def drawSolid(self):
         outer_curve = Part.LineSegment(FreeCAD.Vector(0.0, 0.0), FreeCAD.Vector(self._length, self._radius))
 
@@ -28,7 +28,9 @@ import FreeCAD
 import Part
 import math
 
+from Rocket.Constants import STYLE_HOLLOW
 from Rocket.ShapeHandlers.NoseShapeHandler import NoseShapeHandler
+from Rocket.ShapeHandlers import ProfileGenerator
     
     
 class NoseEllipseShapeHandler(NoseShapeHandler):
@@ -40,7 +42,22 @@ class NoseEllipseShapeHandler(NoseShapeHandler):
 
         inner_minor = (b / a) * math.sqrt(a * a - x * x)
         return inner_minor
+
+    def _radii(self, x):
+        return ProfileGenerator.ellipse(x, self._length, self._radius)
     
+    def _inner(self):
+        if self._style == STYLE_HOLLOW and not self._shoulder:
+            center = self._length
+            major = self._length - self._thickness
+            minor = self._radius - self._thickness
+        else:
+            center = self._length - self._thickness
+            major = self._length - 2 * self._thickness
+            minor = self.innerMinor(self._length - self._thickness)
+        start = center - major
+        return start, lambda x: ProfileGenerator.ellipse(x - start, major, minor)
+
     def _arc(self, x, major, minor):
         if major > minor:
             arc = Part.ArcOfEllipse(Part.Ellipse(FreeCAD.Vector(x, 0), major, minor), math.pi/2, -math.pi)
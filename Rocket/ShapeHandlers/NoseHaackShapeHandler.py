@@ -24,12 +24,13 @@ __title__ = "FreeCAD Haack Nose Shape Handler"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
-import FreeCAD
 import math
 
 from DraftTools import translate
 
+from Rocket.Constants import STYLE_HOLLOW
 from Rocket.ShapeHandlers.NoseShapeHandler import NoseShapeHandler
+from Rocket.ShapeHandlers import ProfileGenerator
 from Rocket.Utilities import validationError
     
 class NoseHaackShapeHandler(NoseShapeHandler):
@@ -51,21 +52,14 @@ class NoseHaackShapeHandler(NoseShapeHandler):
         return  math.acos(1 - 2*x/length);
 
     def haack_y(self, x, length, radius, coefficient):
-        theta = self.theta(x, length)
-        return  radius * math.sqrt(theta - math.sin(2 * theta)/2
-            + coefficient * math.pow(math.sin(theta), 3)) / math.sqrt(math.pi);
+        return float(ProfileGenerator.haack(x, length, radius, coefficient))
 
-    def haack_curve(self, length, radius, resolution, coefficient, min = 0):
-        points = []
-        for i in range(0, resolution):
-            
-            x = float(i) * ((length - min) / float(resolution))
-            y = self.haack_y(x, length, radius, coefficient)
-            # if x > min:
-            points.append(FreeCAD.Vector(min + x, y))
+    def _radii(self, x):
+        return ProfileGenerator.haack(x, self._length, self._radius, self._coefficient)
 
-        points.append(FreeCAD.Vector(length, radius))
-        return points
+    def haack_curve(self, length, radius, resolution, coefficient, min = 0):
+        return ProfileGenerator.curve(lambda x: ProfileGenerator.haack(x, length, radius, coefficient),
+                                      length, radius, resolution, min, end=length)
             
     def findHaackY(self, thickness, length, radius, coefficient):
         min = 0
@@ -84,6 +78,24 @@ class NoseHaackShapeHandler(NoseShapeHandler):
             x = (max - min) / 2 + min
         return x
 
+    def _innerCurve(self):
+        """ Return the start, end radius and spline poles of the inner surface """
+        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
+        x = self.findHaackY(self._thickness, self._length, self._radius, self._coefficient)
+
+        if self._style == STYLE_HOLLOW and not self._shoulder:
+            return x, self._radius - self._thickness, self.haack_curve(self._length, self._radius - self._thickness, self._resolution, self._coefficient, x)
+
+        minor_y = self.innerMinor(self._length)
+        return x, minor_y, self.haack_curve(self._length - self._thickness, minor_y, self._resolution, self._coefficient, x)
+
+    def _outer(self):
+        return ProfileGenerator.spline(self.haack_curve(self._length, self._radius, self._resolution, self._coefficient))
+
+    def _inner(self):
+        x, minor_y, inner_curve = self._innerCurve()
+        return x, ProfileGenerator.spline(inner_curve)
+
     def drawSolid(self):
         outer_curve = self.haack_curve(self._length, self._radius, self._resolution, self._coefficient)
         spline = self.makeSpline(outer_curve)
@@ -99,11 +111,8 @@ class NoseHaackShapeHandler(NoseShapeHandler):
         return edges
 
     def drawHollow(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findHaackY(self._thickness, self._length, self._radius, self._coefficient)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.haack_curve(self._length, self._radius, self._resolution, self._coefficient)
-        inner_curve = self.haack_curve(self._length, self._radius - self._thickness, self._resolution, self._coefficient, x)
 
         # Create the splines.
         outerSpline = self.makeSpline(outer_curve)
@@ -113,12 +122,8 @@ class NoseHaackShapeHandler(NoseShapeHandler):
         return edges
 
     def drawHollowShoulder(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findHaackY(self._thickness, self._length, self._radius, self._coefficient)
-        minor_y = self.innerMinor(self._length)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.haack_curve(self._length, self._radius, self._resolution, self._coefficient)
-        inner_curve = self.haack_curve(self._length - self._thickness, minor_y, self._resolution, self._coefficient, x)
 
         # Create the splines.
         outerSpline = self.makeSpline(outer_curve)
@@ -128,12 +133,8 @@ class NoseHaackShapeHandler(NoseShapeHandler):
         return edges
 
     def drawCapped(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findHaackY(self._thickness, self._length, self._radius, self._coefficient)
-        minor_y = self.innerMinor(self._length)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.haack_curve(self._length, self._radius, self._resolution, self._coefficient)
-        inner_curve = self.haack_curve(self._length - self._thickness, minor_y, self._resolution, self._coefficient, x)
 
         # Create the splines.
         outerSpline = self.makeSpline(outer_curve)
@@ -143,12 +144,8 @@ class NoseHaackShapeHandler(NoseShapeHandler):
         return edges
 
     def drawCappedShoulder(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findHaackY(self._thickness, self._length, self._radius, self._coefficient)
-        minor_y = self.innerMinor(self._length)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.haack_curve(self._length, self._radius, self._resolution, self._coefficient)
-        inner_curve = self.haack_curve(self._length - self._thickness, minor_y, self._resolution, self._coefficient, x)
 
         # Create the splines.
         outerSpline = self.makeSpline(outer_curve)
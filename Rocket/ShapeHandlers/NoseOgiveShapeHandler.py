@@ -24,10 +24,11 @@ __title__ = "FreeCAD Ogive Nose Shape Handler"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
-import FreeCAD
 import math
 
+from Rocket.Constants import STYLE_HOLLOW
 from Rocket.ShapeHandlers.NoseShapeHandler import NoseShapeHandler
+from Rocket.ShapeHandlers import ProfileGenerator
 
 class NoseOgiveShapeHandler(NoseShapeHandler):
             
@@ -35,6 +36,9 @@ class NoseOgiveShapeHandler(NoseShapeHandler):
         y = math.sqrt(rho * rho - math.pow(length - x, 2)) + radius - rho
         return y
 
+    def _radii(self, x):
+        return ProfileGenerator.ogive(x, self._length, self._radius)
+
     def innerMinor(self, last):
         radius = self._radius - self._thickness
         length = last
@@ -44,16 +48,8 @@ class NoseOgiveShapeHandler(NoseShapeHandler):
         return inner_minor
 
     def ogive_curve(self, length, radius, resolution, min = 0):
-        rho = (radius * radius + length * length) / (2.0 * radius)
-        points = []
-        for i in range(0, resolution):
-            
-            x = float(i) * ((length - min) / float(resolution))
-            y = self.ogive_y(x, length, radius, rho)
-            points.append(FreeCAD.Vector(min + x, y))
-
-        points.append(FreeCAD.Vector(min + length, radius))
-        return points
+        return ProfileGenerator.curve(lambda x: ProfileGenerator.ogive(x, length, radius),
+                                      length, radius, resolution, min)
             
     def findOgiveY(self, thickness, length, radius):
         rho = (radius * radius + length * length) / (2.0 * radius)
@@ -74,6 +70,24 @@ class NoseOgiveShapeHandler(NoseShapeHandler):
             x = (max - min) / 2 + min
         return x
 
+    def _innerCurve(self):
+        """ Return the start, end radius and spline poles of the inner surface """
+        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
+        x = self.findOgiveY(self._thickness, self._length, self._radius)
+
+        if self._style == STYLE_HOLLOW and not self._shoulder:
+            return x, self._radius - self._thickness, self.ogive_curve(self._length - x, self._radius - self._thickness, self._resolution, x)
+
+        minor_y = self.innerMinor(self._length - self._thickness - x)
+        return x, minor_y, self.ogive_curve(self._length - self._thickness - x, minor_y, self._resolution, x)
+
+    def _outer(self):
+        return ProfileGenerator.spline(self.ogive_curve(self._length, self._radius, self._resolution))
+
+    def _inner(self):
+        x, minor_y, inner_curve = self._innerCurve()
+        return x, ProfileGenerator.spline(inner_curve)
+
     def drawSolid(self):
         outer_curve = self.ogive_curve(self._length, self._radius, self._resolution)
         ogive = self.makeSpline(outer_curve)
@@ -89,11 +103,8 @@ class NoseOgiveShapeHandler(NoseShapeHandler):
         return edges
 
     def drawHollow(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findOgiveY(self._thickness, self._length, self._radius)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.ogive_curve(self._length, self._radius, self._resolution)
-        inner_curve = self.ogive_curve(self._length - x, self._radius - self._thickness, self._resolution, x)
 
         # Create the splines.
         ogive = self.makeSpline(outer_curve)
@@ -103,12 +114,8 @@ class NoseOgiveShapeHandler(NoseShapeHandler):
         return edges
 
     def drawHollowShoulder(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findOgiveY(self._thickness, self._length, self._radius)
-        minor_y = self.innerMinor(self._length - self._thickness - x)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.ogive_curve(self._length, self._radius, self._resolution)
-        inner_curve = self.ogive_curve(self._length - self._thickness - x, minor_y, self._resolution, x)
 
         # Create the splines.
         ogive = self.makeSpline(outer_curve)
@@ -118,12 +125,8 @@ class NoseOgiveShapeHandler(NoseShapeHandler):
         return edges
 
     def drawCapped(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findOgiveY(self._thickness, self._length, self._radius)
-        minor_y = self.innerMinor(self._length - self._thickness - x)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.ogive_curve(self._length, self._radius, self._resolution)
-        inner_curve = self.ogive_curve(self._length - self._thickness - x, minor_y, self._resolution, x)
 
         # Create the splines.
         ogive = self.makeSpline(outer_curve)
@@ -133,12 +136,8 @@ class NoseOgiveShapeHandler(NoseShapeHandler):
         return edges
 
     def drawCappedShoulder(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findOgiveY(self._thickness, self._length, self._radius)
-        minor_y = self.innerMinor(self._length - self._thickness - x)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.ogive_curve(self._length, self._radius, self._resolution)
-        inner_curve = self.ogive_curve(self._length - self._thickness - x, minor_y, self._resolution, x)
 
         # Create the splines.
         ogive = self.makeSpline(outer_curve)
@@ -24,11 +24,11 @@ __title__ = "FreeCAD Parabolic Nose Shape Handler"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
-import FreeCAD
-
 from DraftTools import translate
 
+from Rocket.Constants import STYLE_HOLLOW
 from Rocket.ShapeHandlers.NoseShapeHandler import NoseShapeHandler
+from Rocket.ShapeHandlers import ProfileGenerator
 from Rocket.Utilities import validationError
     
 class NoseParabolicShapeHandler(NoseShapeHandler):
@@ -40,9 +40,10 @@ class NoseParabolicShapeHandler(NoseShapeHandler):
         return super().isValidShape()
 
     def para_y(self, x, length, radius, k):
-        ratio = x / length
-        y = radius * ((2 * ratio) - (k * ratio * ratio)) / (2 - k)
-        return y
+        return float(ProfileGenerator.parabolic(x, length, radius, k))
+
+    def _radii(self, x):
+        return ProfileGenerator.parabolic(x, self._length, self._radius, self._coefficient)
 
     def innerMinor(self, last, k):
         radius = self._radius - self._thickness
@@ -52,15 +53,8 @@ class NoseParabolicShapeHandler(NoseShapeHandler):
         return inner_minor
 
     def para_curve(self, length, radius, resolution, k, min = 0):
-        points = []
-        for i in range(0, resolution):
-            
-            x = float(i) * ((length - min) / float(resolution))
-            y = self.para_y(x, length, radius, k)
-            points.append(FreeCAD.Vector(min + x, y))
-
-        points.append(FreeCAD.Vector(min + length, radius))
-        return points
+        return ProfileGenerator.curve(lambda x: ProfileGenerator.parabolic(x, length, radius, k),
+                                      length, radius, resolution, min)
             
     def findParaY(self, thickness, length, radius, k):
         min = thickness
@@ -79,6 +73,24 @@ class NoseParabolicShapeHandler(NoseShapeHandler):
             x = (max - min) / 2 + min
         return x
 
+    def _innerCurve(self):
+        """ Return the start, end radius and spline poles of the inner surface """
+        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
+        x = self.findParaY(self._thickness, self._length, self._radius, self._coefficient)
+
+        if self._style == STYLE_HOLLOW and not self._shoulder:
+            return x, self._radius - self._thickness, self.para_curve(self._length - x, self._radius - self._thickness, self._resolution, self._coefficient, x)
+
+        minor_y = self.innerMinor(self._length - self._thickness - x, self._coefficient)
+        return x, minor_y, self.para_curve(self._length - self._thickness - x, minor_y, self._resolution, self._coefficient, x)
+
+    def _outer(self):
+        return ProfileGenerator.spline(self.para_curve(self._length, self._radius, self._resolution, self._coefficient))
+
+    def _inner(self):
+        x, minor_y, inner_curve = self._innerCurve()
+        return x, ProfileGenerator.spline(inner_curve)
+
     def drawSolid(self):
         outer_curve = self.para_curve(self._length, self._radius, self._resolution, self._coefficient)
         spline = self.makeSpline(outer_curve)
@@ -94,11 +106,8 @@ class NoseParabolicShapeHandler(NoseShapeHandler):
         return edges
 
     def drawHollow(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findParaY(self._thickness, self._length, self._radius, self._coefficient)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.para_curve(self._length, self._radius, self._resolution, self._coefficient)
-        inner_curve = self.para_curve(self._length - x, self._radius - self._thickness, self._resolution, self._coefficient, x)
 
         # Create the splines.
         outerSpline = self.makeSpline(outer_curve)
@@ -108,12 +117,8 @@ class NoseParabolicShapeHandler(NoseShapeHandler):
         return edges
 
     def drawHollowShoulder(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findParaY(self._thickness, self._length, self._radius, self._coefficient)
-        minor_y = self.innerMinor(self._length - self._thickness - x, self._coefficient)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.para_curve(self._length, self._radius, self._resolution, self._coefficient)
-        inner_curve = self.para_curve(self._length - self._thickness - x, minor_y, self._resolution, self._coefficient, x)
 
         # Create the splines.
         outerSpline = self.makeSpline(outer_curve)
@@ -123,12 +128,8 @@ class NoseParabolicShapeHandler(NoseShapeHandler):
         return edges
 
     def drawCapped(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findParaY(self._thickness, self._length, self._radius, self._coefficient)
-        minor_y = self.innerMinor(self._length - self._thickness - x, self._coefficient)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.para_curve(self._length, self._radius, self._resolution, self._coefficient)
-        inner_curve = self.para_curve(self._length - self._thickness - x, minor_y, self._resolution, self._coefficient, x)
 
         # Create the splines.
         outerSpline = self.makeSpline(outer_curve)
@@ -138,12 +139,8 @@ class NoseParabolicShapeHandler(NoseShapeHandler):
         return edges
 
     def drawCappedShoulder(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findParaY(self._thickness, self._length, self._radius, self._coefficient)
-        minor_y = self.innerMinor(self._length - self._thickness - x, self._coefficient)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.para_curve(self._length, self._radius, self._resolution, self._coefficient)
-        inner_curve = self.para_curve(self._length - self._thickness - x, minor_y, self._resolution, self._coefficient, x)
 
         # Create the splines.
         outerSpline = self.makeSpline(outer_curve)
@@ -24,12 +24,11 @@ __title__ = "FreeCAD Power Series Nose Shape Handler"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
-import FreeCAD
-import math
-
 from DraftTools import translate
 
+from Rocket.Constants import STYLE_HOLLOW
 from Rocket.ShapeHandlers.NoseShapeHandler import NoseShapeHandler
+from Rocket.ShapeHandlers import ProfileGenerator
 from Rocket.Utilities import validationError
     
 class NosePowerShapeHandler(NoseShapeHandler):
@@ -41,8 +40,10 @@ class NosePowerShapeHandler(NoseShapeHandler):
         return super().isValidShape()
 
     def power_y(self, x, length, radius, k):
-        y = radius * math.pow((x / length), k)
-        return y
+        return float(ProfileGenerator.power(x, length, radius, k))
+
+    def _radii(self, x):
+        return ProfileGenerator.power(x, self._length, self._radius, self._coefficient)
 
     def innerMinor(self, last, k):
         radius = self._radius - self._thickness
@@ -52,15 +53,8 @@ class NosePowerShapeHandler(NoseShapeHandler):
         return inner_minor
 
     def power_curve(self, length, radius, resolution, k, min = 0):
-        points = []
-        for i in range(0, resolution):
-            
-            x = float(i) * ((length - min) / float(resolution))
-            y = self.power_y(x, length, radius, k)
-            points.append(FreeCAD.Vector(min + x, y))
-
-        points.append(FreeCAD.Vector(min + length, radius))
-        return points
+        return ProfileGenerator.curve(lambda x: ProfileGenerator.power(x, length, radius, k),
+                                      length, radius, resolution, min)
             
     def findPowerY(self, thickness, length, radius, k):
         min = thickness
@@ -80,6 +74,24 @@ class NosePowerShapeHandler(NoseShapeHandler):
         return x
 
 
+    def _innerCurve(self):
+        """ Return the start, end radius and spline poles of the inner surface """
+        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
+        x = self.findPowerY(self._thickness, self._length, self._radius, self._coefficient)
+
+        if self._style == STYLE_HOLLOW and not self._shoulder:
+            return x, self._radius - self._thickness, self.power_curve(self._length - x, self._radius - self._thickness, self._resolution, self._coefficient, x)
+
+        minor_y = self.innerMinor(self._length - self._thickness - x, self._coefficient)
+        return x, minor_y, self.power_curve(self._length - self._thickness - x, minor_y, self._resolution, self._coefficient, x)
+
+    def _outer(self):
+        return ProfileGenerator.spline(self.power_curve(self._length, self._radius, self._resolution, self._coefficient))
+
+    def _inner(self):
+        x, minor_y, inner_curve = self._innerCurve()
+        return x, ProfileGenerator.spline(inner_curve)
+
     def drawSolid(self):
         outer_curve = self.power_curve(self._length, self._radius, self._resolution, self._coefficient)
         spline = self.makeSpline(outer_curve)
@@ -95,11 +107,8 @@ class NosePowerShapeHandler(NoseShapeHandler):
         return edges
 
     def drawHollow(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findPowerY(self._thickness, self._length, self._radius, self._coefficient)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.power_curve(self._length, self._radius, self._resolution, self._coefficient)
-        inner_curve = self.power_curve(self._length - x, self._radius - self._thickness, self._resolution, self._coefficient, x)
 
         # Create the splines.
         outerSpline = self.makeSpline(outer_curve)
@@ -109,12 +118,8 @@ class NosePowerShapeHandler(NoseShapeHandler):
         return edges
 
     def drawHollowShoulder(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findPowerY(self._thickness, self._length, self._radius, self._coefficient)
-        minor_y = self.innerMinor(self._length - self._thickness - x, self._coefficient)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.power_curve(self._length, self._radius, self._resolution, self._coefficient)
-        inner_curve = self.power_curve(self._length - self._thickness - x, minor_y, self._resolution, self._coefficient, x)
 
         # Create the splines.
         outerSpline = self.makeSpline(outer_curve)
@@ -124,12 +129,8 @@ class NosePowerShapeHandler(NoseShapeHandler):
         return edges
 
     def drawCapped(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findPowerY(self._thickness, self._length, self._radius, self._coefficient)
-        minor_y = self.innerMinor(self._length - self._thickness - x, self._coefficient)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.power_curve(self._length, self._radius, self._resolution, self._coefficient)
-        inner_curve = self.power_curve(self._length - self._thickness - x, minor_y, self._resolution, self._coefficient, x)
 
         # Create the splines.
         outerSpline = self.makeSpline(outer_curve)
@@ -139,12 +140,8 @@ class NosePowerShapeHandler(NoseShapeHandler):
         return edges
 
     def drawCappedShoulder(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findPowerY(self._thickness, self._length, self._radius, self._coefficient)
-        minor_y = self.innerMinor(self._length - self._thickness - x, self._coefficient)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.power_curve(self._length, self._radius, self._resolution, self._coefficient)
-        inner_curve = self.power_curve(self._length - self._thickness - x, minor_y, self._resolution, self._coefficient, x)
 
         # Create the splines.
         outerSpline = self.makeSpline(outer_curve)
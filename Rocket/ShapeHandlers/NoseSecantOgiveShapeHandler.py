@@ -24,10 +24,11 @@ __title__ = "FreeCAD Ogive Nose Shape Handler"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
-import FreeCAD
 import math
 
+from Rocket.Constants import STYLE_HOLLOW
 from Rocket.ShapeHandlers.NoseShapeHandler import NoseShapeHandler
+from Rocket.ShapeHandlers import ProfileGenerator
 
 class NoseSecantOgiveShapeHandler(NoseShapeHandler):
 
@@ -44,6 +45,9 @@ class NoseSecantOgiveShapeHandler(NoseShapeHandler):
         y = math.sqrt(rho * rho - math.pow(rho * math.cos(alpha) - x, 2)) - (rho * math.sin(alpha))
         return y
 
+    def _radii(self, x):
+        return ProfileGenerator.secantOgive(x, self.getRho(), self.getAlpha(self._length, self._radius))
+
     def innerMinor(self, last):
         radius = self._radius - self._thickness
         length = last
@@ -57,15 +61,8 @@ class NoseSecantOgiveShapeHandler(NoseShapeHandler):
         rho = self.getRho()
         alpha = self.getAlpha(length, radius)
 
-        points = []
-        for i in range(0, resolution):
-            
-            x = float(i) * ((length - min) / float(resolution))
-            y = self.ogive_y(x, length, rho, alpha)
-            points.append(FreeCAD.Vector(min + x, y))
-
-        points.append(FreeCAD.Vector(min + length, radius))
-        return points
+        return ProfileGenerator.curve(lambda x: ProfileGenerator.secantOgive(x, rho, alpha),
+                                      length, radius, resolution, min)
 
             
     def findOgiveY(self, thickness, length, radius):
@@ -88,6 +85,24 @@ class NoseSecantOgiveShapeHandler(NoseShapeHandler):
                 max = x
         return x
 
+    def _innerCurve(self):
+        """ Return the start, end radius and spline poles of the inner surface """
+        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
+        x = self.findOgiveY(self._thickness, self._length, self._radius)
+
+        if self._style == STYLE_HOLLOW and not self._shoulder:
+            return x, self._radius - self._thickness, self.ogive_curve(self._length - x, self._radius - self._thickness, self._resolution, x)
+
+        minor_y = self.innerMinor(self._length - self._thickness - x)
+        return x, minor_y, self.ogive_curve(self._length - self._thickness - x, minor_y, self._resolution, x)
+
+    def _outer(self):
+        return ProfileGenerator.spline(self.ogive_curve(self._length, self._radius, self._resolution))
+
+    def _inner(self):
+        x, minor_y, inner_curve = self._innerCurve()
+        return x, ProfileGenerator.spline(inner_curve)
+
     def drawSolid(self):
         outer_curve = self.ogive_curve(self._length, self._radius, self._resolution)
         ogive = self.makeSpline(outer_curve)
@@ -103,11 +118,8 @@ class NoseSecantOgiveShapeHandler(NoseShapeHandler):
         return edges
 
     def drawHollow(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findOgiveY(self._thickness, self._length, self._radius)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.ogive_curve(self._length, self._radius, self._resolution)
-        inner_curve = self.ogive_curve(self._length - x, self._radius - self._thickness, self._resolution, x)
 
         # Create the splines.
         ogive = self.makeSpline(outer_curve)
@@ -117,12 +129,8 @@ class NoseSecantOgiveShapeHandler(NoseShapeHandler):
         return edges
 
     def drawHollowShoulder(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findOgiveY(self._thickness, self._length, self._radius)
-        minor_y = self.innerMinor(self._length - self._thickness - x)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.ogive_curve(self._length, self._radius, self._resolution)
-        inner_curve = self.ogive_curve(self._length - self._thickness - x, minor_y, self._resolution, x)
 
         # Create the splines.
         ogive = self.makeSpline(outer_curve)
@@ -132,12 +140,8 @@ class NoseSecantOgiveShapeHandler(NoseShapeHandler):
         return edges
 
     def drawCapped(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findOgiveY(self._thickness, self._length, self._radius)
-        minor_y = self.innerMinor(self._length - self._thickness - x)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.ogive_curve(self._length, self._radius, self._resolution)
-        inner_curve = self.ogive_curve(self._length - self._thickness - x, minor_y, self._resolution, x)
 
         # Create the splines.
         ogive = self.makeSpline(outer_curve)
@@ -147,12 +151,8 @@ class NoseSecantOgiveShapeHandler(NoseShapeHandler):
         return edges
 
     def drawCappedShoulder(self):
-        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
-        x = self.findOgiveY(self._thickness, self._length, self._radius)
-        minor_y = self.innerMinor(self._length - self._thickness - x)
-
+        x, minor_y, inner_curve = self._innerCurve()
         outer_curve = self.ogive_curve(self._length, self._radius, self._resolution)
-        inner_curve = self.ogive_curve(self._length - self._thickness - x, minor_y, self._resolution, x)
 
         # Create the splines.
         ogive = self.makeSpline(outer_curve)
@@ -28,6 +28,7 @@ import FreeCAD
 import Part
 
 import math
+import numpy as np
 
 from DraftTools import translate
 
@@ -37,6 +38,11 @@ from Rocket.Constants import TYPE_BLUNTED_CONE, TYPE_BLUNTED_OGIVE, TYPE_SECANT_
 
 from Rocket.Utilities import _err, validationError
 
+# Integration parameters for the analytic properties
+QUADRATURE_ORDER = 8
+QUADRATURE_PANELS = 16
+SURFACE_SAMPLES = 1001
+
 class NoseShapeHandler():
     def __init__(self, obj):
 
@@ -66,7 +72,170 @@ class NoseShapeHandler():
         self._obj = obj
 
     def getRadius(self, x):
-        return 0.0
+        """ Return the outer radius of the nose at a distance x from the tip """
+        return float(self.radius(x))
+
+    def radius(self, x):
+        """ Return the outer radius of the nose at each of an array of distances x from the tip """
+        x = np.asarray(x, dtype=float)
+        if self._length <= 0.0:
+            return np.zeros(x.shape)
+        radii = self._radii(np.clip(x, 0.0, self._length))
+        return np.where(x <= 0.0, 0.0, np.where(x >= self._length, self._radius, radii))
+
+    def _radii(self, x):
+        # Override in the shape specific handlers. x is an array within the nose length
+        return np.zeros(x.shape)
+
+    def _outer(self):
+        """ The outer surface as drawn, as a vectorized radius function of the distance from the tip """
+        return self.radius
+
+    def _inner(self):
+        """
+            The inner surface of hollow and capped noses as drawn, as a tuple (start, radius) where radius
+            is a vectorized function from start to the end of the cavity. The cavity ends at the base for
+            hollow noses without a shoulder, and one wall thickness forward of the base otherwise
+        """
+        # Override in the shape specific handlers
+        return 0.0, lambda x: np.maximum(self.radius(x) - self._thickness, 0.0)
+
+    def _sections(self):
+        """
+            The solid as a list of (start, end, outer, inner) sections of revolution, where outer and
+            inner are vectorized radius functions following the drawn curves. Cap cut outs are handled
+            separately
+        """
+        zero = lambda x: np.zeros(x.shape)
+        constant = lambda value: (lambda x: np.full(x.shape, value))
+        outer = self._outer()
+
+        length = self._length
+        if self._style == STYLE_SOLID:
+            sections = [(0.0, length, outer, zero)]
+            if self._shoulder:
+                sections.append((length, length + self._shoulderLength, constant(self._shoulderRadius), zero))
+            return sections
+
+        innerEnd = length
+        if self._style == STYLE_CAPPED or self._shoulder:
+            innerEnd = length - self._thickness
+        innerStart, inner = self._inner()
+        sections = [(0.0, innerStart, outer, zero), (innerStart, innerEnd, outer, inner)]
+
+        if not self._shoulder:
+            if self._style == STYLE_CAPPED:
+                sections.append((innerEnd, length, outer, zero))
+            return sections
+
+        # The shoulder bore extends into the base of the nose
+        bore = constant(self._shoulderRadius - self._shoulderThickness)
+        shoulder = constant(self._shoulderRadius)
+        shoulderEnd = length + self._shoulderLength
+        sections.append((innerEnd, length, outer, bore))
+        if self._style == STYLE_CAPPED:
+            sections.append((length, shoulderEnd - self._shoulderThickness, shoulder, bore))
+            sections.append((shoulderEnd - self._shoulderThickness, shoulderEnd, shoulder, zero))
+        else:
+            sections.append((length, shoulderEnd, shoulder, bore))
+        return sections
+
+    def _cutOut(self):
+        """
+            The material removed from bar and cross caps as a tuple (start, end, area, polar), where
+            area and polar are the area and polar moment of its cross section, or None for solid caps.
+            The cut out is the shoulder bore through the cap, less the bars
+        """
+        if self._style != STYLE_CAPPED or self._capStyle not in [STYLE_CAP_BAR, STYLE_CAP_CROSS]:
+            return None
+
+        if self._shoulder:
+            end = self._length + self._shoulderLength
+            start = end - self._shoulderThickness
+        else:
+            end = self._length
+            start = end - self._thickness
+
+        # A bar of half width h across a disk of radius a, integrated across its width
+        a = self._shoulderRadius - self._shoulderThickness
+        h = min(self._capBarWidth / 2.0, a)
+        z, weights = self._quadrature(-h, h)
+        chord = np.sqrt(a * a - z * z)
+        barArea = 2.0 * np.dot(weights, chord)
+        barPolar = 2.0 * np.dot(weights, chord ** 3 / 3.0 + chord * z * z)
+
+        area = math.pi * a * a - barArea
+        polar = math.pi * a ** 4 / 2.0 - barPolar
+        if self._capStyle == STYLE_CAP_CROSS:
+            # The second bar, less the square where the bars cross
+            area -= barArea - 4.0 * h * h
+            polar -= barPolar - 8.0 * h ** 4 / 3.0
+        return (start, end, area, polar)
+
+    def _quadrature(self, start, end):
+        """ Composite Gauss-Legendre nodes and weights over [start, end] """
+        if end <= start:
+            return np.zeros(0), np.zeros(0)
+        nodes, weights = np.polynomial.legendre.leggauss(QUADRATURE_ORDER)
+        edges = np.linspace(start, end, QUADRATURE_PANELS + 1)
+        half = (edges[1:] - edges[:-1])[:, np.newaxis] / 2.0
+        middle = (edges[1:] + edges[:-1])[:, np.newaxis] / 2.0
+        return (middle + half * nodes).ravel(), (half * weights).ravel()
+
+    def getVolumeProperties(self):
+        """
+            Return the volume of the solid and its geometric properties for a unit density, as a tuple
+            (volume, cg, ixx, iyy). The center of gravity is the distance from the tip along the
+            axis, ixx is about the axis and iyy about a transverse axis through the center of gravity.
+        """
+        volume = 0.0
+        moment = 0.0
+        ixx = 0.0
+        iyy = 0.0
+        for start, end, outer, inner in self._sections():
+            x, weights = self._quadrature(start, end)
+            outer2 = outer(x) ** 2
+            inner2 = inner(x) ** 2
+            area = math.pi * (outer2 - inner2)
+            disk = math.pi * (outer2 * outer2 - inner2 * inner2) / 2.0 # Polar moment of each slice
+
+            volume += np.dot(weights, area)
+            moment += np.dot(weights, x * area)
+            ixx += np.dot(weights, disk)
+            iyy += np.dot(weights, disk / 2.0 + x * x * area)
+
+        cutOut = self._cutOut()
+        if cutOut is not None:
+            # The cut out isn't axially symmetric, so its transverse inertia is averaged over both axes
+            start, end, area, polar = cutOut
+            span = end - start
+            volume -= area * span
+            moment -= area * span * (start + end) / 2.0
+            ixx -= polar * span
+            iyy -= polar * span / 2.0 + area * (end ** 3 - start ** 3) / 3.0
+
+        if volume <= 0.0:
+            return (0.0, 0.0, 0.0, 0.0)
+        cg = moment / volume
+        return (float(volume), float(cg), float(ixx), float(iyy - volume * cg * cg))
+
+    def getVolume(self):
+        return self.getVolumeProperties()[0]
+
+    def getSurfaceArea(self):
+        """ Return the wetted area of the nose, excluding the base and shoulder """
+        if self._length <= 0.0:
+            return 0.0
+
+        # Sum of conical frustums, with the samples concentrated towards the tip where the curvature is greatest
+        x = self._length * (1.0 - np.cos(np.linspace(0.0, math.pi / 2.0, SURFACE_SAMPLES)))
+        r = self._outer()(x)
+        return float(math.pi * np.sum((r[1:] + r[:-1]) * np.hypot(np.diff(x), np.diff(r))))
+
+    def getPlanformArea(self):
+        """ Return the area of the nose profile when viewed from the side """
+        x, weights = self._quadrature(0.0, self._length)
+        return float(2.0 * np.dot(weights, self._outer()(x)))
 
     def makeSpline(self, points):
         spline = Part.BSplineCurve()
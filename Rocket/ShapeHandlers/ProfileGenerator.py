@@ -0,0 +1,138 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Vectorized profile curves for nose cones and transitions"""
+
+__title__ = "FreeCAD Rocket Profile Generator"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+import math
+import numpy as np
+
+# All of the profiles take x as a scalar or array of distances from the tip of a shape of the
+# given length and base radius, and return the radius at each point. They are shared by the
+# spline generation for the solids and the analytic property calculations
+
+def cone(x, length, radius):
+    return radius * np.asarray(x, dtype=float) / length
+
+def ogive(x, length, radius):
+    """ Tangent ogive """
+    rho = (radius * radius + length * length) / (2.0 * radius)
+    return np.sqrt(np.maximum(rho * rho - (length - np.asarray(x, dtype=float)) ** 2, 0.0)) + radius - rho
+
+def secantOgive(x, rho, alpha):
+    """ Secant ogive with ogive radius rho, where alpha is the angle of the chord to the axis """
+    return np.sqrt(np.maximum(rho * rho - (rho * math.cos(alpha) - np.asarray(x, dtype=float)) ** 2, 0.0)) \
+        - (rho * math.sin(alpha))
+
+def haack(x, length, radius, coefficient):
+    theta = np.arccos(np.clip(1.0 - 2.0 * np.asarray(x, dtype=float) / length, -1.0, 1.0))
+    return radius * np.sqrt(theta - np.sin(2.0 * theta) / 2.0
+        + coefficient * np.sin(theta) ** 3) / math.sqrt(math.pi)
+
+def power(x, length, radius, k):
+    return radius * np.power(np.asarray(x, dtype=float) / length, k)
+
+def parabolic(x, length, radius, k):
+    ratio = np.asarray(x, dtype=float) / length
+    return radius * ((2.0 * ratio) - (k * ratio * ratio)) / (2.0 - k)
+
+def ellipse(x, length, radius):
+    ratio = (length - np.asarray(x, dtype=float)) / length
+    return radius * np.sqrt(np.maximum(1.0 - ratio * ratio, 0.0))
+
+def sphere(x, center, radius):
+    """ Spherical cap centered on the axis """
+    return np.sqrt(np.maximum(radius * radius - (np.asarray(x, dtype=float) - center) ** 2, 0.0))
+
+def samples(start, end, resolution):
+    """ Return resolution evenly spaced positions from start towards end, excluding end """
+    return start + np.arange(resolution) * ((end - start) / float(resolution))
+
+def toVectors(x, y):
+    """ Convert arrays of x and y coordinates to a list of vectors for the OCC geometry """
+    return [FreeCAD.Vector(px, py) for px, py in zip(np.asarray(x, dtype=float).tolist(),
+                                                     np.asarray(y, dtype=float).tolist())]
+
+def curve(profile, length, radius, resolution, min=0.0, end=None):
+    """
+        Sample a profile function, profile(x), at resolution points along a curve of the given
+        length, offset along the axis by min. The curve is closed with the point (end, radius),
+        which defaults to (min + length, radius).
+    """
+    x = samples(0.0, length - min, resolution)
+    if end is None:
+        end = min + length
+    return toVectors(min + x, profile(x)) + [FreeCAD.Vector(end, radius)]
+
+# The drawn curves below let the analytic properties follow the solids exactly as they are drawn,
+# including the splines built from the sampled profiles
+
+def fromVectors(points):
+    """ Convert a list of vectors to arrays of x and y coordinates """
+    return (np.array([point.x for point in points], dtype=float),
+            np.array([point.y for point in points], dtype=float))
+
+def polyline(x, y):
+    """ Return a vectorized radius function for the straight segments through the points x, y """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    return lambda p: np.interp(p, x, y)
+
+def bspline(x, y, samples=16, degree=3):
+    """
+        Sample the clamped B-spline with uniform knots built on the poles x, y by
+        Part.BSplineCurve.buildFromPoles(), at samples points per knot span. Returns
+        arrays of x and y coordinates along the curve
+    """
+    poles = np.column_stack((np.asarray(x, dtype=float), np.asarray(y, dtype=float)))
+    degree = min(degree, len(poles) - 1)
+    spans = len(poles) - degree
+    knots = np.concatenate((np.zeros(degree), np.linspace(0.0, 1.0, spans + 1), np.ones(degree)))
+    u = np.linspace(0.0, 1.0, spans * samples + 1)
+
+    # de Boor's algorithm over all of the parameters at once
+    span = np.minimum(np.searchsorted(knots, u, side='right') - 1, len(poles) - 1)
+    points = np.stack([poles[span - degree + j] for j in range(degree + 1)], axis=1)
+    for level in range(1, degree + 1):
+        for j in range(degree, level - 1, -1):
+            low = knots[span - degree + j]
+            alpha = ((u - low) / (knots[span + 1 + j - level] - low))[:, np.newaxis]
+            points[:, j] = (1.0 - alpha) * points[:, j - 1] + alpha * points[:, j]
+
+    return points[:, degree, 0], points[:, degree, 1]
+
+def spline(points):
+    """ Return a vectorized radius function for the spline built on a list of pole vectors """
+    return polyline(*bspline(*fromVectors(points)))
+
+def arc(start, middle, end):
+    """ Return a vectorized radius function for the circular arc through three vectors """
+    ax, ay = start.x, start.y
+    bx, by = middle.x, middle.y
+    cx, cy = end.x, end.y
+    d = 2.0 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+    ux = ((ax * ax + ay * ay) * (by - cy) + (bx * bx + by * by) * (cy - ay) + (cx * cx + cy * cy) * (ay - by)) / d
+    uy = ((ax * ax + ay * ay) * (cx - bx) + (bx * bx + by * by) * (ax - cx) + (cx * cx + cy * cy) * (bx - ax)) / d
+    radius = math.hypot(ax - ux, ay - uy)
+    return lambda x: uy + np.sqrt(np.maximum(radius * radius - (np.asarray(x, dtype=float) - ux) ** 2, 0.0))
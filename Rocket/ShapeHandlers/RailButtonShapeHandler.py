@@ -95,7 +95,7 @@ class RailButtonShapeHandler():
 
         return True
 
-    def _fastenerCountersinkHeight(self):
+    def fastenerCountersinkHeight(self):
         if self._countersinkAngle == COUNTERSINK_ANGLE_NONE:
             return 0
 
@@ -120,8 +120,8 @@ class RailButtonShapeHandler():
 
     def _fastener(self):
         fastener = Part.makeCylinder(self._shankDiameter / 2.0, self._height)
-        if self._fastenerCountersinkHeight() > 0:
-            countersink = Part.makeCone(self._headDiameter / 2.0, 0, self._fastenerCountersinkHeight(),
+        if self.fastenerCountersinkHeight() > 0:
+            countersink = Part.makeCone(self._headDiameter / 2.0, 0, self.fastenerCountersinkHeight(),
                             FreeCAD.Vector(0,0,self._height),
                             FreeCAD.Vector(0,0,-1))
 
@@ -0,0 +1,225 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Build component shapes in worker processes ahead of a document recompute"""
+
+__title__ = "FreeCAD Rocket Shape Builder"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+import Part
+
+import os
+import pickle
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+
+from DraftTools import translate
+
+from Rocket.ShapeHandlers.ShapeCache import getShapeCache, NON_SHAPE_PROPERTIES
+from Rocket.Utilities import _wrn
+from Rocket.util.ProcessPool import makeProcessPool
+
+from Rocket.Constants import FEATURE_BODY_TUBE, FEATURE_BULKHEAD, FEATURE_CENTERING_RING, FEATURE_ENGINE_BLOCK, \
+    FEATURE_FIN, FEATURE_FINCAN, FEATURE_INNER_TUBE, FEATURE_LAUNCH_LUG, FEATURE_NOSE_CONE, FEATURE_RAIL_BUTTON, \
+    FEATURE_TRANSITION, FEATURE_TUBE_COUPLER
+
+# Fewer shapes than this aren't worth the overhead of the worker processes
+MIN_PARALLEL_SHAPES = 4
+
+# Components whose shape depends only on their own properties. The rail guide handler needs
+# the document to find its parent so it is always drawn by the recompute
+SHAPE_FEATURES = [FEATURE_BODY_TUBE, FEATURE_BULKHEAD, FEATURE_CENTERING_RING, FEATURE_ENGINE_BLOCK,
+                  FEATURE_FIN, FEATURE_FINCAN, FEATURE_INNER_TUBE, FEATURE_LAUNCH_LUG, FEATURE_NOSE_CONE,
+                  FEATURE_RAIL_BUTTON, FEATURE_TRANSITION, FEATURE_TUBE_COUPLER]
+
+class _PackedQuantity:
+    """ Quantities can't be pickled, so they are sent as their value and unit signature """
+
+    def __init__(self, quantity):
+        self.value = quantity.Value
+        self.signature = tuple(quantity.Unit.Signature)
+
+    def unpack(self):
+        return FreeCAD.Units.Quantity(self.value, FreeCAD.Units.Unit(*self.signature))
+
+def _pack(value):
+    if isinstance(value, FreeCAD.Units.Quantity):
+        return _PackedQuantity(value)
+    if isinstance(value, (list, tuple)):
+        return type(value)(_pack(item) for item in value)
+    return value
+
+def _unpack(value):
+    if isinstance(value, _PackedQuantity):
+        return value.unpack()
+    if isinstance(value, (list, tuple)):
+        return type(value)(_unpack(item) for item in value)
+    return value
+
+def _shapeInputs(obj):
+    """ Return the values of the shape properties ready to send, or None when they can't be sent """
+    properties = []
+    for name in obj.PropertiesList:
+        if name not in NON_SHAPE_PROPERTIES:
+            properties.append((name, _pack(obj.getPropertyByName(name))))
+    try:
+        pickle.dumps(properties)
+    except Exception:
+        return None
+    return properties
+
+class _ShapeInputs:
+    """ Stands in for the document object in a worker, holding the values of its shape properties """
+
+    def __init__(self, properties):
+        for name, value in properties:
+            setattr(self, name, _unpack(value))
+        self.Placement = FreeCAD.Placement()
+        self.Shape = Part.Shape()
+        self.Proxy = None
+
+def _buildShape(handlerClass, properties):
+    obj = _ShapeInputs(properties)
+    handlerClass(obj).draw()
+    if obj.Shape.isNull():
+        return None
+    return obj.Shape.exportBrepToString()
+
+def _preferredWorkers():
+    param = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Rocket")
+    workers = param.GetInt("ShapeBuilderWorkers", 0)
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+class ShapeBuilder:
+    """
+        Draws the shapes of the components waiting for a recompute in a pool of worker
+        processes. The property values are collected on the main thread, the workers return the
+        shapes as BRep strings, and the shapes are added to the shape cache. The recompute then
+        attaches the cached shapes on the main thread.
+
+        Components whose properties can't be sent to a worker are left for the recompute to
+        draw as usual, as are shapes that fail in a worker after the failure is reported.
+    """
+
+    def __init__(self, workers=None):
+        if workers is None:
+            workers = _preferredWorkers()
+        self._workers = workers
+        self._pool = None
+        self._failed = False
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _getPool(self):
+        if self._pool is None and not self._failed and self._workers > 1:
+            self._pool = makeProcessPool(self._workers)
+            if self._pool is None:
+                self._failed = True
+        return self._pool
+
+    def collect(self, objects, force=False):
+        """
+            Return a dictionary of the shape cache keys of the shapes to build, with the handler
+            class, the property values and the label of the component that needs each shape
+        """
+        cache = getShapeCache()
+        requests = {}
+        for obj in objects:
+            if not (force or obj.isTouched()):
+                continue
+            proxy = getattr(obj, "Proxy", None)
+            if getattr(proxy, "Type", None) not in SHAPE_FEATURES:
+                continue
+
+            try:
+                handler = proxy.createShapeHandler(obj)
+                key = cache.key(obj)
+            except Exception:
+                # Left for the recompute to draw and report
+                continue
+            if handler is None or key is None or key in cache or key in requests:
+                continue
+
+            properties = _shapeInputs(obj)
+            if properties is not None:
+                requests[key] = (handler.__class__, properties, obj.Label)
+        return requests
+
+    def prebuild(self, objects, force=False):
+        """ Build the shapes of the objects waiting for a recompute, returning the number built """
+        requests = self.collect(objects, force)
+        if len(requests) < MIN_PARALLEL_SHAPES:
+            return 0
+
+        pool = self._getPool()
+        if pool is None:
+            return 0
+
+        cache = getShapeCache()
+        built = 0
+        try:
+            futures = {pool.submit(_buildShape, handlerClass, properties) : key
+                       for key, (handlerClass, properties, label) in requests.items()}
+            for future in concurrent.futures.as_completed(futures):
+                key = futures[future]
+                try:
+                    brep = future.result()
+                except BrokenProcessPool:
+                    raise
+                except Exception as ex:
+                    # The recompute draws the shape again, and reports it if it fails there too
+                    _wrn(translate('Rocket', "Unable to build the shape of '{}' in a worker process: {}").format(
+                            requests[key][2], str(ex)))
+                    continue
+
+                if brep is not None:
+                    shape = Part.Shape()
+                    shape.importBrepFromString(brep)
+                    cache.put(key, shape)
+                    built += 1
+        except BrokenProcessPool:
+            _wrn(translate('Rocket', "Unable to start the shape builder processes. Shapes will be drawn serially"))
+            self._failed = True
+            self._pool = None
+
+        return built
+
+_shapeBuilder = None
+
+def getShapeBuilder():
+    global _shapeBuilder
+    if _shapeBuilder is None:
+        _shapeBuilder = ShapeBuilder()
+    return _shapeBuilder
+
+def recomputeDocument(document, force=False):
+    """ Recompute the document, building the component shapes in parallel first """
+    getShapeBuilder().prebuild(document.Objects, force)
+    if force:
+        document.recompute(None, True, True)
+    else:
+        document.recompute()
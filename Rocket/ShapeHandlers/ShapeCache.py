@@ -0,0 +1,142 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Process wide cache of component shapes"""
+
+__title__ = "FreeCAD Rocket Shape Cache"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+
+from collections import OrderedDict
+
+DEFAULT_CAPACITY = 256
+
+# Properties that can't affect the shape in component coordinates
+NON_SHAPE_PROPERTIES = ['Placement', 'Shape', 'Label', 'Label2', 'Comment', 'Group', 'Visibility',
+                        'Position', 'AxialMethod', 'AxialOffset', 'AngleOffset', 'RadialReference',
+                        'RadialOffset', 'LocationReference', 'Manufacturer', 'PartNumber',
+                        'Description', 'Texture', 'ExpressionEngine', 'Proxy', 'ShapeMaterial']
+
+class _Uncacheable(Exception):
+    pass
+
+def _canonical(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, FreeCAD.Units.Quantity):
+        return float(value.Value)
+    if isinstance(value, FreeCAD.Vector):
+        return (value.x, value.y, value.z)
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonical(item) for item in value)
+    if hasattr(value, 'TypeId'):
+        # Linked document objects such as sketches can change without the component changing
+        raise _Uncacheable()
+    return str(value)
+
+class ShapeCache:
+    """
+        A least recently used cache of component shapes in component coordinates, keyed on
+        the component type and the values of all the properties that can affect the shape.
+        Components with identical parameters share an entry.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self._capacity = capacity
+        self._shapes = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def setCapacity(self, capacity):
+        self._capacity = capacity
+        self._trim()
+
+    def clear(self):
+        self._shapes.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def getStatistics(self):
+        return {
+            "hits" : self._hits,
+            "misses" : self._misses,
+            "size" : len(self._shapes),
+            "capacity" : self._capacity
+        }
+
+    def key(self, obj):
+        """ Return the cache key for the object, or None when the shape can't be cached """
+        try:
+            values = []
+            for name in sorted(obj.PropertiesList):
+                if name not in NON_SHAPE_PROPERTIES:
+                    values.append((name, _canonical(obj.getPropertyByName(name))))
+        except _Uncacheable:
+            return None
+        return (obj.Proxy.Type, tuple(values))
+
+    def __contains__(self, key):
+        return key in self._shapes
+
+    def get(self, key):
+        shape = self._shapes.get(key)
+        if shape is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._shapes.move_to_end(key)
+        return shape.copy()
+
+    def put(self, key, shape):
+        shape = shape.copy()
+        shape.Placement = FreeCAD.Placement()
+        self._shapes[key] = shape
+        self._shapes.move_to_end(key)
+        self._trim()
+
+    def _trim(self):
+        while len(self._shapes) > self._capacity:
+            self._shapes.popitem(last=False)
+
+    def draw(self, obj, handler):
+        """ Set the object shape, drawing it with the handler only when it isn't in the cache """
+        key = self.key(obj)
+        if key is not None:
+            shape = self.get(key)
+            if shape is not None:
+                placement = FreeCAD.Placement(obj.Placement)
+                obj.Shape = shape
+                obj.Placement = placement
+                return
+
+        previous = obj.Shape
+        handler.draw()
+
+        # Handlers leave the existing shape in place when the parameters are invalid
+        if key is not None and not obj.Shape.isNull() and not obj.Shape.isPartner(previous):
+            self.put(key, obj.Shape)
+
+_shapeCache = ShapeCache()
+
+def getShapeCache():
+    return _shapeCache
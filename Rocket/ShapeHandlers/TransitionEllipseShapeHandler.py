@@ -29,6 +29,7 @@ import Part
 import math
 
 from Rocket.ShapeHandlers.TransitionShapeHandler import TransitionShapeHandler
+from Rocket.ShapeHandlers import ProfileGenerator
     
 class TransitionEllipseShapeHandler(TransitionShapeHandler):
 
@@ -43,11 +44,7 @@ class TransitionEllipseShapeHandler(TransitionShapeHandler):
             center = r1
             x = length - pos
 
-        try:
-            y = (minor / major) * math.sqrt(major * major - x * x)
-        except Exception as ex:
-            raise ex
-        return y + center
+        return ProfileGenerator.ellipse(major - x, major, minor) + center
 
     def _eTheta(self, major, minor, tanTheta):
         #
@@ -24,11 +24,10 @@ __title__ = "FreeCAD Haack Transition Handler"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
-import math
-
 from DraftTools import translate
 
 from Rocket.ShapeHandlers.TransitionShapeHandler import TransitionShapeHandler
+from Rocket.ShapeHandlers import ProfileGenerator
 
 from Rocket.Utilities import validationError    
     
@@ -40,9 +39,6 @@ class TransitionHaackShapeHandler(TransitionShapeHandler):
             return False
         return super().isValidShape()
 
-    def _theta(self, x, length):
-        return  math.acos(1 - 2*x/length)
-            
     def _radiusAt(self, r1, r2, length, pos):
         if r1 > r2:
             radius = r1 - r2
@@ -53,7 +49,4 @@ class TransitionHaackShapeHandler(TransitionShapeHandler):
             center = r1
             x = pos
 
-        theta = self._theta(x, length)
-        y = radius * math.sqrt(theta - math.sin(2 * theta)/2
-            + self._coefficient * math.pow(math.sin(theta), 3)) / math.sqrt(math.pi)
-        return y + center
+        return ProfileGenerator.haack(x, length, radius, self._coefficient) + center
@@ -24,9 +24,8 @@ __title__ = "FreeCAD Ogive Transition Handler"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
-import math
-
 from Rocket.ShapeHandlers.TransitionShapeHandler import TransitionShapeHandler
+from Rocket.ShapeHandlers import ProfileGenerator
 
 class TransitionOgiveShapeHandler(TransitionShapeHandler):
 
@@ -43,7 +42,4 @@ class TransitionOgiveShapeHandler(TransitionShapeHandler):
             radius = r2 - r1
             center = r1
             x = length - pos
-        rho = (radius * radius + length * length) / (2.0 * radius)
-
-        y = math.sqrt(rho * rho - math.pow(x, 2)) + radius - rho
-        return y + center
+        return ProfileGenerator.ogive(length - x, length, radius) + center
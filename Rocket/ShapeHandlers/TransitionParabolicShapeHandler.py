@@ -27,6 +27,7 @@ __url__ = "https://www.davesrocketshop.com"
 from DraftTools import translate
 
 from Rocket.ShapeHandlers.TransitionShapeHandler import TransitionShapeHandler
+from Rocket.ShapeHandlers import ProfileGenerator
 
 from Rocket.Utilities import validationError    
     
@@ -48,6 +49,4 @@ class TransitionParabolicShapeHandler(TransitionShapeHandler):
             center = r1
             x = pos
 
-        ratio = x / length
-        y = radius * ((2 * ratio) - (self._coefficient * ratio * ratio)) / (2 - self._coefficient)
-        return y + center
+        return ProfileGenerator.parabolic(x, length, radius, self._coefficient) + center
@@ -24,11 +24,10 @@ __title__ = "FreeCAD Haack Transition Handler"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
-import math
-
 from DraftTools import translate
 
 from Rocket.ShapeHandlers.TransitionShapeHandler import TransitionShapeHandler
+from Rocket.ShapeHandlers import ProfileGenerator
 
 from Rocket.Utilities import validationError
     
@@ -50,5 +49,4 @@ class TransitionPowerShapeHandler(TransitionShapeHandler):
             center = r1
             x = pos
 
-        y = radius * math.pow((x / length), self._coefficient)
-        return y + center
+        return ProfileGenerator.power(x, length, radius, self._coefficient) + center
@@ -31,12 +31,14 @@ __url__ = "https://www.davesrocketshop.com"
 import FreeCAD
 import Part
 import math
+import numpy as np
 
 from DraftTools import translate
 
 from Rocket.Constants import STYLE_CAPPED, STYLE_HOLLOW, STYLE_SOLID, STYLE_SOLID_CORE
 from Rocket.Constants import STYLE_CAP_BAR, STYLE_CAP_CROSS
 
+from Rocket.ShapeHandlers import ProfileGenerator
 from Rocket.Utilities import _err, validationError
 
 CLIP_PRECISION = 0.00001
@@ -374,20 +376,20 @@ class TransitionShapeHandler():
         else:
             points = [FreeCAD.Vector(min, r1)] # 2,3
 
-        for i in range(1, self._resolution):
-            
-            if self._clipped:
-                if r1 < r2: # 0
-                    x = min + (float(i) * ((max - min) / float(self._resolution)))
-                    y = self._radiusAt(r2, 0.0, length, self._length - x)
-                else: # 1
-                    x = max - (float(i) * ((max - min) / float(self._resolution)))
-                    y = self._radiusAt(r1, 0.0, length, x)
-            else:
-                # 2,3
-                x = float(i) * ((max - min) / float(self._resolution)) + min
-                y = self._radiusAt(r1, r2, length, x)
-            points.append(FreeCAD.Vector(x, y))
+        # Evaluate the interior points all at once
+        step = np.arange(1, self._resolution) * ((max - min) / float(self._resolution))
+        if self._clipped:
+            if r1 < r2: # 0
+                x = min + step
+                y = self._radiusAt(r2, 0.0, length, self._length - x)
+            else: # 1
+                x = max - step
+                y = self._radiusAt(r1, 0.0, length, x)
+        else:
+            # 2,3
+            x = step + min
+            y = self._radiusAt(r1, r2, length, x)
+        points.extend(ProfileGenerator.toVectors(x, y))
 
         if self._clipped:
             if r1 < r2:
@@ -429,6 +431,20 @@ class TransitionShapeHandler():
         curve = self._generateCurve(foreY, aftY, self._getLength(), foreX, aftX)
         return curve
 
+    def getRadius(self, x):
+        """ Return the outer radius of the transition at a distance x from the fore end """
+        return float(self.radius(x))
+
+    def radius(self, x):
+        """ Return the outer radius of the transition at each of an array of distances x from the fore end """
+        x = np.clip(np.asarray(x, dtype=float), 0.0, self._length)
+        if self._clipped:
+            self._calculateClip(self._foreRadius, self._aftRadius)
+            if self._aftRadius > self._foreRadius:
+                return self._radiusAt(self._aftRadius, 0.0, self._clipLength, self._length - x)
+            return self._radiusAt(self._foreRadius, 0.0, self._clipLength, x)
+        return self._radiusAt(self._foreRadius, self._aftRadius, self._length, x)
+
     def _clippedInnerRadius(self, r1, r2, pos):
         radius1 = r1 - self._thickness
         radius2 = r2 - self._thickness
@@ -74,14 +74,21 @@ class ComponentChangeEvent(): # extends EventObject {
     GRAPHIC_CHANGE = GRAPHIC.value
 	
 			
+    # Changes that may move or resize components, requiring the rocket to be repositioned
+    POSITION_CHANGE = (MASS.value | AERODYNAMIC.value | TREE.value | UNDO.value)
+
     component = None
     type = None
 	
     def __init__(self, component, eventType):
         self.component = component
-        if eventType is None or eventType == ERROR:
+        if eventType is None or eventType == ERROR or eventType == ERROR.value:
             raise ValueError("no event type provided")
-        self.type = eventType.value	
+        if isinstance(eventType, Type):
+            self.type = eventType.value
+        else:
+            # Event types are usually passed as the bit masks defined above
+            self.type = int(eventType)
 
     # Return the source component of this event as specified in the constructor.
     def getSource(self):
@@ -115,9 +122,19 @@ class ComponentChangeEvent(): # extends EventObject {
     def isMotorChange(self):
         return MOTOR.matches(self.type)
 
+    def isPositionChange(self):
+        return 0 != (self.POSITION_CHANGE & self.type)
+
     def getType(self):
         return self.type
 
+    # Combine another event into this one.  The types are merged and the source
+    # becomes the source of the latest event.
+    def merge(self, other):
+        self.type |= other.getType()
+        if other.getSource() is not None:
+            self.component = other.getSource()
+
     def __str__(self):
         s = ""
         
@@ -136,7 +153,7 @@ class ComponentChangeEvent(): # extends EventObject {
         if self.isEventChange():
             s += ",event"
         
-        if s.length() > 0:
+        if len(s) > 0:
             s = s[1:]
         
         return "ComponentChangeEvent[" + s + "]"
@@ -0,0 +1,64 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Process pools that work both inside FreeCAD and from the command line"""
+
+__title__ = "FreeCAD Rocket Process Pool"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+
+import os
+import sys
+import multiprocessing
+import concurrent.futures
+
+def _initWorker(path):
+    # The workers are plain Python interpreters, so they need the FreeCAD and workbench paths
+    for entry in reversed(path):
+        if entry not in sys.path:
+            sys.path.insert(0, entry)
+
+def findInterpreter():
+    """ Return the Python interpreter for worker processes, or None when there isn't one """
+    # Inside FreeCAD sys.executable is FreeCAD itself, so use the bundled interpreter
+    if os.path.basename(sys.executable).lower().startswith("python"):
+        return sys.executable
+    name = "python.exe" if sys.platform == "win32" else "python"
+    executable = os.path.join(FreeCAD.getHomePath(), "bin", name)
+    if os.path.exists(executable):
+        return executable
+    return None
+
+def makeProcessPool(workers):
+    """
+        Return a pool of spawned worker processes, or None when no interpreter is found and
+        the work should be done serially. Spawning is used on all platforms, as forking
+        FreeCAD isn't safe.
+    """
+    executable = findInterpreter()
+    if executable is None:
+        return None
+
+    context = multiprocessing.get_context("spawn")
+    context.set_executable(executable)
+    return concurrent.futures.ProcessPoolExecutor(workers, mp_context=context, initializer=_initWorker,
+                                                  initargs=(list(sys.path),))
@@ -25,15 +25,24 @@ __url__ = "https://www.davesrocketshop.com"
 import unittest
 
 from Tests.TestBodyTube import BodyTubeTests
+from Tests.TestShapeCache import ShapeCacheTests
+from Tests.TestShapeBuilder import ShapeBuilderTests
 from Tests.TestBulkhead import BulkheadTests
 from Tests.TestCenteringRing import CenteringRingTests
 from Tests.TestNoses import NoseTests
 from Tests.TestTransition import TransitionTests
 from Tests.TestFlutter import FinFlutterTestCases
+from Tests.TestMass import MassTests
+from Tests.TestBarrowman import BarrowmanTests
 from Tests.TestFins import FinTests
+from Tests.TestOpenRocketParser import OpenRocketParserTests
+from Tests.TestFlightData import FlightDataTests
+from Tests.TestCatalogue import CatalogueTests
+from Tests.TestPartMatcher import PartMatcherTests
 # from Tests.TestFinCans import FinCanTests
 from Tests.Components.RocketTest import RocketTest
 from Tests.Components.PositionTests import PositionTests
+from Tests.Components.EventTests import EventTests
 from Tests.TestMoves import MoveTests
 
 def runRocketUnitTests():
@@ -0,0 +1,174 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+"""Class for testing component change events"""
+
+__title__ = "FreeCAD Rocket Tests"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+    
+import FreeCAD
+import unittest
+
+from Rocket.interfaces.ComponentChangeListener import ComponentChangeListener
+from Rocket.events.ComponentChangeEvent import ComponentChangeEvent
+
+from Tests.util.TestRockets import TestRockets
+
+class EventCounter(ComponentChangeListener):
+
+    def __init__(self):
+        self.events = []
+
+    def componentChanged(self, event):
+        self.events.append(event)
+
+class EventTests(unittest.TestCase):
+
+    def setUp(self):
+        self.Doc = FreeCAD.newDocument("EventTests")
+
+    def tearDown(self):
+        FreeCAD.closeDocument(self.Doc.Name)
+
+    def testRepositionAfterChange(self):
+        rocket = TestRockets.makeEstesAlphaIII()
+        stage = rocket.getChild(0).Proxy
+        nose = stage.getChild(0).Proxy
+        body = stage.getChild(1).Proxy
+        fins = body.getChild(0).Proxy
+        mmt = body.getChild(2).Proxy
+
+        massModID = rocket.getMassModID()
+        treeModID = rocket.getTreeModID()
+
+        # Changing the nose moves everything after it
+        nose.setLength(80.0)
+        self.assertEqual(body.getPosition().x, 80.0, body.getName() + " not repositioned")
+        self.assertEqual(fins.getPosition().x, 230.0, fins.getName() + " not repositioned")
+        self.assertEqual(mmt.getPosition().x, 213.0, mmt.getName() + " not repositioned")
+
+        # Changing the body only moves its children
+        body.setLength(250.0)
+        self.assertEqual(nose.getPosition().x, 0.0, nose.getName() + " should not move")
+        self.assertEqual(fins.getPosition().x, 280.0, fins.getName() + " not repositioned")
+        self.assertEqual(mmt.getPosition().x, 213.0, mmt.getName() + " should not move")
+
+        self.assertNotEqual(rocket.getMassModID(), massModID, "Mass modification ID not updated")
+        self.assertEqual(rocket.getTreeModID(), treeModID, "Tree modification ID should not change")
+
+    def testCoalescedEdit(self):
+        rocket = TestRockets.makeEstesAlphaIII()
+        stage = rocket.getChild(0).Proxy
+        nose = stage.getChild(0).Proxy
+        body = stage.getChild(1).Proxy
+        fins = body.getChild(0).Proxy
+
+        listener = EventCounter()
+        rocket.addComponentChangeListener(listener)
+
+        rocket.beginEdit()
+        nose.setLength(80.0)
+        body.setLength(250.0)
+        body.setOuterRadius(13.0)
+        self.assertEqual(len(listener.events), 0, "Events fired during an edit")
+        rocket.endEdit()
+
+        self.assertEqual(len(listener.events), 1, "Events not coalesced")
+        event = listener.events[0]
+        self.assertTrue(event.isMassChange())
+        self.assertTrue(event.isAerodynamicChange())
+        self.assertFalse(event.isTreeChange())
+        self.assertEqual(fins.getPosition().x, 280.0, fins.getName() + " not repositioned")
+
+        rocket.removeComponentChangeListener(listener)
+
+    def testBatch(self):
+        rocket = TestRockets.makeEstesAlphaIII()
+        stage = rocket.getChild(0).Proxy
+        nose = stage.getChild(0).Proxy
+        body = stage.getChild(1).Proxy
+        fins = body.getChild(0).Proxy
+
+        listener = EventCounter()
+        rocket.addComponentChangeListener(listener)
+
+        with rocket.batch():
+            nose.setLength(80.0)
+            with rocket.batch():
+                body.setLength(250.0)
+            self.assertTrue(rocket.isFrozen())
+            self.assertEqual(len(listener.events), 0, "Events fired during a batch")
+
+        self.assertFalse(rocket.isFrozen())
+        self.assertEqual(len(listener.events), 1, "Events not merged")
+        self.assertEqual(fins.getPosition().x, 280.0, fins.getName() + " not repositioned")
+
+        # Properties set directly are treated as a change to the component
+        with body.batch():
+            body._obj.Length = 200.0
+        self.assertEqual(len(listener.events), 2, "Component batch did not fire")
+        self.assertEqual(fins.getPosition().x, 230.0, fins.getName() + " not repositioned")
+
+        rocket.removeComponentChangeListener(listener)
+
+        self.assertRaises(Exception, rocket.thaw)
+
+    def testBatchException(self):
+        rocket = TestRockets.makeEstesAlphaIII()
+        stage = rocket.getChild(0).Proxy
+        nose = stage.getChild(0).Proxy
+        body = stage.getChild(1).Proxy
+        self.Doc.recompute()
+
+        listener = EventCounter()
+        rocket.addComponentChangeListener(listener)
+
+        # A failed batch is thawed, but the partial edit isn't recomputed
+        with self.assertRaises(ValueError):
+            with rocket.batch():
+                nose.setLength(80.0)
+                raise ValueError("Failed edit")
+        self.assertFalse(rocket.isFrozen())
+        self.assertEqual(len(listener.events), 1, "Events not thawed")
+        self.assertIn("Touched", nose._obj.State, "Failed batch was recomputed")
+
+        self.Doc.recompute()
+        with self.assertRaises(ValueError):
+            with body.batch():
+                body._obj.Length = 200.0
+                raise ValueError("Failed edit")
+        self.assertFalse(rocket.isFrozen())
+        self.assertIn("Touched", body._obj.State, "Failed component batch was recomputed")
+
+        rocket.removeComponentChangeListener(listener)
+
+    def testEventTypes(self):
+        event = ComponentChangeEvent(None, ComponentChangeEvent.MASS_CHANGE)
+        self.assertTrue(event.isMassChange())
+        self.assertTrue(event.isPositionChange())
+        self.assertFalse(event.isAerodynamicChange())
+
+        event.merge(ComponentChangeEvent(None, ComponentChangeEvent.NONFUNCTIONAL_CHANGE))
+        self.assertTrue(event.isMassChange())
+        self.assertTrue(event.isNonFunctionalChange())
+        self.assertEqual(str(event), "ComponentChangeEvent[nonfunc,mass]")
+
+        event = ComponentChangeEvent(None, ComponentChangeEvent.TEXTURE_CHANGE)
+        self.assertFalse(event.isPositionChange())
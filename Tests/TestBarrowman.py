@@ -0,0 +1,107 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for testing the Barrowman calculator"""
+
+__title__ = "FreeCAD Rocket Tests"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+import math
+import unittest
+import numpy as np
+
+from Analyzers.BarrowmanCalculator import BarrowmanCalculator
+from Rocket.FlightConfiguration import FlightConfiguration
+
+from Tests.util.TestRockets import TestRockets
+
+class BarrowmanTests(unittest.TestCase):
+
+    def setUp(self):
+        self.Doc = FreeCAD.newDocument("BarrowmanTests")
+        self._rocket = TestRockets.makeEstesAlphaIII()
+        self._calculator = BarrowmanCalculator()
+        self._config = FlightConfiguration(self._rocket)
+
+        stage = self._rocket.getChild(0).Proxy
+        self._nose = stage.getChild(0).Proxy
+        self._body = stage.getChild(1).Proxy
+        self._fins = self._body.getChild(0).Proxy
+
+    def tearDown(self):
+        FreeCAD.closeDocument(self.Doc.Name)
+
+    def testNose(self):
+        # Any nose cone has a normal force coefficient slope of 2 referenced to its base area
+        referenceArea = self._config.getReferenceArea()
+        radius = float(self._nose._obj.Diameter) / 2.0
+        cna, cp = self._calculator.getComponentAero(self._nose).normalForce(np.zeros(1), referenceArea)
+        self.assertAlmostEqual(cna[0], 2.0 * math.pi * radius * radius / referenceArea, places=6)
+        self.assertGreater(cp[0], 0.0)
+        self.assertLess(cp[0], float(self._nose._obj.Length))
+
+    def testFins(self):
+        # Barrowman's equation for a trapezoidal fin set, including body interference
+        obj = self._fins._obj
+        rootChord = float(obj.RootChord)
+        tipChord = float(obj.TipChord)
+        sweep = float(obj.SweepLength)
+        span = float(obj.Height)
+        radius = float(obj.ParentRadius)
+        midChord = math.hypot(sweep + (tipChord - rootChord) / 2.0, span)
+
+        referenceLength = self._config.getReferenceLength()
+        cna = 4.0 * int(obj.FinCount) * (span / referenceLength) ** 2 / \
+            (1.0 + math.sqrt(1.0 + (2.0 * midChord / (rootChord + tipChord)) ** 2))
+        cna *= 1.0 + radius / (span + radius)
+        cp = sweep * (rootChord + 2.0 * tipChord) / (3.0 * (rootChord + tipChord)) + \
+            (rootChord + tipChord - rootChord * tipChord / (rootChord + tipChord)) / 6.0
+
+        finCna, finCp = self._calculator.getComponentAero(self._fins).normalForce(np.zeros(1),
+                                                                                  self._config.getReferenceArea())
+        self.assertAlmostEqual(finCna[0], cna, places=4)
+        self.assertAlmostEqual(finCp[0], cp, places=3)
+
+    def testCache(self):
+        nose = self._calculator.getComponentAero(self._nose)
+        fins = self._calculator.getComponentAero(self._fins)
+        self.assertIs(self._calculator.getComponentAero(self._fins), fins, "Unchanged component recalculated")
+
+        self._fins.setHeight(60.0)
+        self.assertIsNot(self._calculator.getComponentAero(self._fins), fins, "Changed component not recalculated")
+        self.assertIs(self._calculator.getComponentAero(self._nose), nose, "Unchanged component recalculated")
+
+    def testMach(self):
+        machs = [0.1, 0.5, 0.9, 1.2, 2.0, 3.0]
+        forces = self._calculator.calculate(self._config, machs)
+        self.assertEqual(len(forces.cp), len(machs))
+        self.assertEqual(len(forces.cna), len(machs))
+        for cna in forces.cna:
+            self.assertGreater(cna, 0.0)
+
+        # The fin center of pressure moves aft at supersonic speeds
+        cna, cp = self._calculator.getComponentAero(self._fins).normalForce(forces.mach, self._config.getReferenceArea())
+        self.assertGreater(cp[-1], cp[0])
+
+    def testStability(self):
+        margin = self._calculator.getStaticMargin(self._config, 0.3)
+        self.assertGreater(margin[0], 1.0, "Alpha III should be stable")
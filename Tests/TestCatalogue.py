@@ -0,0 +1,134 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for testing the in memory parts catalogue"""
+
+__title__ = "FreeCAD Rocket Tests"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import math
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from Rocket.Parts.Catalogue import Catalogue
+
+# (manufacturer, part number, type, outer diameter, inner diameter, length, units)
+BODY_TUBES = [
+    ("Estes", "BT-20", "Body Tube", 0.736, 0.710, 18.0, "in"),
+    ("Estes", "BT-50", "Body Tube", 0.976, 0.950, 18.0, "in"),
+    ("Apogee", "10083", "Body Tube", 24.8, 24.1, 457.0, "mm"),
+    ("Apogee", "10084", "Tube Coupler", 24.1, 22.9, 50.0, "mm"),
+    ("Quest", "Q-1", "Body Tube", 2.48, 2.41, 30.0, "furlongs"),
+]
+
+def _createDatabase(path, tubes):
+    connection = sqlite3.connect(path)
+    cursor = connection.cursor()
+    cursor.execute("CREATE TABLE component (component_index INTEGER PRIMARY KEY, manufacturer TEXT, part_number TEXT)")
+    cursor.execute("CREATE TABLE tube_type (tube_type_index INTEGER PRIMARY KEY, type TEXT)")
+    cursor.execute("CREATE TABLE body_tube (body_tube_index INTEGER PRIMARY KEY, component_index INTEGER, "
+                   "tube_type_index INTEGER, outer_diameter REAL, outer_diameter_units TEXT, inner_diameter REAL, "
+                   "inner_diameter_units TEXT, length REAL, length_units TEXT)")
+    cursor.executemany("INSERT INTO tube_type (tube_type_index, type) VALUES (?, ?)",
+                       [(1, "Body Tube"), (2, "Tube Coupler")])
+    for manufacturer, partNumber, type, outer, inner, length, units in tubes:
+        cursor.execute("INSERT INTO component (manufacturer, part_number) VALUES (?, ?)", (manufacturer, partNumber))
+        cursor.execute("INSERT INTO body_tube (component_index, tube_type_index, outer_diameter, outer_diameter_units, "
+                       "inner_diameter, inner_diameter_units, length, length_units) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                       (cursor.lastrowid, 1 if type == "Body Tube" else 2, outer, units, inner, units, length, units))
+    connection.commit()
+    connection.close()
+
+class CatalogueTests(unittest.TestCase):
+
+    def setUp(self):
+        self._folder = tempfile.mkdtemp()
+        self._path = os.path.join(self._folder, "Parts.db")
+        _createDatabase(self._path, BODY_TUBES)
+        self._table = Catalogue(self._path).getTable("body_tube")
+
+    def tearDown(self):
+        shutil.rmtree(self._folder)
+
+    def _partNumbers(self, rows):
+        return [str(partNumber) for partNumber in self._table.partNumbers[rows]]
+
+    def testLoad(self):
+        table = self._table
+        self.assertEqual(len(table), 5)
+        self.assertEqual(table.getLabels("manufacturer"), ["Apogee", "Estes", "Quest"])
+        self.assertEqual(table.getLabels("type"), ["Body Tube", "Tube Coupler"])
+        self.assertEqual(table.getIndexes(table.filter()).tolist(), [1, 2, 3, 4, 5])
+
+        # Dimensions are in metres, and unknown units are NaN
+        self.assertAlmostEqual(table.data["outer_diameter"][0], 0.736 * 0.0254)
+        self.assertAlmostEqual(table.data["length"][2], 0.457)
+        self.assertTrue(math.isnan(table.data["outer_diameter"][4]))
+
+    def testFilter(self):
+        table = self._table
+        self.assertEqual(self._partNumbers(table.filter(manufacturer="Estes")), ["BT-20", "BT-50"])
+        self.assertEqual(self._partNumbers(table.filter(type="Tube Coupler")), ["10084"])
+        self.assertEqual(self._partNumbers(table.filter(outer_diameter=(0.0240, 0.0250))), ["BT-50", "10083", "10084"])
+        self.assertEqual(self._partNumbers(table.filter(outer_diameter=(0.0240, None), type="Body Tube")), ["BT-50", "10083"])
+        self.assertEqual(self._partNumbers(table.filter(length=(None, 0.1))), ["10084"])
+
+        # Unknown values match nothing
+        self.assertEqual(len(table.filter(manufacturer="Unknown")), 0)
+        self.assertEqual(len(table.filter(type="Launch Lug")), 0)
+
+    def testSort(self):
+        table = self._table
+        rows = table.filter(outer_diameter=(0.0, None))
+        self.assertEqual(self._partNumbers(table.sort(rows, "outer_diameter")), ["BT-20", "10084", "BT-50", "10083"])
+        self.assertEqual(self._partNumbers(table.sort(rows, "outer_diameter", descending=True)),
+                         ["10083", "BT-50", "10084", "BT-20"])
+
+    def testFindWithin(self):
+        table = self._table
+        matches = table.findWithin("inner_diameter", [0.0241, 0.0187, 0.1], 0.0001)
+        self.assertEqual(len(matches), 3)
+        self.assertEqual(sorted(self._partNumbers(matches[0])), ["10083", "BT-50"])
+        self.assertEqual(self._partNumbers(matches[1]), [])
+        self.assertEqual(self._partNumbers(matches[2]), [])
+
+        # A tighter tolerance excludes the 0.02413m inner diameter of the BT-50
+        matches = table.findWithin("inner_diameter", 0.0241, 0.00002)
+        self.assertEqual(self._partNumbers(matches[0]), ["10083"])
+        self.assertEqual(self._partNumbers(table.findWithin("inner_diameter", 0.018034, 0.000001)[0]), ["BT-20"])
+
+    def testReload(self):
+        catalogue = Catalogue(self._path)
+        table = catalogue.getTable("body_tube")
+        self.assertIs(catalogue.getTable("body_tube"), table)
+
+        os.remove(self._path)
+        _createDatabase(self._path, BODY_TUBES[:2])
+        stat = os.stat(self._path)
+        os.utime(self._path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+        # A modified database is loaded again
+        table = catalogue.getTable("body_tube")
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.getLabels("manufacturer"), ["Estes"])
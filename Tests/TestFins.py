@@ -259,3 +259,38 @@ class FinTests(unittest.TestCase):
                         self._testCenterTriangle(cross, minEdge)
                         self._testAftSweepTriangle(cross, minEdge)
                         self._testForeSweepTriangle(cross, minEdge)
+
+    def testFinSetInstances(self):
+        feature = makeFin('Fin')
+        feature._obj.FinSet = True
+        feature._obj.FinCount = 6
+        feature._obj.FinSpacing = 60.0
+        feature._obj.Cant = 5.0
+        self.Doc.recompute()
+
+        self._checkShape(feature, "Fin set")
+        solids = feature._obj.Shape.Solids
+        self.assertEqual(len(solids), 6)
+        for solid in solids[1:]:
+            # The fins share their geometry and differ only in location
+            self.assertTrue(solid.isPartner(solids[0]))
+            self.assertAlmostEqual(solid.Volume, solids[0].Volume)
+
+    def testExtrudedVolume(self):
+        feature = makeFin('Fin')
+        feature._obj.FinType = FIN_TYPE_TRAPEZOID
+        feature._obj.FinSet = False
+        feature._obj.RootCrossSection = FIN_CROSS_SQUARE
+        feature._obj.TipCrossSection = FIN_CROSS_SQUARE
+        feature._obj.TipSameThickness = True
+        feature._obj.Ttw = True
+        feature._obj.TtwAutoHeight = False
+        feature._obj.TtwHeight = 10.0
+        feature._obj.TtwThickness = feature._obj.RootThickness
+        self.Doc.recompute()
+
+        self._checkShape(feature, "Extruded trapezoid")
+        obj = feature._obj
+        area = (float(obj.RootChord) + float(obj.TipChord)) * float(obj.Height) / 2.0 \
+            + float(obj.TtwLength) * float(obj.TtwHeight)
+        self.assertAlmostEqual(obj.Shape.Volume, area * float(obj.RootThickness), places=3)
@@ -0,0 +1,139 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for testing imported simulation results"""
+
+__title__ = "FreeCAD Rocket Tests"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import io
+import math
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from Rocket.FlightData import loadValues
+from Rocket.Importer.OpenRocket.ParseTree import SectionFilter, parseTree
+from Rocket.Importer.OpenRocket.SimulationReader import SimulationReader
+
+ORK = b"""<?xml version="1.0" encoding="utf-8"?>
+<openrocket version="1.9" creator="OpenRocket 23.09">
+  <rocket>
+    <name>Rocket</name>
+  </rocket>
+  <simulations>
+    <simulation status="uptodate">
+      <name>Simulation &amp; 1</name>
+      <flightdata maxaltitude="20.5" maxvelocity="12.0" flighttime="NaN">
+        <databranch name="Sustainer" types="Time,Altitude,Total velocity">
+          <event time="0.0" type="launch"/>
+          <datapoint>0.0,0.0,0.0</datapoint>
+          <datapoint>1.0,10.0,12.0</datapoint>
+          <event time="1.5" type="apogee"/>
+          <datapoint>2.0,20.0,NaN</datapoint>
+          <datapoint>3.0,15.0,4.0</datapoint>
+          <event time="3.0" type="groundhit"/>
+        </databranch>
+      </flightdata>
+    </simulation>
+    <simulation status="outdated">
+      <name>Simulation 2</name>
+    </simulation>
+  </simulations>
+</openrocket>
+"""
+
+class FlightDataTests(unittest.TestCase):
+
+    def _read(self, size=None):
+        reader = SimulationReader()
+        if size is None:
+            root = parseTree(SectionFilter(io.BytesIO(ORK), ["simulations"], {"simulations" : reader}))
+            self.assertEqual(len(root.children[0].children[1].children), 0)
+        else:
+            for start in range(0, len(ORK), size):
+                reader.feed(ORK[start:start + size])
+        self.assertEqual(reader.getErrors(), [])
+        return reader.getFlightData()
+
+    def testReader(self):
+        for size in [None, 1, 7, 64]:
+            simulations = self._read(size)
+            self.assertEqual(len(simulations), 1)
+
+            flightData = simulations[0]
+            self.assertEqual(flightData.getName(), "Simulation & 1")
+            self.assertEqual(flightData.getBranch(), "Sustainer")
+            self.assertEqual(flightData.getVariables(), ["Time", "Altitude", "Total velocity"])
+            self.assertEqual(len(flightData), 4)
+            self.assertEqual(flightData.getColumn("Altitude").tolist(), [0.0, 10.0, 20.0, 15.0])
+            self.assertEqual(flightData.getEvents(), [(0.0, "launch"), (1.5, "apogee"), (3.0, "groundhit")])
+            self.assertEqual(flightData.getSummary()["maxaltitude"], 20.5)
+            self.assertTrue(math.isnan(flightData.getSummary()["flighttime"]))
+
+    def testQueries(self):
+        flightData = self._read()[0]
+        self.assertEqual(flightData.getMaxAltitude(), 20.5)
+        self.assertEqual(flightData.getMaximum("Altitude"), 20.0)
+        self.assertEqual(flightData.getMaximum("Total velocity"), 12.0)
+        self.assertAlmostEqual(flightData.getAltitudeAt(0.5), 5.0)
+
+        # Missing values are interpolated over
+        self.assertAlmostEqual(flightData.getVelocityAt(2.0), 8.0)
+        self.assertEqual(flightData.valueAt("Altitude", np.array([1.0, 2.5])).tolist(), [10.0, 17.5])
+
+        self.assertEqual(flightData.getEventTime("apogee"), 1.5)
+        self.assertEqual(flightData.getEventTime("burnout"), None)
+        self.assertEqual(flightData.getEvents("groundhit"), [(3.0, "groundhit")])
+        with self.assertRaises(KeyError):
+            flightData.getColumn("Mach number")
+
+    def testSave(self):
+        flightData = self._read()[0]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "FlightData.npy")
+            flightData.save(path)
+
+            values = loadValues(path)
+            self.assertIsInstance(values, np.memmap)
+            self.assertTrue(values.flags.f_contiguous)
+            self.assertTrue(np.array_equal(values, flightData.getValues(), equal_nan=True))
+            del values
+
+    def testMalformed(self):
+        data = ORK.replace(b'<event time="1.5" type="apogee"/>', b'<event type="apogee"/>')
+        data = data.replace(b'<name>Simulation 2</name>',
+                            b'<name>Simulation 2</name><flightdata><databranch types="Time,Altitude">'
+                            b'<datapoint>0.0</datapoint></databranch></flightdata>')
+
+        # Bad simulations are reported, and the rest of the file is still parsed
+        reader = SimulationReader()
+        root = parseTree(SectionFilter(io.BytesIO(data), ["simulations"], {"simulations" : reader}))
+        self.assertEqual([child.tag for child in root.children[0].children], ["rocket", "simulations"])
+
+        self.assertEqual(len(reader.getFlightData()), 0)
+        self.assertEqual(len(reader.getErrors()), 2)
+
+        reader = SimulationReader()
+        reader.feed(ORK.replace(b'<event time="0.0" type="launch"/>', b'<event time="soon" type="launch"/>'))
+        self.assertEqual(len(reader.getFlightData()), 0)
+        self.assertEqual(len(reader.getErrors()), 1)
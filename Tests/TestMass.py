@@ -0,0 +1,216 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for testing the mass calculator"""
+
+__title__ = "FreeCAD Rocket Tests"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+import unittest
+
+from Analyzers.MassCalculator import MassCalculator
+from Rocket.FlightConfiguration import FlightConfiguration
+from Rocket.Constants import TYPE_OGIVE, TYPE_HAACK, TYPE_POWER
+from Rocket.Constants import STYLE_HOLLOW, STYLE_CAPPED, STYLE_CAP_SOLID, STYLE_CAP_BAR
+from Rocket.Constants import FIN_TYPE_SKETCH, FIN_CROSS_SQUARE
+from Rocket.Constants import RAIL_BUTTON_ROUND, RAIL_BUTTON_AIRFOIL
+from Rocket.Constants import RAIL_GUIDE_BASE_FLAT, RAIL_GUIDE_BASE_CONFORMAL, RAIL_GUIDE_BASE_V
+
+from Tests.util.Measure import measureVolume
+from Tests.util.TestRockets import TestRockets
+
+from Ui.Commands.CmdBodyTube import makeBodyTube
+from Ui.Commands.CmdFin import makeFin
+from Ui.Commands.CmdFinCan import makeFinCan
+from Ui.Commands.CmdLaunchGuides import makeRailButton, makeRailGuide
+from Ui.Commands.CmdPod import makePod
+from Ui.Commands.CmdSketcher import newPolygonNoEdit
+
+class MassTests(unittest.TestCase):
+
+    def setUp(self):
+        self.Doc = FreeCAD.newDocument("MassTests")
+        self._rocket = TestRockets.makeEstesAlphaIII()
+        self._calculator = MassCalculator()
+
+        stage = self._rocket.getChild(0).Proxy
+        self._nose = stage.getChild(0).Proxy
+        self._body = stage.getChild(1).Proxy
+        self._fins = self._body.getChild(0).Proxy
+        self._rings = self._body.getChild(3).Proxy
+
+    def tearDown(self):
+        FreeCAD.closeDocument(self.Doc.Name)
+
+    def _assertVolume(self, component, tolerance):
+        obj = component._obj
+        density = self._calculator._density(obj)
+        if density <= 0:
+            self.skipTest("Default material has no density")
+
+        volume = self._calculator.getComponentMass(component).mass / density
+        self.assertAlmostEqual(volume / float(obj.Shape.Volume), 1.0, delta=tolerance,
+                               msg=component.getName() + " volume does not match the solid")
+
+    def _density(self, component):
+        density = self._calculator._density(component._obj)
+        if density <= 0:
+            self.skipTest("Default material has no density")
+        return density
+
+    def _assertSolid(self, component, tolerance, message):
+        # For solids with only planar, cylindrical and conical faces, where Shape.Volume is exact
+        shape = component._obj.Shape
+        body = self._calculator.getComponentMass(component)
+        self.assertAlmostEqual(body.mass / self._density(component) / shape.Volume, 1.0, delta=tolerance, msg=message)
+        center = component._obj.Placement.inverse().multVec(shape.CenterOfMass)
+        self.assertAlmostEqual((body.cg - center).Length, 0.0, delta=0.01, msg=message)
+
+    def testVolumes(self):
+        self._assertVolume(self._body, 0.0001)
+        self._assertVolume(self._rings, 0.0001)
+        self._assertVolume(self._nose, 0.01)
+        self._assertVolume(self._fins, 0.001)
+
+    def testCache(self):
+        body = self._calculator.getComponentMass(self._body)
+        nose = self._calculator.getComponentMass(self._nose)
+        self.assertIs(self._calculator.getComponentMass(self._body), body, "Unchanged component recalculated")
+
+        self._body.setLength(250.0)
+        self.assertIsNot(self._calculator.getComponentMass(self._body), body, "Changed component not recalculated")
+        self.assertIs(self._calculator.getComponentMass(self._nose), nose, "Unchanged component recalculated")
+        self.assertGreater(self._calculator.getComponentMass(self._body).mass, body.mass)
+
+    def testConfiguration(self):
+        config = FlightConfiguration(self._rocket)
+        rocket = self._calculator.calculate(config)
+
+        total = 0.0
+        for component in config.getActiveComponents():
+            if component.isMassive():
+                total += self._calculator.getComponentMass(component).mass
+        self.assertAlmostEqual(rocket.mass, total)
+
+        # The CG must lie on the centerline within the airframe
+        self.assertGreater(rocket.cg.x, 0.0)
+        self.assertLess(rocket.cg.x, 270.0)
+        self.assertAlmostEqual(rocket.cg.y, 0.0, delta=0.5)
+        self.assertAlmostEqual(rocket.cg.z, 0.0, delta=0.5)
+
+    def testPods(self):
+        pod = makePod('Pod')
+        self._body.addChild(pod._obj)
+        tube = makeBodyTube('BodyTube')
+        pod.addChild(tube._obj)
+        self.Doc.recompute()
+
+        tubeMass = self._calculator.getComponentMass(tube).mass
+        if tubeMass <= 0:
+            self.skipTest("Default material has no density")
+
+        config = FlightConfiguration(self._rocket)
+        single = self._calculator.calculate(config)
+
+        # Each instance of the pod adds its contents again
+        pod._obj.PodCount = 3
+        pod._obj.PodSpacing = 120.0
+        rocket = self._calculator.calculate(config)
+        self.assertAlmostEqual(rocket.mass, single.mass + 2.0 * tubeMass)
+        self.assertGreater(rocket.ixx, single.ixx)
+
+        # Evenly spaced pods keep the CG on the centerline
+        self.assertAlmostEqual(rocket.cg.y, 0.0, delta=0.5)
+        self.assertAlmostEqual(rocket.cg.z, 0.0, delta=0.5)
+
+    def testShellNoses(self):
+        # The walls of curved profiles follow the inner curves as drawn
+        obj = self._nose._obj
+        for type in [TYPE_OGIVE, TYPE_HAACK, TYPE_POWER]:
+            for style, capStyle in [(STYLE_HOLLOW, STYLE_CAP_SOLID), (STYLE_CAPPED, STYLE_CAP_SOLID),
+                                    (STYLE_CAPPED, STYLE_CAP_BAR)]:
+                with self.subTest(type=type, style=style, capStyle=capStyle):
+                    obj.NoseType = type
+                    if type == TYPE_POWER:
+                        obj.Coefficient = 0.5
+                    obj.NoseStyle = style
+                    obj.CapStyle = capStyle
+                    self.Doc.recompute()
+
+                    body = self._calculator.getComponentMass(self._nose)
+                    volume, cg = measureVolume(obj.Shape)
+                    self.assertAlmostEqual(body.mass / self._density(self._nose) / volume, 1.0, delta=0.005)
+                    self.assertAlmostEqual(body.cg.x, cg, delta=0.01 * float(obj.Length))
+
+    def testRailButtons(self):
+        for type in [RAIL_BUTTON_ROUND, RAIL_BUTTON_AIRFOIL]:
+            for fastener in [False, True]:
+                with self.subTest(type=type, fastener=fastener):
+                    button = makeRailButton('RailButton')
+                    button._obj.RailButtonType = type
+                    button._obj.Fastener = fastener
+                    button._obj.FilletedTop = False
+                    self.Doc.recompute()
+
+                    self._assertSolid(button, 0.001, type)
+
+    def testRailGuides(self):
+        for base in [RAIL_GUIDE_BASE_FLAT, RAIL_GUIDE_BASE_CONFORMAL, RAIL_GUIDE_BASE_V]:
+            for options in [False, True]:
+                with self.subTest(base=base, options=options):
+                    guide = makeRailGuide('RailGuide')
+                    guide._obj.RailGuideBaseType = base
+                    guide._obj.ForwardSweep = options
+                    guide._obj.AftSweep = options
+                    guide._obj.Notch = options
+                    self.Doc.recompute()
+
+                    self._assertSolid(guide, 0.0001, base)
+
+    def testSketchFins(self):
+        fin = makeFin('Fin')
+        fin._obj.FinType = FIN_TYPE_SKETCH
+        fin._obj.RootCrossSection = FIN_CROSS_SQUARE
+        fin._obj.Profile = newPolygonNoEdit([(0, 0), (60, 0), (70, 40), (45, 50), (20, 30)])
+        self.Doc.recompute()
+
+        self._assertSolid(fin, 0.001, "Sketch fin")
+
+        # Changing the profile recalculates the fin
+        mass = self._calculator.getComponentMass(fin).mass
+        fin._obj.Profile = newPolygonNoEdit([(0, 0), (60, 0), (70, 60), (45, 70), (20, 30)])
+        self.Doc.recompute()
+        self.assertGreater(self._calculator.getComponentMass(fin).mass, mass)
+
+    def testFinCanAxes(self):
+        # Fin cans use their solid, with the inertia in the axes of the component
+        can = makeFinCan('FinCan')
+        self.Doc.recompute()
+        self._density(can)
+        body = self._calculator.getComponentMass(can)
+
+        can._obj.Placement = FreeCAD.Placement(FreeCAD.Vector(10, 0, 0), FreeCAD.Rotation(FreeCAD.Vector(0, 0, 1), 90))
+        self.Doc.recompute()
+        rotated = self._calculator.getComponentMass(can)
+        self.assertAlmostEqual(rotated.ixx / body.ixx, 1.0, delta=1e-6)
+        self.assertAlmostEqual(rotated.iyy / body.iyy, 1.0, delta=1e-6)
+        self.assertAlmostEqual(rotated.izz / body.izz, 1.0, delta=1e-6)
@@ -33,6 +33,8 @@ from Rocket.Constants import STYLE_CAP_SOLID, STYLE_CAP_BAR, STYLE_CAP_CROSS
 
 from Ui.Commands.CmdNoseCone import makeNoseCone
 
+from Tests.util.Measure import measureVolume
+
 class NoseTests(unittest.TestCase):
 
     def setUp(self):
@@ -107,4 +109,39 @@ class NoseTests(unittest.TestCase):
                     with self.subTest(capStyle=capStyle):
                         self._testPlain(type, STYLE_CAPPED, capStyle)
                         self._testShoulder(type, STYLE_CAPPED, capStyle)
-    
\ No newline at end of file
+    
+    def _checkVolume(self, feature, message):
+        volume, cg = measureVolume(feature._obj.Shape)
+        analyticVolume, analyticCG, ixx, iyy = feature.getShapeHandler().getVolumeProperties()
+        self.assertAlmostEqual(analyticVolume / volume, 1.0, delta=0.005, msg=message)
+        self.assertAlmostEqual(analyticCG, cg, delta=0.01 * float(feature._obj.Length), msg=message)
+
+    def testSolidVolume(self):
+        # The analytic properties must agree with the revolved solid
+        for type in self._getTypes():
+            with self.subTest(type=type):
+                for shoulder in [False, True]:
+                    feature = makeNoseCone('NoseCone')
+                    self._setType(feature, type)
+                    feature._obj.NoseStyle = STYLE_SOLID
+                    feature._obj.Shoulder = shoulder
+                    self.Doc.recompute()
+
+                    self._checkVolume(feature, type)
+
+    def testShellVolume(self):
+        # The analytic walls follow the inner curves as drawn, less any cut outs in the cap
+        styles = [(STYLE_HOLLOW, STYLE_CAP_SOLID)] + \
+            [(STYLE_CAPPED, capStyle) for capStyle in [STYLE_CAP_SOLID, STYLE_CAP_BAR, STYLE_CAP_CROSS]]
+        for type in self._getTypes():
+            for style, capStyle in styles:
+                for shoulder in [False, True]:
+                    with self.subTest(type=type, style=style, capStyle=capStyle, shoulder=shoulder):
+                        feature = makeNoseCone('NoseCone')
+                        self._setType(feature, type)
+                        feature._obj.NoseStyle = style
+                        feature._obj.CapStyle = capStyle
+                        feature._obj.Shoulder = shoulder
+                        self.Doc.recompute()
+
+                        self._checkVolume(feature, type + ": " + style + ", " + capStyle)
@@ -0,0 +1,101 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for testing the OpenRocket parse phase"""
+
+__title__ = "FreeCAD Rocket Tests"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import io
+import unittest
+
+from Rocket.Importer.OpenRocket.ParseTree import SectionFilter, parseTree
+
+ORK = """<?xml version="1.0" encoding="utf-8"?>
+<openrocket version="1.9" creator="OpenRocket 23.09">
+  <rocket>
+    <name>Test &amp; Rocket</name>
+    <subcomponents>
+      <stage>
+        <name>Sustainer</name>
+        <subcomponents>
+          <bodytube>
+            <position type="after">0.0</position>
+            <length>0.3</length>
+          </bodytube>
+        </subcomponents>
+      </stage>
+    </subcomponents>
+  </rocket>
+  <simulations>
+    <simulation status="uptodate">
+      <name>Simulation 1</name>
+    </simulation>
+  </simulations>
+</openrocket>
+"""
+
+class OpenRocketParserTests(unittest.TestCase):
+
+    def _parse(self, skip=()):
+        return parseTree(io.StringIO(ORK), skip)
+
+    def testTree(self):
+        root = self._parse()
+        self.assertEqual(len(root.children), 1)
+
+        openrocket = root.children[0]
+        self.assertEqual(openrocket.tag, "openrocket")
+        self.assertEqual(openrocket.attributes["version"], "1.9")
+        self.assertEqual([child.tag for child in openrocket.children], ["rocket", "simulations"])
+
+        rocket = openrocket.children[0]
+        self.assertEqual(rocket.children[0].content, "Test & Rocket")
+
+        body = rocket.children[1].children[0].children[1].children[0]
+        self.assertEqual(body.tag, "bodytube")
+        self.assertEqual(body.children[0].attributes["type"], "after")
+        self.assertEqual(body.children[0].content, "0.0")
+        self.assertEqual(body.children[1].content, "0.3")
+        self.assertEqual(body.children[1].line, 11)
+
+    def testSkip(self):
+        root = self._parse([("openrocket", "simulations")])
+        openrocket = root.children[0]
+        simulations = openrocket.children[1]
+        self.assertEqual(simulations.tag, "simulations")
+        self.assertEqual(len(simulations.children), 0)
+
+        # Only the exact path is skipped
+        rocket = openrocket.children[0]
+        self.assertEqual(len(rocket.children), 2)
+
+    def testSectionFilter(self):
+        data = b'<openrocket version="1.9"><photostudio/><simulations count="1"><simulation/></simulations>' \
+               b'<simulationsummary>kept</simulationsummary></openrocket>'
+        filtered = SectionFilter(io.BytesIO(data), ["simulations", "photostudio"]).read()
+        self.assertEqual(filtered, b'<openrocket version="1.9"><photostudio/><simulations count="1"></simulations>'
+                                   b'<simulationsummary>kept</simulationsummary></openrocket>')
+
+        root = parseTree(SectionFilter(io.BytesIO(ORK.encode()), ["simulations"]))
+        openrocket = root.children[0]
+        self.assertEqual([child.tag for child in openrocket.children], ["rocket", "simulations"])
+        self.assertEqual(len(openrocket.children[1].children), 0)
@@ -0,0 +1,174 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for testing matching catalogue parts to a design"""
+
+__title__ = "FreeCAD Rocket Tests"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import math
+import unittest
+import numpy as np
+
+from Rocket.Constants import FEATURE_BODY_TUBE, FEATURE_INNER_TUBE, FEATURE_NOSE_CONE
+from Rocket.Parts.Catalogue import PartTable
+from Rocket.Parts.PartMatcher import PartMatcher, MATCH_BODY_TUBE, MATCH_COUPLER, MATCH_CENTERING_RING, \
+    MATCH_NOSE_CONE, MATCH_AFT_BODY_TUBE
+
+NAN = math.nan
+
+# (manufacturer, part number, type, outer diameter, inner diameter, length) in mm
+BODY_TUBES = [
+    ("Estes", "BT-50", "Body Tube", 24.8, 24.1, 457.0),
+    ("Apogee", "C-50", "Tube Coupler", 24.1, 23.4, 50.0),
+    ("Estes", "JT-50", "Tube Coupler", 24.3, 23.6, 40.0),   # Within the tolerance of the BT-50
+    ("Quest", "QC-50", "Tube Coupler", 24.7, 24.0, 40.0),   # Outside the tolerance
+    ("Estes", "RA-2050", "Centering Ring", 24.1, 18.0, 6.0),
+    ("Apogee", "CR-2050", "Centering Ring", 24.0, 18.4, 6.0),
+    ("Quest", "CR-2051", "Centering Ring", 24.1, 18.7, 6.0), # Outside the tolerance
+    ("Estes", "BT-20", "Body Tube", 18.0, 17.5, 457.0),
+]
+
+# (manufacturer, part number, diameter, length, shoulder diameter, shoulder length) in mm
+NOSES = [
+    ("Estes", "PNC-50", 24.8, 70.0, 24.1, 20.0),
+    ("Apogee", "NC-50", NAN, 80.0, 24.1, 20.0),              # Unknown diameter
+    ("Quest", "QN-50", 24.8, 90.0, 23.2, 20.0),
+]
+
+def _table(name, rows, dimensions, text):
+    """ Build a catalogue table from rows of (manufacturer, part number, text..., dimensions...) """
+    columns = list(zip(*rows))
+    dtype = [("index", np.int64), ("component", np.int64), ("manufacturer", np.int32)]
+    dtype += [(column, np.int32) for column in text]
+    dtype += [(dimension, np.float64) for dimension in dimensions]
+    data = np.zeros(len(rows), dtype=dtype)
+    data["index"] = np.arange(1, len(rows) + 1)
+    data["component"] = data["index"]
+
+    labels = {}
+    for position, column in enumerate(["manufacturer"] + text):
+        values = columns[0 if position == 0 else 1 + position]
+        labels[column] = sorted(set(values))
+        data[column] = [labels[column].index(value) for value in values]
+    for position, dimension in enumerate(dimensions):
+        data[dimension] = np.array(columns[2 + len(text) + position], dtype=float) / 1000.0
+
+    return PartTable(name, data, np.array(columns[1], dtype=object), labels)
+
+class _Catalogue:
+
+    def __init__(self):
+        self._tables = {
+            "body_tube" : _table("body_tube", BODY_TUBES, ["outer_diameter", "inner_diameter", "length"], ["type"]),
+            "nose" : _table("nose", [(row[0], row[1], "ogive") + row[2:] for row in NOSES],
+                            ["diameter", "length", "shoulder_diameter", "shoulder_length"], ["shape"])
+        }
+
+    def getTable(self, name):
+        return self._tables[name]
+
+class _Component:
+    """ Stands in for a design component, with diameters in mm """
+
+    def __init__(self, type, outer=0.0, inner=0.0, parent=None, aft=0.0, aftShoulder=0.0):
+        self.Type = type
+        self._outer = outer
+        self._inner = inner
+        self._parent = parent
+        self._aft = aft
+        self._aftShoulder = aftShoulder
+
+    def getOuterDiameter(self):
+        return self._outer
+
+    def getInnerDiameter(self):
+        return self._inner
+
+    def getParent(self):
+        return self._parent
+
+    def isMotorMount(self):
+        return False
+
+    def getAftDiameter(self):
+        return self._aft
+
+    def getAftShoulderDiameter(self):
+        return self._aftShoulder
+
+class PartMatcherTests(unittest.TestCase):
+
+    def setUp(self):
+        self._matcher = PartMatcher(_Catalogue())
+        self._body = _Component(FEATURE_BODY_TUBE, 24.8, 24.1)
+        self._mount = _Component(FEATURE_INNER_TUBE, 18.0, 17.5, self._body)
+
+    def _partNumbers(self, matches, kind):
+        return [match.partNumber for match in matches if match.kind == kind]
+
+    def testCoupler(self):
+        matches = self._matcher.matchComponent(self._body)
+
+        # Best fit first, and parts outside the tolerance are left out
+        self.assertEqual(self._partNumbers(matches, MATCH_COUPLER), ["C-50", "JT-50"])
+        self.assertEqual(self._partNumbers(matches, MATCH_BODY_TUBE), ["BT-50"])
+        coupler = matches[[match.kind for match in matches].index(MATCH_COUPLER)]
+        self.assertEqual(coupler.manufacturer, "Apogee")
+        self.assertEqual(coupler.table, "body_tube")
+        self.assertEqual(coupler.index, 2)
+        self.assertAlmostEqual(coupler.error, 0.0)
+
+    def testNoseShoulder(self):
+        matches = self._matcher.matchComponent(self._body)
+
+        # The nose with an unknown diameter can't be shown to fit
+        self.assertEqual(self._partNumbers(matches, MATCH_NOSE_CONE), ["PNC-50"])
+
+        nose = _Component(FEATURE_NOSE_CONE, aft=24.8, aftShoulder=24.1)
+        self.assertEqual(self._partNumbers(self._matcher.matchComponent(nose), MATCH_AFT_BODY_TUBE), ["BT-50"])
+
+    def testCenteringRing(self):
+        matches = self._matcher.matchComponent(self._mount)
+        self.assertEqual(self._partNumbers(matches, MATCH_CENTERING_RING), ["RA-2050", "CR-2050"])
+        self.assertEqual(self._partNumbers(matches, MATCH_BODY_TUBE), ["BT-20"])
+
+        errors = [match.error for match in matches if match.kind == MATCH_CENTERING_RING]
+        self.assertAlmostEqual(errors[1], 0.0004)
+
+    def testRanking(self):
+        matches = self._matcher.matchComponent(self._body)
+        keys = [(match.kind, match.error) for match in matches]
+        self.assertEqual(keys, sorted(keys))
+
+    def testTolerance(self):
+        matcher = PartMatcher(_Catalogue(), tolerance=0.0001)
+        self.assertEqual(self._partNumbers(matcher.matchComponent(self._body), MATCH_COUPLER), ["C-50"])
+        self.assertEqual(self._partNumbers(matcher.matchComponent(self._mount), MATCH_CENTERING_RING), ["RA-2050"])
+
+        matcher = PartMatcher(_Catalogue(), tolerance=0.001)
+        self.assertEqual(self._partNumbers(matcher.matchComponent(self._body), MATCH_COUPLER), ["C-50", "JT-50", "QC-50"])
+
+    def testLimit(self):
+        matches = self._matcher.matchComponents([self._body, self._mount, self._body], limit=1)
+        self.assertEqual(len(matches), 2)
+        self.assertEqual(self._partNumbers(matches[self._body], MATCH_COUPLER), ["C-50"])
+        self.assertEqual(self._partNumbers(matches[self._mount], MATCH_CENTERING_RING), ["RA-2050"])
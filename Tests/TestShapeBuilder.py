@@ -0,0 +1,117 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for testing building shapes in worker processes"""
+
+__title__ = "FreeCAD Shape Builder Tests"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+import math
+import pickle
+import unittest
+
+from Rocket.Constants import TYPE_VON_KARMAN
+from Rocket.ShapeHandlers.ShapeBuilder import ShapeBuilder, _unpack
+from Rocket.ShapeHandlers.ShapeCache import getShapeCache
+from Rocket.util.ProcessPool import findInterpreter
+
+from Ui.Commands.CmdBodyTube import makeBodyTube, makeInnerTube
+from Ui.Commands.CmdTransition import makeTransition
+
+class ShapeBuilderTests(unittest.TestCase):
+
+    def setUp(self):
+        self.Doc = FreeCAD.newDocument("ShapeBuilderTest")
+        self._cache = getShapeCache()
+        self._cache.clear()
+
+    def tearDown(self):
+        FreeCAD.closeDocument(self.Doc.Name)
+
+    def testCollect(self):
+        first = makeBodyTube('BodyTube')
+        makeBodyTube('BodyTube')
+
+        requests = ShapeBuilder(workers=1).collect(self.Doc.Objects, force=True)
+
+        # Identical components need a single shape, and nothing is drawn while collecting
+        self.assertEqual(len(requests), 1)
+        self.assertTrue(first._obj.Shape.isNull())
+        self.assertEqual(self._cache.getStatistics()["size"], 0)
+
+        # The property values are sent as they are, not as the cache key
+        handlerClass, properties, label = list(requests.values())[0]
+        values = dict(_unpack(pickle.loads(pickle.dumps(properties))))
+        self.assertIsInstance(values["Length"], FreeCAD.Units.Quantity)
+        self.assertAlmostEqual(values["Length"].Value, float(first._obj.Length))
+
+    def testCollectInnerTube(self):
+        feature = makeInnerTube('InnerTube')
+
+        requests = ShapeBuilder(workers=1).collect(self.Doc.Objects, force=True)
+
+        self.assertEqual(len(requests), 1)
+        values = dict(_unpack(pickle.loads(pickle.dumps(list(requests.values())[0][1]))))
+        self.assertEqual(values["ClusterConfiguration"].getClusterCount(),
+                         feature._obj.ClusterConfiguration.getClusterCount())
+
+    def testCollectUnchanged(self):
+        feature = makeTransition('Transition')
+        feature._obj.TransitionType = TYPE_VON_KARMAN
+        feature._obj.Coefficient = 0.3
+
+        # The coefficient is set by the recompute, so the shape is left for it to draw
+        requests = ShapeBuilder(workers=1).collect(self.Doc.Objects, force=True)
+        self.assertEqual(len(requests), 0)
+        self.assertAlmostEqual(float(feature._obj.Coefficient), 0.3)
+
+    def testPool(self):
+        if findInterpreter() is None:
+            self.skipTest("No Python interpreter for the worker processes")
+
+        tubes = []
+        for index in range(6):
+            tube = makeBodyTube('BodyTube')
+            tube._obj.Length = 50.0 + 10.0 * index
+            tubes.append(tube)
+        makeInnerTube('InnerTube')
+
+        builder = ShapeBuilder(workers=2)
+        try:
+            built = builder.prebuild(self.Doc.Objects, force=True)
+        finally:
+            builder.shutdown()
+        self.assertEqual(built, 7)
+        self.assertEqual(self._cache.getStatistics()["size"], 7)
+
+        # The recompute uses the shapes built by the workers
+        self.Doc.recompute()
+        statistics = self._cache.getStatistics()
+        self.assertEqual(statistics["misses"], 0)
+        self.assertGreaterEqual(statistics["hits"], 7)
+
+        for tube in tubes:
+            obj = tube._obj
+            outer = float(obj.Diameter) / 2.0
+            inner = outer - float(obj.Thickness)
+            volume = math.pi * (outer * outer - inner * inner) * float(obj.Length)
+            self.assertAlmostEqual(obj.Shape.Volume, volume, places=3)
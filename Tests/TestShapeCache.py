@@ -0,0 +1,80 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for testing the shape cache"""
+
+__title__ = "FreeCAD Shape Cache Tests"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+import unittest
+
+from Rocket.ShapeHandlers.ShapeCache import getShapeCache
+
+from Ui.Commands.CmdBodyTube import makeBodyTube
+
+class ShapeCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.Doc = FreeCAD.newDocument("ShapeCacheTest")
+        self._cache = getShapeCache()
+        self._cache.clear()
+
+    def tearDown(self):
+        FreeCAD.closeDocument(self.Doc.Name)
+
+    def testShared(self):
+        first = makeBodyTube('BodyTube')
+        second = makeBodyTube('BodyTube')
+        self.Doc.recompute()
+
+        statistics = self._cache.getStatistics()
+        self.assertEqual(statistics["size"], 1)
+        self.assertGreaterEqual(statistics["hits"], 1)
+        self.assertAlmostEqual(first._obj.Shape.Volume, second._obj.Shape.Volume)
+        self.assertTrue(second._obj.Shape.isValid())
+
+    def testPlacement(self):
+        feature = makeBodyTube('BodyTube')
+        self.Doc.recompute()
+        volume = feature._obj.Shape.Volume
+
+        hits = self._cache.getStatistics()["hits"]
+        placement = FreeCAD.Placement(FreeCAD.Vector(10, 0, 0), FreeCAD.Rotation())
+        feature._obj.Placement = placement
+        feature._obj.touch()
+        self.Doc.recompute()
+
+        self.assertEqual(self._cache.getStatistics()["hits"], hits + 1)
+        self.assertAlmostEqual(feature._obj.Shape.Volume, volume)
+        self.assertTrue(feature._obj.Placement.isSame(placement, 1e-7))
+
+    def testChanged(self):
+        feature = makeBodyTube('BodyTube')
+        self.Doc.recompute()
+        volume = feature._obj.Shape.Volume
+        misses = self._cache.getStatistics()["misses"]
+
+        feature._obj.Length = float(feature._obj.Length) * 2.0
+        self.Doc.recompute()
+
+        self.assertEqual(self._cache.getStatistics()["misses"], misses + 1)
+        self.assertAlmostEqual(feature._obj.Shape.Volume, 2.0 * volume, places=3)
@@ -0,0 +1,48 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Functions for measuring test shapes"""
+
+__title__ = "FreeCAD Rocket Tests"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+import Part
+
+VOLUME_SLICES = 16
+
+def measureVolume(shape, slices=VOLUME_SLICES):
+    """ Return the volume and center of gravity along the x axis of a shape in local coordinates """
+    # Shape.Volume integrates each face in one piece, which is too coarse over the long splines
+    # of the nose and transition profiles, so the solid is measured in slices
+    shape = shape.copy()
+    shape.Placement = FreeCAD.Placement()
+    box = shape.BoundBox
+    width = box.XLength / slices
+    volume = 0.0
+    moment = 0.0
+    for slice in range(slices):
+        slab = Part.makeBox(width, box.YLength + 2.0, box.ZLength + 2.0,
+                            FreeCAD.Vector(box.XMin + slice * width, box.YMin - 1.0, box.ZMin - 1.0))
+        for solid in shape.common(slab).Solids:
+            volume += solid.Volume
+            moment += solid.Volume * solid.CenterOfMass.x
+    return volume, moment / volume
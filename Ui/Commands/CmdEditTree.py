@@ -27,17 +27,41 @@ __url__ = "https://www.davesrocketshop.com"
 import FreeCAD
 import FreeCADGui
 
+from contextlib import contextmanager
+
 from Ui.Commands.Command import Command
+from Rocket.Constants import FEATURE_ROCKET
 
 from DraftTools import translate
 
-def moveUp():
+def _selectedRocket():
     for obj in FreeCADGui.Selection.getSelection():
-        obj.Proxy.moveUp()
+        if hasattr(obj, "Proxy") and hasattr(obj.Proxy, "getRoot"):
+            root = obj.Proxy.getRoot()
+            if root.getType() == FEATURE_ROCKET:
+                return root
+    return None
+
+@contextmanager
+def _batch():
+    # Restructure the tree as a single edit, with one repositioning and recompute
+    rocket = _selectedRocket()
+    if rocket is None:
+        yield
+        FreeCAD.ActiveDocument.recompute(None,True,True)
+    else:
+        with rocket.batch():
+            yield
+
+def moveUp():
+    with _batch():
+        for obj in FreeCADGui.Selection.getSelection():
+            obj.Proxy.moveUp()
 
 def moveDown():
-    for obj in FreeCADGui.Selection.getSelection():
-        obj.Proxy.moveDown()
+    with _batch():
+        for obj in FreeCADGui.Selection.getSelection():
+            obj.Proxy.moveDown()
 
 def edit():
     for obj in FreeCADGui.Selection.getSelection():
@@ -56,7 +80,6 @@ class CmdMoveUp(Command):
         FreeCAD.ActiveDocument.openTransaction("Move up")
         FreeCADGui.addModule("Ui.Commands.CmdEditTree")
         FreeCADGui.doCommand("Ui.Commands.CmdEditTree.moveUp()")
-        FreeCADGui.doCommand("App.activeDocument().recompute(None,True,True)")
 
     def IsActive(self):
         if self.partMoveableFeatureSelected():
@@ -73,7 +96,6 @@ class CmdMoveDown(Command):
         FreeCAD.ActiveDocument.openTransaction("Move down")
         FreeCADGui.addModule("Ui.Commands.CmdEditTree")
         FreeCADGui.doCommand("Ui.Commands.CmdEditTree.moveDown()")
-        FreeCADGui.doCommand("App.activeDocument().recompute(None,True,True)")
 
     def IsActive(self):
         if self.partMoveableFeatureSelected():
@@ -26,17 +26,60 @@ __url__ = "https://www.davesrocketshop.com"
     
 import FreeCAD
 import FreeCADGui
+import Part
+import Sketcher
 
 from DraftTools import translate
 
+def _sketchPlacement():
+    # Select the XZ plane for consistency
+    return FreeCAD.Placement(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(1, 0, 0), 90)
+
 def newSketchNoEdit(name='Sketch'):
     obj = FreeCAD.ActiveDocument.addObject("Sketcher::SketchObject", name)
-    # Select the XZ plane for consistency
-    obj.Placement = FreeCAD.Placement(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(1, 0, 0), 90)
+    obj.Placement = _sketchPlacement()
     obj.MapMode = "Deactivated"
 
     return obj
 
+def drawPolygon(sketch, points):
+    """
+        Add a closed polygon through the (x, y) points to the sketch, with each vertex fixed by
+        distance constraints. All of the lines are added in one call and all of the constraints
+        in another, so the solver runs once rather than once for each line and constraint.
+        The sketch is solved again by the next recompute.
+    """
+    geometry = []
+    constraints = []
+    count = len(points)
+    last = points[-1]
+    for index, point in enumerate(points):
+        geometry.append(Part.LineSegment(FreeCAD.Vector(float(last[0]), float(last[1]), 0),
+                                         FreeCAD.Vector(float(point[0]), float(point[1]), 0)))
+        constraints.append(Sketcher.Constraint("DistanceX", index, 2, float(point[0])))
+        constraints.append(Sketcher.Constraint("DistanceY", index, 2, float(point[1])))
+        last = point
+
+    for index in range(count):
+        constraints.append(Sketcher.Constraint("Coincident", (index - 1) % count, 2, index, 1))
+
+    sketch.addGeometry(geometry, False)
+    sketch.addConstraint(constraints)
+    return sketch
+
+def newPolygonNoEdit(points, name='Profile'):
+    """
+        Create a closed polygon through the (x, y) points, in the same plane as a new sketch.
+        There is nothing to solve so its shape is available immediately, but unlike a sketch
+        it can't be edited.
+    """
+    obj = FreeCAD.ActiveDocument.addObject("Part::Feature", name)
+    vectors = [FreeCAD.Vector(float(point[0]), float(point[1]), 0) for point in points]
+    obj.Shape = Part.makePolygon(vectors + vectors[:1])
+    obj.Placement = _sketchPlacement()
+
+    return obj
+
 def newSketch(name='Sketch'):
     obj = newSketchNoEdit(name)
     FreeCADGui.activeDocument().setEdit(obj.Name,0)
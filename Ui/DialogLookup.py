@@ -24,14 +24,11 @@ __title__ = "FreeCAD Database Lookup"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
 
-import sqlite3
-
 import FreeCAD
 
 from DraftTools import translate
 
 from PySide import QtGui, QtCore
-from PySide.QtGui import QStandardItemModel, QStandardItem
 from PySide.QtWidgets import QVBoxLayout, QHBoxLayout
 
 from Rocket.Constants import COMPONENT_TYPE_BODYTUBE, COMPONENT_TYPE_BULKHEAD, COMPONENT_TYPE_CENTERINGRING, \
@@ -40,10 +37,12 @@ from Rocket.Constants import COMPONENT_TYPE_BODYTUBE, COMPONENT_TYPE_BULKHEAD, C
     COMPONENT_TYPE_ANY
 from Rocket.Utilities import _valueWithUnits, _err
 
-from Rocket.Parts.BodyTube import listBodyTubes, getBodyTube
-from Rocket.Parts.NoseCone import listNoseCones, getNoseCone
-from Rocket.Parts.Transition import listTransitions, getTransition
-from Rocket.Parts.RailButton import listRailButton, getRailButton
+from Rocket.Parts.BodyTube import queryBodyTubes, getBodyTube
+from Rocket.Parts.NoseCone import queryNoseCones, getNoseCone
+from Rocket.Parts.Transition import queryTransitions, getTransition
+from Rocket.Parts.RailButton import queryRailButtons, getRailButton
+from Rocket.Parts.Component import hasSearchIndex, hasColumn, addSearchCondition
+from Rocket.Parts.ConnectionManager import getConnectionManager
 
 from Rocket.Parts.Exceptions import MultipleEntryError, NotFoundError
 
@@ -51,6 +50,12 @@ from Rocket.Parts.Exceptions import MultipleEntryError, NotFoundError
 userCancelled   = "Cancelled"
 userOK          = "OK"
 
+# Search after typing pauses for this many milliseconds
+SEARCH_DELAY = 150
+
+# Number of rows read from the database each time the table needs more
+FETCH_SIZE = 256
+
 # Compatible component lookup types
 _compatible = {
     COMPONENT_TYPE_BODYTUBE : (COMPONENT_TYPE_ANY, COMPONENT_TYPE_BODYTUBE, COMPONENT_TYPE_COUPLER, COMPONENT_TYPE_ENGINEBLOCK, COMPONENT_TYPE_LAUNCHLUG,),
@@ -81,12 +86,132 @@ _translated = {
 }
 
 
+class PartColumn:
+    """
+        A column of the part table. The value is read from the row key, formatted with the
+        units in the units key when given. The table is sorted on the orderBy column, which
+        defaults to the key.
+    """
+
+    def __init__(self, header, key, units=None, orderBy=None):
+        self.header = header
+        self.key = key
+        self.units = units
+        self.orderBy = orderBy if orderBy is not None else key
+
+class PartTableModel(QtCore.QAbstractTableModel):
+    """
+        Table of parts read from a database cursor as the view scrolls, instead of loading the
+        whole catalogue. Sorting and searching are done by the database query.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._query = None
+        self._columns = []
+        self._conditions = []
+        self._parameters = {}
+        self._orderBy = None
+        self._cursor = None
+        self._rows = []
+        self._formatted = {}
+
+    def setQuery(self, query, columns):
+        """
+            Set the function query(conditions, parameters, orderBy) that returns an unfetched
+            cursor over the rows, and the columns to show
+        """
+        self.beginResetModel()
+        self._query = query
+        self._columns = columns
+        self._orderBy = None
+        self._formatted = {}
+        self._execute()
+        self.endResetModel()
+
+    def setSearch(self, conditions, parameters):
+        """ Restrict the rows to those meeting the additional query conditions """
+        self.beginResetModel()
+        self._conditions = conditions
+        self._parameters = parameters
+        self._execute()
+        self.endResetModel()
+
+    def _execute(self):
+        self._rows = []
+        self._cursor = None
+        if self._query is not None:
+            self._cursor = self._query(self._conditions, self._parameters, self._orderBy)
+            self._rows = self._fetch()
+
+    def _fetch(self):
+        rows = self._cursor.fetchmany(FETCH_SIZE)
+        if len(rows) < FETCH_SIZE:
+            self._cursor = None
+        return rows
+
+    def getRow(self, row):
+        return self._rows[row]
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._columns)
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self._cursor is not None
+
+    def fetchMore(self, parent):
+        if not self.canFetchMore(parent):
+            return
+        rows = self._fetch()
+        if len(rows) > 0:
+            self.beginInsertRows(QtCore.QModelIndex(), len(self._rows), len(self._rows) + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.DisplayRole:
+            return None
+
+        row = self._rows[index.row()]
+        column = self._columns[index.column()]
+        if column.units is None:
+            return str(row[column.key])
+
+        # Many parts share dimensions so the unit conversions are cached
+        value = (row[column.key], row[column.units])
+        if value not in self._formatted:
+            self._formatted[value] = _valueWithUnits(value[0], value[1])
+        return self._formatted[value]
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self._columns[section].header
+        return None
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        if column < 0 or column >= len(self._columns):
+            return
+
+        direction = "DESC" if order == QtCore.Qt.DescendingOrder else "ASC"
+        self.beginResetModel()
+        self._orderBy = "%s %s" % (self._columns[column].orderBy, direction)
+        self._execute()
+        self.endResetModel()
+
 class DialogLookup(QtGui.QDialog):
     def __init__(self, lookup):
         super().__init__()
 
         self._lookup = lookup
-        self._model = QStandardItemModel() # (4, 4)
+        self._model = PartTableModel()
 
         # self.initSortColumns(lookup)
         self.initUI()
@@ -112,6 +237,11 @@ class DialogLookup(QtGui.QDialog):
         self._searchInput.setMinimumWidth(80)
         self._searchInput.textEdited.connect(self.onSearch)
 
+        self._searchTimer = QtCore.QTimer(self)
+        self._searchTimer.setSingleShot(True)
+        self._searchTimer.setInterval(SEARCH_DELAY)
+        self._searchTimer.timeout.connect(self._search)
+
         lookupTypeLabel = QtGui.QLabel(translate('Rocket', "Component"), self)
 
         self._lookupTypeCombo = QtGui.QComboBox(self)
@@ -161,32 +291,25 @@ class DialogLookup(QtGui.QDialog):
         self.show()
 
     def initDB(self):
-        self._connection = sqlite3.connect("file:" + FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/parts/Parts.db?mode=ro", uri=True)
-        self._connection.row_factory = sqlite3.Row
+        self._connection = getConnectionManager().getConnection()
+        self._hasSearchIndex = hasSearchIndex(self._connection)
+
+        # Dimensions are sorted on their values in metres when the database has them
+        self._hasSIColumns = hasColumn(self._connection, "body_tube", "outer_diameter_m")
         self._updateModel()
 
     def onLookupType(self, value):
         self._updateModel()
 
     def onSearch(self, value):
-        rows = []
-        value = str(value).strip()
-        if len(value) > 0:
-            for column in range(self._model.columnCount()):
-                items = self._model.findItems(value, QtCore.Qt.MatchContains, column)
-                for item in items:
-                    row = item.row()
-                    if not row in rows:
-                        rows.append(row)
-
-            for row in range(self._model.rowCount()):
-                if row in rows:
-                    self._dbTable.showRow(row)
-                else:
-                    self._dbTable.hideRow(row)
-        else:
-            for row in range(self._model.rowCount()):
-                self._dbTable.showRow(row)
+        # Wait for a pause in typing before searching
+        self._searchTimer.start()
+
+    def _search(self):
+        conditions = []
+        parameters = {}
+        addSearchCondition(conditions, parameters, self._searchInput.text(), self._hasSearchIndex)
+        self._model.setSearch(conditions, parameters)
 
     def onTableDoubleClick(self, selected):
         self.result = self._getSelected(selected.row())
@@ -205,13 +328,13 @@ class DialogLookup(QtGui.QDialog):
             self.result = {}
         self.close()
 
-    def _getItemFromRow(self, row):
-        item = self._model.item(row, 0)
-        return item
+    def _getIndexFromRow(self, row):
+        # The first column holds the index for lookups
+        return int(self._model.getRow(row)[0])
 
     def _getSelectedBodyTube(self, row):
         try:
-            index = int(self._getItemFromRow(row).text())
+            index = self._getIndexFromRow(row)
             tube = getBodyTube(self._connection, index)
             return tube
         except NotFoundError:
@@ -222,7 +345,7 @@ class DialogLookup(QtGui.QDialog):
 
     def _getSelectedNose(self, row):
         try:
-            index = int(self._getItemFromRow(row).text())
+            index = self._getIndexFromRow(row)
             cone = getNoseCone(self._connection, index)
             return cone
         except NotFoundError:
@@ -233,7 +356,7 @@ class DialogLookup(QtGui.QDialog):
 
     def _getSelectedTransition(self, row):
         try:
-            index = int(self._getItemFromRow(row).text())
+            index = self._getIndexFromRow(row)
             tran = getTransition(self._connection, index)
             return tran
         except NotFoundError:
@@ -244,7 +367,7 @@ class DialogLookup(QtGui.QDialog):
 
     def _getSelectedRailButton(self, row):
         try:
-            index = int(self._getItemFromRow(row).text())
+            index = self._getIndexFromRow(row)
             button = getRailButton(self._connection, index)
             return button
         except NotFoundError:
@@ -275,161 +398,79 @@ class DialogLookup(QtGui.QDialog):
         #     pass
         return {}
 
-    def _itemWithDimension(self, value, dim):
-        return self._newItem(_valueWithUnits(value, dim))
-
-    def _newItem(self, text):
-        item = QStandardItem(text)
-        item.setEditable(False)
-        return item
+    def _dimension(self, header, key):
+        if self._hasSIColumns:
+            return PartColumn(header, key, key + "_units", key + "_m")
+        return PartColumn(header, key, key + "_units")
 
     def _queryBodyTube(self, queryType):
-        rows = listBodyTubes(self._connection, queryType)
-
-        self._model.setRowCount(len(rows))
-        if queryType == COMPONENT_TYPE_BULKHEAD:
-            self._model.setColumnCount(7)
-        else:
-            self._model.setColumnCount(8)
-        self._dbTable.hideColumn(0) # This holds index for lookups
-        self._dbTable.setVerticalHeader(None)
-
-        # Add the column headers
-        self._model.setHorizontalHeaderItem(1, self._newItem(translate('Rocket', "Type")))
-        self._model.setHorizontalHeaderItem(2, self._newItem(translate('Rocket', "Manufacturer")))
-        self._model.setHorizontalHeaderItem(3, self._newItem(translate('Rocket', "Part Number")))
-        self._model.setHorizontalHeaderItem(4, self._newItem(translate('Rocket', "Description")))
-        self._model.setHorizontalHeaderItem(5, self._newItem(translate('Rocket', "Outer Diameter")))
-        if queryType == COMPONENT_TYPE_BULKHEAD:
-            self._model.setHorizontalHeaderItem(6, self._newItem(translate('Rocket', "Length")))
-        else:
-            self._model.setHorizontalHeaderItem(6, self._newItem(translate('Rocket', "Inner Diameter")))
-            self._model.setHorizontalHeaderItem(7, self._newItem(translate('Rocket', "Length")))
-
-        rowCount = 0
-        for row in rows:
-            self._model.setItem(rowCount, 0, self._newItem(str(row["body_tube_index"])))
-            self._model.setItem(rowCount, 1, self._newItem(str(row["type"])))
-            self._model.setItem(rowCount, 2, self._newItem(str(row["manufacturer"])))
-            self._model.setItem(rowCount, 3, self._newItem(str(row["part_number"])))
-            self._model.setItem(rowCount, 4, self._newItem(str(row["description"])))
-            self._model.setItem(rowCount, 5, self._newItem(self._itemWithDimension(row["outer_diameter"], row["outer_diameter_units"])))
-            if queryType == COMPONENT_TYPE_BULKHEAD:
-                self._model.setItem(rowCount, 6, self._newItem(self._itemWithDimension(row["length"], row["length_units"])))
-            else:
-                self._model.setItem(rowCount, 6, self._newItem(self._itemWithDimension(row["inner_diameter"], row["inner_diameter_units"])))
-                self._model.setItem(rowCount, 7, self._newItem(self._itemWithDimension(row["length"], row["length_units"])))
-
-            rowCount += 1
+        columns = [
+            PartColumn("", "body_tube_index"), # This holds index for lookups
+            PartColumn(translate('Rocket', "Type"), "type"),
+            PartColumn(translate('Rocket', "Manufacturer"), "manufacturer"),
+            PartColumn(translate('Rocket', "Part Number"), "part_number"),
+            PartColumn(translate('Rocket', "Description"), "description"),
+            self._dimension(translate('Rocket', "Outer Diameter"), "outer_diameter")
+        ]
+        if queryType != COMPONENT_TYPE_BULKHEAD:
+            columns.append(self._dimension(translate('Rocket', "Inner Diameter"), "inner_diameter"))
+        columns.append(self._dimension(translate('Rocket', "Length"), "length"))
+
+        self._model.setQuery(lambda conditions, parameters, orderBy:
+                                queryBodyTubes(self._connection, queryType, conditions, parameters, orderBy), columns)
 
     def _queryNoseCone(self):
-        rows = listNoseCones(self._connection)
-
-        self._model.setRowCount(len(rows))
-        self._model.setColumnCount(9)
-        self._dbTable.hideColumn(0) # This holds index for lookups
-        self._dbTable.setVerticalHeader(None)
-
-        # Add the column headers
-        self._model.setHorizontalHeaderItem(1, self._newItem(translate('Rocket', "Manufacturer")))
-        self._model.setHorizontalHeaderItem(2, self._newItem(translate('Rocket', "Part Number")))
-        self._model.setHorizontalHeaderItem(3, self._newItem(translate('Rocket', "Description")))
-        self._model.setHorizontalHeaderItem(4, self._newItem(translate('Rocket', "Shape")))
-        self._model.setHorizontalHeaderItem(5, self._newItem(translate('Rocket', "Diameter")))
-        self._model.setHorizontalHeaderItem(6, self._newItem(translate('Rocket', "Length")))
-        self._model.setHorizontalHeaderItem(7, self._newItem(translate('Rocket', "Shoulder Diameter")))
-        self._model.setHorizontalHeaderItem(8, self._newItem(translate('Rocket', "Shoulder Length")))
-
-        rowCount = 0
-        for row in rows:
-            self._model.setItem(rowCount, 0, self._newItem(str(row["nose_index"])))
-            self._model.setItem(rowCount, 1, self._newItem(str(row["manufacturer"])))
-            self._model.setItem(rowCount, 2, self._newItem(str(row["part_number"])))
-            self._model.setItem(rowCount, 3, self._newItem(str(row["description"])))
-            self._model.setItem(rowCount, 4, self._newItem(str(row["shape"])))
-            self._model.setItem(rowCount, 5, self._newItem(self._itemWithDimension(row["diameter"], row["diameter_units"])))
-            self._model.setItem(rowCount, 6, self._newItem(self._itemWithDimension(row["length"], row["length_units"])))
-            self._model.setItem(rowCount, 7, self._newItem(self._itemWithDimension(row["shoulder_diameter"], row["shoulder_diameter_units"])))
-            self._model.setItem(rowCount, 8, self._newItem(self._itemWithDimension(row["shoulder_length"], row["shoulder_length_units"])))
-
-            rowCount += 1
+        columns = [
+            PartColumn("", "nose_index"), # This holds index for lookups
+            PartColumn(translate('Rocket', "Manufacturer"), "manufacturer"),
+            PartColumn(translate('Rocket', "Part Number"), "part_number"),
+            PartColumn(translate('Rocket', "Description"), "description"),
+            PartColumn(translate('Rocket', "Shape"), "shape"),
+            self._dimension(translate('Rocket', "Diameter"), "diameter"),
+            self._dimension(translate('Rocket', "Length"), "length"),
+            self._dimension(translate('Rocket', "Shoulder Diameter"), "shoulder_diameter"),
+            self._dimension(translate('Rocket', "Shoulder Length"), "shoulder_length")
+        ]
+
+        self._model.setQuery(lambda conditions, parameters, orderBy:
+                                queryNoseCones(self._connection, conditions, parameters, orderBy), columns)
 
     def _queryTransition(self):
-        rows = listTransitions(self._connection)
-
-        self._model.setRowCount(len(rows))
-        self._model.setColumnCount(12)
-        self._dbTable.hideColumn(0) # This holds index for lookups
-        self._dbTable.setVerticalHeader(None)
-
-        # Add the column headers
-        self._model.setHorizontalHeaderItem(1, self._newItem(translate('Rocket', "Manufacturer")))
-        self._model.setHorizontalHeaderItem(2, self._newItem(translate('Rocket', "Part Number")))
-        self._model.setHorizontalHeaderItem(3, self._newItem(translate('Rocket', "Description")))
-        self._model.setHorizontalHeaderItem(4, self._newItem(translate('Rocket', "Shape")))
-        self._model.setHorizontalHeaderItem(5, self._newItem(translate('Rocket', "Fore Diameter")))
-        self._model.setHorizontalHeaderItem(6, self._newItem(translate('Rocket', "Aft Diameter")))
-        self._model.setHorizontalHeaderItem(7, self._newItem(translate('Rocket', "Length")))
-        self._model.setHorizontalHeaderItem(8, self._newItem(translate('Rocket', "Fore Shoulder Diameter")))
-        self._model.setHorizontalHeaderItem(9, self._newItem(translate('Rocket', "Fore Shoulder Length")))
-        self._model.setHorizontalHeaderItem(10, self._newItem(translate('Rocket', "Aft Shoulder Diameter")))
-        self._model.setHorizontalHeaderItem(11, self._newItem(translate('Rocket', "Aft Shoulder Length")))
-
-        rowCount = 0
-        for row in rows:
-            self._model.setItem(rowCount, 0, self._newItem(str(row["transition_index"])))
-            self._model.setItem(rowCount, 1, self._newItem(str(row["manufacturer"])))
-            self._model.setItem(rowCount, 2, self._newItem(str(row["part_number"])))
-            self._model.setItem(rowCount, 3, self._newItem(str(row["description"])))
-            self._model.setItem(rowCount, 4, self._newItem(str(row["shape"])))
-            self._model.setItem(rowCount, 5, self._newItem(self._itemWithDimension(row["fore_outside_diameter"], row["fore_outside_diameter_units"])))
-            self._model.setItem(rowCount, 6, self._newItem(self._itemWithDimension(row["aft_outside_diameter"], row["aft_outside_diameter_units"])))
-            self._model.setItem(rowCount, 7, self._newItem(self._itemWithDimension(row["length"], row["length_units"])))
-            self._model.setItem(rowCount, 8, self._newItem(self._itemWithDimension(row["fore_shoulder_diameter"], row["fore_shoulder_diameter_units"])))
-            self._model.setItem(rowCount, 9, self._newItem(self._itemWithDimension(row["fore_shoulder_length"], row["fore_shoulder_length_units"])))
-            self._model.setItem(rowCount, 10, self._newItem(self._itemWithDimension(row["aft_shoulder_diameter"], row["aft_shoulder_diameter_units"])))
-            self._model.setItem(rowCount, 11, self._newItem(self._itemWithDimension(row["aft_shoulder_length"], row["aft_shoulder_length_units"])))
-
-            rowCount += 1
+        columns = [
+            PartColumn("", "transition_index"), # This holds index for lookups
+            PartColumn(translate('Rocket', "Manufacturer"), "manufacturer"),
+            PartColumn(translate('Rocket', "Part Number"), "part_number"),
+            PartColumn(translate('Rocket', "Description"), "description"),
+            PartColumn(translate('Rocket', "Shape"), "shape"),
+            self._dimension(translate('Rocket', "Fore Diameter"), "fore_outside_diameter"),
+            self._dimension(translate('Rocket', "Aft Diameter"), "aft_outside_diameter"),
+            self._dimension(translate('Rocket', "Length"), "length"),
+            self._dimension(translate('Rocket', "Fore Shoulder Diameter"), "fore_shoulder_diameter"),
+            PartColumn(translate('Rocket', "Fore Shoulder Length"), "fore_shoulder_length", "fore_shoulder_length_units"),
+            self._dimension(translate('Rocket', "Aft Shoulder Diameter"), "aft_shoulder_diameter"),
+            PartColumn(translate('Rocket', "Aft Shoulder Length"), "aft_shoulder_length", "aft_shoulder_length_units")
+        ]
+
+        self._model.setQuery(lambda conditions, parameters, orderBy:
+                                queryTransitions(self._connection, conditions, parameters, orderBy), columns)
 
     def _queryRailButton(self):
-        rows = listRailButton(self._connection)
-
-        self._model.setRowCount(len(rows))
-        self._model.setColumnCount(11)
-        self._dbTable.hideColumn(0) # This holds index for lookups
-        self._dbTable.setVerticalHeader(None)
-
-        # Add the column headers
-        self._model.setHorizontalHeaderItem(1, self._newItem(translate('Rocket', "Manufacturer")))
-        self._model.setHorizontalHeaderItem(2, self._newItem(translate('Rocket', "Part Number")))
-        self._model.setHorizontalHeaderItem(3, self._newItem(translate('Rocket', "Description")))
-        self._model.setHorizontalHeaderItem(4, self._newItem(translate('Rocket', "Finish")))
-        self._model.setHorizontalHeaderItem(5, self._newItem(translate('Rocket', "Outer Diameter")))
-        self._model.setHorizontalHeaderItem(6, self._newItem(translate('Rocket', "Inner Diameter")))
-        self._model.setHorizontalHeaderItem(7, self._newItem(translate('Rocket', "Height")))
-        self._model.setHorizontalHeaderItem(8, self._newItem(translate('Rocket', "Base Height")))
-        self._model.setHorizontalHeaderItem(9, self._newItem(translate('Rocket', "Flange Height")))
-        self._model.setHorizontalHeaderItem(10, self._newItem(translate('Rocket', "Screw Height")))
-        # self._model.setHorizontalHeaderItem(11, self._newItem(translate('Rocket', "Drag Coeeficient")))
-        # self._model.setHorizontalHeaderItem(12, self._newItem(translate('Rocket', "Screw Mass")))
-        # self._model.setHorizontalHeaderItem(13, self._newItem(translate('Rocket', "Nut Mass")))
-
-        rowCount = 0
-        for row in rows:
-            self._model.setItem(rowCount, 0, self._newItem(str(row["rail_button_index"])))
-            self._model.setItem(rowCount, 1, self._newItem(str(row["manufacturer"])))
-            self._model.setItem(rowCount, 2, self._newItem(str(row["part_number"])))
-            self._model.setItem(rowCount, 3, self._newItem(str(row["description"])))
-            self._model.setItem(rowCount, 4, self._newItem(str(row["finish"])))
-            self._model.setItem(rowCount, 5, self._newItem(self._itemWithDimension(row["outer_diameter"], row["outer_diameter_units"])))
-            self._model.setItem(rowCount, 6, self._newItem(self._itemWithDimension(row["inner_diameter"], row["inner_diameter_units"])))
-            self._model.setItem(rowCount, 7, self._newItem(self._itemWithDimension(row["height"], row["height_units"])))
-            self._model.setItem(rowCount, 8, self._newItem(self._itemWithDimension(row["base_height"], row["base_height_units"])))
-            self._model.setItem(rowCount, 9, self._newItem(self._itemWithDimension(row["flange_height"], row["flange_height_units"])))
-            self._model.setItem(rowCount, 10, self._newItem(self._itemWithDimension(row["screw_height"], row["screw_height_units"])))
-
-            rowCount += 1
+        columns = [
+            PartColumn("", "rail_button_index"), # This holds index for lookups
+            PartColumn(translate('Rocket', "Manufacturer"), "manufacturer"),
+            PartColumn(translate('Rocket', "Part Number"), "part_number"),
+            PartColumn(translate('Rocket', "Description"), "description"),
+            PartColumn(translate('Rocket', "Finish"), "finish"),
+            self._dimension(translate('Rocket', "Outer Diameter"), "outer_diameter"),
+            self._dimension(translate('Rocket', "Inner Diameter"), "inner_diameter"),
+            self._dimension(translate('Rocket', "Height"), "height"),
+            PartColumn(translate('Rocket', "Base Height"), "base_height", "base_height_units"),
+            PartColumn(translate('Rocket', "Flange Height"), "flange_height", "flange_height_units"),
+            PartColumn(translate('Rocket', "Screw Height"), "screw_height", "screw_height_units")
+        ]
+
+        self._model.setQuery(lambda conditions, parameters, orderBy:
+                                queryRailButtons(self._connection, conditions, parameters, orderBy), columns)
 
     def _updateModel(self):
         queryType = str(self._lookupTypeCombo.currentData())
@@ -452,6 +493,9 @@ class DialogLookup(QtGui.QDialog):
         # elif query == COMPONENT_TYPE_STREAMER:
         #     pass
 
+        self._dbTable.hideColumn(0) # This holds index for lookups
+        self._dbTable.setVerticalHeader(None)
+
     def update(self):
         # Update the SQL query
         pass
@@ -24,8 +24,6 @@ __title__ = "FreeCAD Database Lookup"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
 
-import sqlite3
-
 import FreeCAD
 
 from DraftTools import translate
@@ -37,6 +35,7 @@ from PySide.QtWidgets import QVBoxLayout, QHBoxLayout
 from Rocket.Utilities import _valueWithUnits
 
 from Rocket.Parts.Material import listMaterials
+from Rocket.Parts.ConnectionManager import getConnectionManager
 
 # Constant definitions
 userCancelled   = "Cancelled"
@@ -112,8 +111,7 @@ class DialogMaterialMapping(QtGui.QDialog):
         self.show()
 
     def initDB(self):
-        self._connection = sqlite3.connect("file:" + FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/parts/Parts.db?mode=ro", uri=True)
-        self._connection.row_factory = sqlite3.Row
+        self._connection = getConnectionManager().getConnection()
         self._updateModel()
 
     # def onLookupType(self, value):
@@ -361,8 +361,8 @@ class TaskPanelBodyTube:
 
     def clicked(self,button):
         if button == QtGui.QDialogButtonBox.Apply:
-            self.transferTo()
-            self._obj.Proxy.execute(self._obj)
+            with self._obj.Proxy.batch():
+                self.transferTo()
 
     def update(self):
         'fills the widgets'
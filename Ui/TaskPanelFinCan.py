@@ -27,8 +27,6 @@ __url__ = "https://www.davesrocketshop.com"
 
 import FreeCAD
 import FreeCADGui
-import Part
-import Sketcher
 
 from PySide import QtGui, QtCore
 from PySide.QtCore import QObject, Signal
@@ -50,7 +48,7 @@ from Rocket.Material import Material
 from Rocket.Utilities import _err, _toFloat
 
 from Ui.TaskPanelLocation import TaskPanelLocation
-from Ui.Commands.CmdSketcher import newSketchNoEdit
+from Ui.Commands.CmdSketcher import newSketchNoEdit, drawPolygon
 
 from Ui.Widgets.MaterialTab import MaterialTab
 from Ui.Widgets.CommentTab import CommentTab
@@ -1058,24 +1056,6 @@ class TaskPanelFinCan(QObject):
         # Create a default sketch if none exists
         self._defaultFinSketch()
 
-    def _drawLines(self, sketch, points):
-        last = points[-1]
-        for index, point in enumerate(points):
-            sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(float(last[0]), float(last[1]), 0),
-                                                        FreeCAD.Vector(float(point[0]), float(point[1]), 0)))
-            sketch.addConstraint(Sketcher.Constraint("DistanceX", index, 2, point[0]))
-            sketch.addConstraint(Sketcher.Constraint("DistanceY", index, 2, point[1]))
-            last = point
-
-        count = len(points)
-        for index in range(count):
-            if index == 0:
-                sketch.addConstraint(Sketcher.Constraint("Coincident", count-1, 2, index, 1))
-            else:
-                sketch.addConstraint(Sketcher.Constraint("Coincident", index-1, 2, index, 1))
-
-        return sketch
-
     def _defaultFinSketch(self):
         if self._obj.Profile is None:
             sketch = newSketchNoEdit()
@@ -1085,7 +1065,7 @@ class TaskPanelFinCan(QObject):
             points.append((float(self._obj.SweepLength) + float(self._obj.TipChord), float(self._obj.Height)))
             points.append((float(self._obj.SweepLength), float(self._obj.Height)))
 
-            sketch = self._drawLines(sketch, points)
+            sketch = drawPolygon(sketch, points)
             FreeCAD.ActiveDocument.recompute([sketch]) # Compute the sketch
             self._obj.Profile = sketch
             sketch.Visibility = False
@@ -1693,8 +1673,8 @@ class TaskPanelFinCan(QObject):
 
     def clicked(self,button):
         if button == QtGui.QDialogButtonBox.Apply:
-            self.transferTo()
-            self.redraw()
+            with self._obj.Proxy.batch():
+                self.transferTo()
 
     def update(self):
         'fills the widgets'
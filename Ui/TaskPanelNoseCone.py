@@ -639,8 +639,8 @@ class TaskPanelNoseCone:
 
     def clicked(self,button):
         if button == QtGui.QDialogButtonBox.Apply:
-            self.transferTo()
-            self._obj.Proxy.execute(self._obj)
+            with self._obj.Proxy.batch():
+                self.transferTo()
 
     def update(self):
         'fills the widgets'
@@ -25,6 +25,9 @@ __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
 from Rocket.Parts.PartDatabase import PartDatabase
+from Rocket.Parts.DatabaseExport import DatabaseExport
 
-db = PartDatabase(".") # Current directory is the root directory
-db.updateDatabase()
+# The guard stops the worker processes, which import this module, from starting a build
+if __name__ == "__main__":
+    db = PartDatabase(".") # Current directory is the root directory
+    db.updateDatabase(export=DatabaseExport(dump="dump.sql"))